@@ -82,7 +82,10 @@ async def startup_sequence(config_path: str = "config.json") -> None:
         logger.info("Generating embeddings for %d tools", tool_count)
         all_tools = discovery_manager.get_all_tools()
         await embedding_engine.generate_tool_embeddings(all_tools)
-        search_engine.set_tools(all_tools)
+        # Re-read the catalog: with a tool cache (loading.tool_cache_path), a background
+        # refresh may have replaced cached tools with live (already embedded) ones meanwhile.
+        # The list is copied because the engine extends its catalog on lazy loads.
+        search_engine.set_tools(list(discovery_manager.get_all_tools()))
         log_with_metadata(
             logger,
             logging.INFO,
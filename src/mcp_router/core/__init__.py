@@ -1,13 +1,15 @@
 """Core data models and schemas for MCP Semantic Router."""
 
 from .config import RouterConfig, UpstreamConfig
-from .config_parser import load_config, parse_config, ConfigurationError
+from .config_parser import load_config, parse_config, parse_config_fast, ConfigurationError
 from .models import (
+    EMPTY_OBJECT_SCHEMA,
     JSONSchema,
     ToolMetadata,
     ContentItem,
     ToolCallResult,
     SearchResult,
+    UpstreamToolIndex,
 )
 from .namespace import (
     generate_tool_namespace,
@@ -26,12 +28,15 @@ __all__ = [
     'UpstreamConfig',
     'load_config',
     'parse_config',
+    'parse_config_fast',
     'ConfigurationError',
+    'EMPTY_OBJECT_SCHEMA',
     'JSONSchema',
     'ToolMetadata',
     'ContentItem',
     'ToolCallResult',
     'SearchResult',
+    'UpstreamToolIndex',
     'generate_tool_namespace',
     'parse_tool_namespace',
     'match_upstream_by_prefix',
@@ -4,11 +4,22 @@ Configuration schemas for MCP Semantic Router.
 This module defines the configuration dataclasses for upstream MCP servers
 and the router itself.
 """
+import dataclasses
+import re
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional
+from typing import Any, List, Literal, Optional, TypeVar
 
 
-@dataclass
+# Alphanumerics, whitespace, hyphens and underscores (\w is str.isalnum() plus '_')
+_ALIAS_RE = re.compile(r"[\w\s-]+")
+
+_ConfigT = TypeVar('_ConfigT')
+
+# Numeric LoadingConfig fields that must be > 0, checked in declaration order
+_POSITIVE_FIELDS = ('connection_timeout', 'max_concurrent_upstreams', 'rate_limit')
+
+
+@dataclass(slots=True, frozen=True)
 class LoadingConfig:
     """Configuration for dynamic upstream loading behavior.
     
@@ -20,6 +31,9 @@ class LoadingConfig:
         connection_timeout: Timeout in seconds for upstream connections
         max_concurrent_upstreams: Maximum number of upstreams that can be loaded simultaneously
         rate_limit: Maximum number of load/unload operations per second
+        tool_cache_path: Optional JSON file for a snapshot of the tool catalog. With
+                         cache_embeddings, startup serves the snapshot while the
+                         upstreams are refreshed in the background
     """
     auto_load: List[str] = field(default_factory=lambda: ["all"])
     lazy_load: bool = True
@@ -27,20 +41,20 @@ class LoadingConfig:
     connection_timeout: int = 30
     max_concurrent_upstreams: int = 10
     rate_limit: int = 5
+    tool_cache_path: Optional[str] = None
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        if self.connection_timeout <= 0:
-            raise ValueError("connection_timeout must be positive")
-        if self.max_concurrent_upstreams <= 0:
-            raise ValueError("max_concurrent_upstreams must be positive")
-        if self.rate_limit <= 0:
-            raise ValueError("rate_limit must be positive")
+        for name in _POSITIVE_FIELDS:
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
         if not isinstance(self.auto_load, list):
             raise ValueError("auto_load must be a list")
+        if self.tool_cache_path is not None and not isinstance(self.tool_cache_path, str):
+            raise ValueError("tool_cache_path must be a string")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpstreamConfig:
     """Configuration for an upstream MCP server.
     
@@ -67,7 +81,8 @@ class UpstreamConfig:
             if not self.command:
                 raise ValueError("command is required for stdio transport")
             if self.args is None:
-                self.args = []
+                # Frozen dataclass: bypass __setattr__ to normalize the default
+                object.__setattr__(self, 'args', [])
         elif self.transport in ('sse', 'http'):
             if not self.url:
                 raise ValueError(f"url is required for {self.transport} transport")
@@ -76,14 +91,14 @@ class UpstreamConfig:
         for alias in self.aliases:
             if not alias:
                 raise ValueError("Alias cannot be empty")
-            if not all(c.isalnum() or c.isspace() or c == '-' or c == '_' for c in alias):
+            if not _ALIAS_RE.fullmatch(alias):
                 raise ValueError(
                     f"Invalid alias '{alias}': aliases must contain only "
                     f"alphanumeric characters, spaces, hyphens, and underscores"
                 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouterConfig:
     """Router configuration with upstream MCP servers.
     
@@ -98,3 +113,37 @@ class RouterConfig:
         """Validate configuration after initialization."""
         if not self.mcp_servers:
             raise ValueError("At least one upstream MCP server must be configured")
+
+
+def construct_unvalidated(cls: type[_ConfigT], **values: Any) -> _ConfigT:
+    """
+    Build a configuration dataclass without running __post_init__ validation.
+    
+    Missing fields take their declared defaults. Only use this for data that is
+    already known to be valid (e.g. a configuration that was parsed before).
+    
+    Args:
+        cls: Configuration dataclass to instantiate
+        **values: Field values
+        
+    Returns:
+        Instance of cls with the given field values
+        
+    Raises:
+        TypeError: If a field without default is missing or an unknown field is given
+    """
+    instance = object.__new__(cls)
+    for f in dataclasses.fields(cls):  # type: ignore[arg-type]
+        if f.name in values:
+            value = values.pop(f.name)
+        elif f.default is not dataclasses.MISSING:
+            value = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            value = f.default_factory()
+        else:
+            raise TypeError(f"{cls.__name__} missing required field '{f.name}'")
+        # Frozen dataclass: bypass __setattr__
+        object.__setattr__(instance, f.name, value)
+    if values:
+        raise TypeError(f"{cls.__name__} got unexpected fields: {', '.join(values)}")
+    return instance
@@ -3,11 +3,22 @@ Configuration file parser for MCP Semantic Router.
 
 This module handles reading and parsing JSON configuration files.
 """
+import dataclasses
+import functools
 import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Hashable
 
-from mcp_router.core.config import LoadingConfig, RouterConfig, UpstreamConfig
+from mcp_router.core.config import (
+    LoadingConfig,
+    RouterConfig,
+    UpstreamConfig,
+    construct_unvalidated,
+)
+
+
+_LOADING_FIELDS = frozenset(f.name for f in dataclasses.fields(LoadingConfig))
 
 
 class ConfigurationError(Exception):
@@ -50,12 +61,22 @@ def load_config(config_path: str | Path) -> RouterConfig:
         raise ConfigurationError(f"Invalid configuration structure: {e}")
 
 
-def parse_config(config_dict: dict[str, Any]) -> RouterConfig:
+def parse_config(config_dict: dict[str, Any], validate: bool = True) -> RouterConfig:
     """
     Parse configuration dictionary into RouterConfig object.
     
+    Validated results are memoized on a canonical (hashable) form of the
+    dictionary, so re-parsing an unchanged configuration (e.g. on reload) skips
+    validation. Each call returns its own copy of the list and dict fields, so a
+    caller mutating its config does not affect later parses.
+    
+    With validate=False the structural checks and the dataclass validation
+    (transport, alias and range checks) are skipped entirely. Only use this for
+    configurations that are already known to be valid; see parse_config_fast().
+    
     Args:
         config_dict: Configuration dictionary from JSON
+        validate: Whether to validate the configuration
         
     Returns:
         Parsed RouterConfig object
@@ -65,43 +86,158 @@ def parse_config(config_dict: dict[str, Any]) -> RouterConfig:
         KeyError: If required fields are missing
         TypeError: If field types are incorrect
     """
+    if not validate:
+        # Not cached: unvalidated results must never be served to validating callers
+        return _parse_config_impl(config_dict, validate=False)
+    
+    try:
+        frozen = _freeze(config_dict)
+    except TypeError:
+        # Contains unhashable values that are not JSON containers - parse uncached
+        return _parse_config_impl(config_dict)
+    
+    return _copy_config(_parse_frozen_config(frozen))
+
+
+def parse_config_fast(config_dict: dict[str, Any]) -> RouterConfig:
+    """
+    Parse a configuration dictionary that is already known to be valid.
+    
+    Equivalent to parse_config(config_dict, validate=False).
+    
+    Args:
+        config_dict: Previously validated configuration dictionary
+        
+    Returns:
+        Parsed RouterConfig object
+    """
+    return parse_config(config_dict, validate=False)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a JSON-like value into a hashable canonical form.
+    
+    Dicts keep their key order (upstream order is significant) and scalars are
+    tagged with their type so that e.g. True and 1 produce different keys.
+    
+    Raises:
+        TypeError: If the value contains something unhashable
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw(frozen: Any) -> Any:
+    """Rebuild the original value from the output of _freeze()."""
+    kind, payload = frozen
+    if kind is dict:
+        return {key: _thaw(item) for key, item in payload}
+    if kind is list:
+        return [_thaw(item) for item in payload]
+    return payload
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_frozen_config(frozen: Hashable) -> RouterConfig:
+    """Parse a frozen configuration; the result is shared and must not be mutated."""
+    return _parse_config_impl(_thaw(frozen))
+
+
+def _copy_config(config: RouterConfig) -> RouterConfig:
+    """
+    Copy a validated RouterConfig for a caller.
+    
+    Cheaper than copy.deepcopy(): the dataclasses are frozen and their lists only
+    hold strings, so only the mcp_servers dict and the list fields are duplicated.
+    """
+    return construct_unvalidated(
+        RouterConfig,
+        mcp_servers={
+            upstream_id: _copy_lists(upstream)
+            for upstream_id, upstream in config.mcp_servers.items()
+        },
+        loading=_copy_lists(config.loading)
+    )
+
+
+def _copy_lists(instance: Any) -> Any:
+    """Copy a frozen config dataclass with fresh copies of its list fields."""
+    values = {}
+    for f in dataclasses.fields(instance):
+        value = getattr(instance, f.name)
+        values[f.name] = list(value) if isinstance(value, list) else value
+    return construct_unvalidated(type(instance), **values)
+
+
+def _parse_config_impl(config_dict: dict[str, Any], validate: bool = True) -> RouterConfig:
+    """Parse a configuration dictionary without memoization (see parse_config)."""
     # Extract mcpServers section
     if 'mcpServers' not in config_dict:
         raise KeyError("Configuration must contain 'mcpServers' key")
     
     mcp_servers_dict = config_dict['mcpServers']
     
-    if not isinstance(mcp_servers_dict, dict):
-        raise TypeError("'mcpServers' must be a dictionary")
-    
-    if not mcp_servers_dict:
-        raise ValueError("'mcpServers' must contain at least one server")
+    if validate:
+        if not isinstance(mcp_servers_dict, dict):
+            raise TypeError("'mcpServers' must be a dictionary")
+        
+        if not mcp_servers_dict:
+            raise ValueError("'mcpServers' must contain at least one server")
     
     # Parse loading configuration (optional, use defaults if missing)
     loading_config = LoadingConfig()
     if 'loading' in config_dict:
         loading_dict = config_dict['loading']
-        if not isinstance(loading_dict, dict):
+        if validate and not isinstance(loading_dict, dict):
             raise TypeError("'loading' must be a dictionary")
         
-        loading_config = LoadingConfig(
-            auto_load=loading_dict.get('auto_load', ["all"]),
-            lazy_load=loading_dict.get('lazy_load', True),
-            cache_embeddings=loading_dict.get('cache_embeddings', True),
-            connection_timeout=loading_dict.get('connection_timeout', 30),
-            max_concurrent_upstreams=loading_dict.get('max_concurrent_upstreams', 10),
-            rate_limit=loading_dict.get('rate_limit', 5)
-        )
+        # Missing fields fall back to the LoadingConfig defaults; unknown keys are ignored
+        loading_fields = {
+            key: value for key, value in loading_dict.items() if key in _LOADING_FIELDS
+        }
+        if isinstance(loading_fields.get('auto_load'), list):
+            loading_fields['auto_load'] = [_intern(name) for name in loading_fields['auto_load']]
+        loading_config = _build(LoadingConfig, validate, **loading_fields)
     
     # Parse each upstream configuration
-    mcp_servers: dict[str, UpstreamConfig] = {}
+    mcp_servers = {
+        _intern(upstream_id): _parse_upstream(upstream_id, upstream_dict, validate)
+        for upstream_id, upstream_dict in mcp_servers_dict.items()
+    }
+    
+    return _build(RouterConfig, validate, mcp_servers=mcp_servers, loading=loading_config)
+
+
+def _parse_upstream(upstream_id: str, upstream_dict: Any, validate: bool = True) -> UpstreamConfig:
+    """
+    Parse and validate a single upstream entry of the mcpServers section.
     
-    for upstream_id, upstream_dict in mcp_servers_dict.items():
-        if not isinstance(upstream_dict, dict):
-            raise TypeError(f"Configuration for '{upstream_id}' must be a dictionary")
+    Args:
+        upstream_id: Upstream identifier (used in error messages)
+        upstream_dict: Raw configuration for the upstream
+        validate: Whether to validate the entry (see parse_config)
+        
+    Returns:
+        Validated UpstreamConfig
         
-        # Extract required and optional fields
-        transport = upstream_dict.get('transport')
+    Raises:
+        ValueError: If the transport or any field value is invalid
+        TypeError: If the entry or its aliases have the wrong type
+    """
+    if validate and not isinstance(upstream_dict, dict):
+        raise TypeError(f"Configuration for '{upstream_id}' must be a dictionary")
+    
+    # Extract required and optional fields
+    transport = upstream_dict.get('transport')
+    aliases = upstream_dict.get('aliases', [])
+    args = upstream_dict.get('args')
+    
+    if validate:
         if not transport:
             raise ValueError(f"'transport' is required for upstream '{upstream_id}'")
         
@@ -111,22 +247,31 @@ def parse_config(config_dict: dict[str, Any]) -> RouterConfig:
                 f"Must be 'stdio', 'sse', or 'http'"
             )
         
-        # Parse aliases (optional)
-        aliases = upstream_dict.get('aliases', [])
         if not isinstance(aliases, list):
             raise TypeError(f"'aliases' for upstream '{upstream_id}' must be a list")
-        
-        # Create UpstreamConfig (validation happens in __post_init__)
-        upstream_config = UpstreamConfig(
-            transport=transport,  # type: ignore
-            command=upstream_dict.get('command'),
-            args=upstream_dict.get('args'),
-            url=upstream_dict.get('url'),
-            semantic_prefix=upstream_dict.get('semantic_prefix'),
-            category_description=upstream_dict.get('category_description'),
-            aliases=aliases
-        )
-        
-        mcp_servers[upstream_id] = upstream_config
+    elif transport == 'stdio' and args is None:
+        # Mirror the normalization UpstreamConfig.__post_init__ would have done
+        args = []
     
-    return RouterConfig(mcp_servers=mcp_servers, loading=loading_config)
+    # Validation of the field values happens in __post_init__
+    return _build(
+        UpstreamConfig,
+        validate,
+        transport=sys.intern(transport),
+        command=upstream_dict.get('command'),
+        args=args,
+        url=upstream_dict.get('url'),
+        semantic_prefix=upstream_dict.get('semantic_prefix'),
+        category_description=upstream_dict.get('category_description'),
+        aliases=[_intern(alias) for alias in aliases]
+    )
+
+
+def _build(cls: type[Any], validate: bool, **values: Any) -> Any:
+    """Instantiate a config dataclass, skipping __post_init__ unless validating."""
+    return cls(**values) if validate else construct_unvalidated(cls, **values)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so identifiers repeated across configs and tools share one object."""
+    return sys.intern(value) if type(value) is str else value
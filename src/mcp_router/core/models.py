@@ -3,17 +3,21 @@ Tool metadata and schema models for MCP Semantic Router.
 
 This module defines the data models for tools discovered from upstream MCP servers.
 """
+import functools
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Optional
 import numpy as np
 import numpy.typing as npt
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JSONSchema:
     """JSON schema for tool input parameters.
     
-    Supports common JSON Schema fields used by MCP servers.
+    Supports common JSON Schema fields used by MCP servers. Instances are
+    immutable so identical schemas can be shared (see EMPTY_OBJECT_SCHEMA).
     
     Attributes:
         type: Schema type (e.g., 'object', 'string', 'number')
@@ -69,6 +73,19 @@ class JSONSchema:
         
         return result
     
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def of_type(cls, type_: str) -> 'JSONSchema':
+        """Get the shared schema with only a type and no other content.
+        
+        Args:
+            type_: Schema type (e.g., 'object')
+            
+        Returns:
+            Shared JSONSchema instance for that type
+        """
+        return cls(type=type_)
+    
     @classmethod
     def from_dict(cls, schema_dict: dict[str, Any]) -> 'JSONSchema':
         """Create JSONSchema from dictionary.
@@ -81,8 +98,12 @@ class JSONSchema:
         Returns:
             JSONSchema instance
         """
-        # Extract known fields with camelCase to snake_case conversion
+        # Schemas with no content beyond their type share one instance per type
         type_val = schema_dict.get('type', 'object')
+        if schema_dict.keys() <= {'type'} and isinstance(type_val, str):
+            return cls.of_type(type_val)
+        
+        # Extract known fields with camelCase to snake_case conversion
         properties = schema_dict.get('properties')
         required = schema_dict.get('required')
         additional_properties = schema_dict.get('additionalProperties')
@@ -114,7 +135,11 @@ class JSONSchema:
         )
 
 
-@dataclass
+# Shared schema for tools that take no documented parameters
+EMPTY_OBJECT_SCHEMA = JSONSchema.of_type('object')
+
+
+@dataclass(slots=True)
 class ToolMetadata:
     """Metadata for a discovered tool from an upstream MCP server.
     
@@ -161,6 +186,37 @@ class ToolMetadata:
         return []
 
 
+@dataclass(frozen=True, slots=True)
+class UpstreamToolIndex:
+    """
+    Tools of a single upstream, pre-sorted for default subset selection.
+    
+    Build once per upstream when its tools are registered; selecting a subset
+    from indexes then only walks the first few tools of each upstream instead
+    of sorting the whole catalog.
+    
+    Attributes:
+        upstream_id: Upstream the tools belong to
+        tools_sorted: The upstream's tools sorted by original_name
+    """
+    upstream_id: str
+    tools_sorted: tuple[ToolMetadata, ...]
+    
+    @classmethod
+    def from_tools(cls, upstream_id: str, tools: Iterable[ToolMetadata]) -> 'UpstreamToolIndex':
+        """
+        Build an index from one upstream's tools.
+        
+        Args:
+            upstream_id: Upstream the tools belong to
+            tools: The upstream's tools, in catalog order
+            
+        Returns:
+            UpstreamToolIndex with the tools sorted by original_name (ties keep catalog order)
+        """
+        return cls(upstream_id, tuple(sorted(tools, key=attrgetter('original_name'))))
+
+
 @dataclass
 class ContentItem:
     """Content item in tool call result.
@@ -5,12 +5,15 @@ This module manages connections to multiple upstream MCP servers and
 aggregates their tool catalogs.
 """
 import asyncio
+import json
 import logging
-from typing import Dict, List, Optional, TYPE_CHECKING
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
-from mcp_router.core.config import RouterConfig
+from mcp_router.core.config import LoadingConfig, RouterConfig
 from mcp_router.core.config_parser import load_config
-from mcp_router.core.models import ToolMetadata
+from mcp_router.core.models import JSONSchema, ToolMetadata, UpstreamToolIndex
 from mcp_router.core.logging import log_with_metadata
 from mcp_router.discovery.upstream import UpstreamConnection
 from mcp_router.discovery.alias_resolver import AliasResolver
@@ -35,7 +38,8 @@ class ToolDiscoveryManager:
         self,
         config: RouterConfig,
         embedding_engine: 'EmbeddingEngine',
-        search_engine: 'SemanticSearchEngine'
+        search_engine: 'SemanticSearchEngine',
+        load_upstream_fn: Optional[Callable[[str], Awaitable[dict]]] = None
     ) -> None:
         """Initialize the tool discovery manager with configuration.
         
@@ -43,14 +47,67 @@ class ToolDiscoveryManager:
             config: Router configuration containing upstream definitions
             embedding_engine: Engine for generating tool embeddings
             search_engine: Engine for semantic search over tools
+            load_upstream_fn: Optional replacement for load_upstream(), used by
+                initialize() and load_multiple_upstreams() (e.g. a stub in tests)
         """
         self._config: RouterConfig = config
         self.embedding_engine = embedding_engine
         self.search_engine = search_engine
         self.upstreams: Dict[str, UpstreamConnection] = {}
         self._loaded_upstreams: Dict[str, UpstreamConnection] = {}
+        self._tools_by_name: Dict[str, ToolMetadata] = {}
+        self._tools_tuple: Optional[Tuple[ToolMetadata, ...]] = None
+        # Per-upstream tools pre-sorted for get_default_tool_subset(), kept in step with all_tools
+        self._upstream_indexes: Dict[str, UpstreamToolIndex] = {}
         self.all_tools: List[ToolMetadata] = []
         self._alias_resolver: AliasResolver = AliasResolver(config)
+        # Upstreams whose tools in all_tools come from the tool cache rather than a live load
+        self._stale_upstreams: Set[str] = set()
+        self._refresh_task: Optional[asyncio.Task] = None
+        if load_upstream_fn is not None:
+            self.load_upstream = load_upstream_fn  # type: ignore[method-assign]
+    
+    @property
+    def all_tools(self) -> List[ToolMetadata]:
+        """
+        Aggregated tools from all loaded upstreams.
+        
+        Assigning a new list re-indexes tools by name; change the catalog by
+        assignment (or through load/unload, which use _add_tools()) rather than
+        in place, so that get_tool_by_name() and get_all_tools() stay in sync.
+        """
+        return self._all_tools
+    
+    @all_tools.setter
+    def all_tools(self, tools: List[ToolMetadata]) -> None:
+        self._all_tools = tools
+        self._tools_by_name.clear()
+        self._upstream_indexes.clear()
+        self._index_tools(tools)
+    
+    def _add_tools(self, tools: List[ToolMetadata]) -> None:
+        """Append tools to the catalog and index them (cheaper than re-assigning all_tools)."""
+        self._all_tools.extend(tools)
+        self._index_tools(tools)
+    
+    def _index_tools(self, tools: List[ToolMetadata]) -> None:
+        """
+        Add tools to the name index (first tool per name wins) and to the
+        per-upstream indexes, and drop the cached snapshot.
+        """
+        self._tools_tuple = None
+        new_tools_by_upstream: Dict[str, List[ToolMetadata]] = {}
+        for tool in tools:
+            self._tools_by_name.setdefault(tool.name, tool)
+            new_tools_by_upstream.setdefault(tool.upstream_id, []).append(tool)
+        for upstream_id, upstream_tools in new_tools_by_upstream.items():
+            existing = self._upstream_indexes.get(upstream_id)
+            if existing is not None:
+                # The sort is stable, so earlier tools still win ties as in the catalog
+                upstream_tools = [*existing.tools_sorted, *upstream_tools]
+            self._upstream_indexes[upstream_id] = UpstreamToolIndex.from_tools(
+                upstream_id, upstream_tools
+            )
     
     async def initialize(self) -> None:
         """
@@ -58,13 +115,23 @@ class ToolDiscoveryManager:
         
         This method:
         1. Parses auto_load configuration
-        2. Loads specified upstreams (or all if auto_load=["all"])
+        2. Loads specified upstreams (or all if auto_load=["all"]) concurrently, with
+           at most loading.max_concurrent_upstreams loads in flight at once
         3. Handles failures gracefully (logs but continues)
         
-        If auto_load is empty, no upstreams are loaded on startup.
+        If auto_load is empty, no upstreams are loaded on startup. Upstreams may
+        finish loading in any order.
+        
+        Stale-while-revalidate: with loading.tool_cache_path set and
+        loading.cache_embeddings enabled, a previously cached catalog is served
+        immediately and the loads run in a background task (see wait_for_refresh()).
+        Cached tools of an upstream are replaced, in all_tools and in the search
+        engine, once it loads, and kept if it fails to load. The cache is rewritten
+        from the live catalog after each initialization.
         """
-        # Get auto_load configuration (default to ["all"] if loading config is None)
-        auto_load = self._config.loading.auto_load if self._config.loading else ["all"]
+        # Fall back to the defaults (auto_load=["all"]) if loading config is None
+        loading = self._config.loading or LoadingConfig()
+        auto_load = loading.auto_load
         
         # Handle special case: ["all"] means load all upstreams
         if auto_load == ["all"]:
@@ -74,24 +141,71 @@ class ToolDiscoveryManager:
             logger.info("auto_load=[] - no upstreams will be loaded on startup")
             return
         else:
+            auto_load = self._dedupe_auto_load(auto_load)
             logger.info(f"auto_load={auto_load} - loading {len(auto_load)} specified upstreams")
         
-        # Load each upstream in auto_load list
-        successful_loads = 0
-        failed_loads = []
+        cache_path = (
+            Path(loading.tool_cache_path)
+            if loading.cache_embeddings and loading.tool_cache_path else None
+        )
+        if cache_path is not None:
+            cached_tools = _read_tool_cache(cache_path)
+            if cached_tools:
+                self.all_tools = cached_tools
+                self._stale_upstreams = {tool.upstream_id for tool in cached_tools}
+                logger.info(
+                    f"Serving {len(cached_tools)} cached tools; refreshing upstreams in background"
+                )
+                self._refresh_task = asyncio.create_task(
+                    self._load_auto_load(auto_load, loading.max_concurrent_upstreams, cache_path)
+                )
+                self._refresh_task.add_done_callback(_log_refresh_failure)
+                return
         
-        for upstream_name in auto_load:
-            try:
-                # Use load_upstream() method (stub for now, will be implemented in Task 6)
-                result = await self.load_upstream(upstream_name)
-                if result.get("success"):
-                    successful_loads += 1
+        await self._load_auto_load(auto_load, loading.max_concurrent_upstreams, cache_path)
+    
+    async def wait_for_refresh(self) -> None:
+        """Wait for a background refresh started by initialize() (if any) to finish."""
+        if self._refresh_task is not None:
+            await self._refresh_task
+    
+    async def _load_auto_load(
+        self,
+        auto_load: List[str],
+        max_concurrent: int,
+        cache_path: Optional[Path]
+    ) -> None:
+        """
+        Load the given upstreams concurrently, logging (not raising) failures.
+        
+        Args:
+            auto_load: Upstream names to load (without repeats)
+            max_concurrent: Maximum number of loads in flight at once
+            cache_path: Tool cache to rewrite afterwards, if any
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        succeeded: Dict[str, bool] = {}
+        
+        async def load_one(upstream_name: str) -> None:
+            async with semaphore:
+                try:
+                    result = await self.load_upstream(upstream_name)
+                except Exception as e:
+                    error = e
                 else:
-                    failed_loads.append(upstream_name)
-                    logger.warning(f"Failed to load upstream '{upstream_name}': {result.get('error')}")
-            except Exception as e:
-                failed_loads.append(upstream_name)
-                logger.warning(f"Failed to load upstream '{upstream_name}': {e}")
+                    if result.get("success"):
+                        succeeded[upstream_name] = True
+                        return
+                    error = result.get("error")
+            succeeded[upstream_name] = False
+            logger.warning(f"Failed to load upstream '{upstream_name}': {error}")
+        
+        # load_one() handles its own errors, so anything reaching gather() propagates
+        await asyncio.gather(*(load_one(upstream_name) for upstream_name in auto_load))
+        
+        successful_loads = sum(succeeded.values())
+        # Report failures in auto_load order rather than completion order
+        failed_loads = [name for name in auto_load if not succeeded[name]]
         
         logger.info(
             f"Initialization complete: {successful_loads} upstreams loaded successfully"
@@ -99,6 +213,59 @@ class ToolDiscoveryManager:
         
         if failed_loads:
             logger.warning(f"Failed to load upstreams: {', '.join(failed_loads)}")
+        
+        if cache_path is not None:
+            self._write_tool_cache(cache_path)
+    
+    def _dedupe_auto_load(self, auto_load: List[str]) -> List[str]:
+        """
+        Resolve auto_load names to canonical upstream names and drop repeats.
+        
+        An upstream listed by name and by alias must not be connected twice
+        concurrently. Unknown names are kept as given so that their load fails
+        and is logged like any other failure.
+        
+        Args:
+            auto_load: Upstream names or aliases from the loading configuration
+            
+        Returns:
+            Canonical names in first-listed order, without repeats
+        """
+        resolved_names = []
+        for name in auto_load:
+            try:
+                resolved_names.append(self._alias_resolver.resolve(name))
+            except ValueError:
+                resolved_names.append(name)
+        return list(dict.fromkeys(resolved_names))
+    
+    def _write_tool_cache(self, cache_path: Path) -> None:
+        """Write the tools of the loaded upstreams to the tool cache (errors are logged)."""
+        # Only live tools: cached tools of upstreams that failed to load stay stale
+        entries = [
+            _tool_to_cache_entry(tool) for tool in self.all_tools
+            if tool.upstream_id in self._loaded_upstreams
+        ]
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write a sibling file and swap it in, so readers never see a partial cache
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"tools": entries}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool cache '{cache_path}': {e}")
+    
+    def _drop_stale_tools(self, upstream_id: str) -> None:
+        """Remove an upstream's cached tools from the search engine and all_tools."""
+        if upstream_id not in self._stale_upstreams:
+            return
+        upstream_config = self._config.mcp_servers.get(upstream_id)
+        # Tools are namespaced by semantic_prefix when one is configured (see UpstreamConnection)
+        namespace = (upstream_config and upstream_config.semantic_prefix) or upstream_id
+        self.search_engine.remove_tools(namespace)
+        self._stale_upstreams.discard(upstream_id)
+        self.all_tools = [tool for tool in self.all_tools if tool.upstream_id != upstream_id]
     
     async def load_upstream(self, name: str) -> dict:
         """
@@ -180,8 +347,9 @@ class ToolDiscoveryManager:
                 await connection.disconnect()
                 return {"success": False, "error": error_msg}
             
-            # Add tools to search engine
+            # Add tools to search engine, replacing any cached tools of this upstream
             try:
+                self._drop_stale_tools(canonical_name)
                 self.search_engine.add_tools(tools)
             except Exception as e:
                 error_msg = f"Failed to add tools to search engine: {str(e)}"
@@ -192,7 +360,7 @@ class ToolDiscoveryManager:
             # Store connection and update all_tools
             self._loaded_upstreams[canonical_name] = connection
             self.upstreams[canonical_name] = connection  # Also store in upstreams for backward compatibility
-            self.all_tools.extend(tools)
+            self._add_tools(tools)
             
             logger.info(f"Successfully loaded upstream '{canonical_name}' with {len(tools)} tools")
             return {
@@ -249,6 +417,10 @@ class ToolDiscoveryManager:
                 })
                 logger.warning(f"Failed to resolve upstream '{name}': {e}")
         
+        # Drop repeats (e.g. an upstream requested by name and by alias) so the same
+        # upstream is not connected twice concurrently; keeps first-requested order
+        resolved_names = list(dict.fromkeys(resolved_names))
+        
         # Load all resolved upstreams concurrently
         if resolved_names:
             # Create tasks for all loads
@@ -303,6 +475,7 @@ class ToolDiscoveryManager:
             # Check if upstream is loaded
             if canonical_name not in self._loaded_upstreams:
                 # Already unloaded - return success (idempotent)
+                self._drop_stale_tools(canonical_name)
                 logger.info(f"Upstream '{canonical_name}' is not loaded, nothing to unload")
                 return {
                     "success": True,
@@ -400,14 +573,19 @@ class ToolDiscoveryManager:
         """
         return list(self._config.mcp_servers.keys())
     
-    def get_all_tools(self) -> list[ToolMetadata]:
+    def get_all_tools(self) -> Tuple[ToolMetadata, ...]:
         """
         Get all discovered tools from all upstreams.
         
+        The snapshot is cached until the catalog changes, so repeated calls
+        (e.g. for every tools/list request) do not copy the catalog.
+        
         Returns:
-            List of all tool metadata objects
+            Read-only tuple of all tool metadata objects
         """
-        return self.all_tools.copy()
+        if self._tools_tuple is None:
+            self._tools_tuple = tuple(self._all_tools)
+        return self._tools_tuple
     
     def get_upstream(self, upstream_id: str) -> Optional[UpstreamConnection]:
         """
@@ -423,7 +601,7 @@ class ToolDiscoveryManager:
     
     def get_tool_by_name(self, namespaced_name: str) -> Optional[ToolMetadata]:
         """
-        Find a tool by its namespaced name.
+        Find a tool by its namespaced name (constant-time index lookup).
         
         Args:
             namespaced_name: Full tool name with namespace (e.g., "browser.navigate")
@@ -431,25 +609,40 @@ class ToolDiscoveryManager:
         Returns:
             ToolMetadata if found, None otherwise
         """
-        for tool in self.all_tools:
-            if tool.name == namespaced_name:
-                return tool
-        return None
+        return self._tools_by_name.get(namespaced_name)
     
     async def shutdown(self) -> None:
         """
         Shutdown all upstream connections gracefully.
+        
+        Upstreams are disconnected concurrently; disconnect errors are logged
+        and do not prevent the remaining upstreams from being closed.
         """
         logger.info("Shutting down tool discovery manager...")
         
-        for upstream_id, upstream in self.upstreams.items():
+        # Stop a background refresh still in progress
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
             try:
-                await upstream.disconnect()
-            except Exception as e:
-                logger.warning(f"Error disconnecting from upstream '{upstream_id}': {e}")
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        
+        # Disconnect all upstreams concurrently; one failure must not stop the others
+        upstreams = list(self.upstreams.items())
+        results = await asyncio.gather(
+            *(upstream.disconnect() for _, upstream in upstreams),
+            return_exceptions=True
+        )
+        for (upstream_id, _), result in zip(upstreams, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Error disconnecting from upstream '{upstream_id}': {result}")
+            elif isinstance(result, BaseException):
+                raise result
         
         self.upstreams.clear()
-        self.all_tools.clear()
+        self._stale_upstreams.clear()
+        self.all_tools = []
         
         logger.info("Tool discovery manager shutdown complete")
     
@@ -457,7 +650,8 @@ class ToolDiscoveryManager:
         """
         Get a diverse subset of tools for the default tools/list response.
         
-        Selects tools proportionally from each upstream to ensure diversity.
+        Selects tools proportionally from each upstream to ensure diversity,
+        using the per-upstream indexes built when the tools were registered.
         
         Args:
             max_tools: Maximum number of tools to return (default: 20)
@@ -465,5 +659,56 @@ class ToolDiscoveryManager:
         Returns:
             List of up to max_tools tools with diverse upstream coverage
         """
-        from mcp_router.search.default_subset import select_default_tool_subset
-        return select_default_tool_subset(self.all_tools, max_tools)
+        from mcp_router.search.default_subset import select_from_indexes
+        return select_from_indexes(self._upstream_indexes.values(), max_tools)
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    """Done callback for the background refresh: log an error it ended with."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background upstream refresh failed", exc_info=task.exception())
+
+
+def _read_tool_cache(cache_path: Path) -> List[ToolMetadata]:
+    """
+    Read the cached tool catalog.
+    
+    Args:
+        cache_path: Tool cache written by ToolDiscoveryManager._write_tool_cache()
+        
+    Returns:
+        Cached tools, or an empty list if the cache is missing or unreadable
+    """
+    if not cache_path.exists():
+        return []
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            entries = json.load(f)["tools"]
+        return [_tool_from_cache_entry(entry) for entry in entries]
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable tool cache '{cache_path}': {e}")
+        return []
+
+
+def _tool_to_cache_entry(tool: ToolMetadata) -> Dict[str, Any]:
+    """Serialize a tool for the tool cache (embeddings are not cached)."""
+    return {
+        "name": tool.name,
+        "original_name": tool.original_name,
+        "description": tool.description,
+        "input_schema": tool.input_schema.to_dict(),
+        "upstream_id": tool.upstream_id,
+        "category_description": tool.category_description
+    }
+
+
+def _tool_from_cache_entry(entry: Dict[str, Any]) -> ToolMetadata:
+    """Rebuild a tool from a tool cache entry (see _tool_to_cache_entry)."""
+    return ToolMetadata(
+        name=entry["name"],
+        original_name=entry["original_name"],
+        description=entry["description"],
+        input_schema=JSONSchema.from_dict(entry["input_schema"]),
+        upstream_id=entry["upstream_id"],
+        category_description=entry.get("category_description")
+    )
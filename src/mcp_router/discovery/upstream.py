@@ -6,6 +6,7 @@ This module handles connections to individual upstream MCP servers.
 from typing import Optional
 import asyncio
 import logging
+import sys
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -33,7 +34,8 @@ class UpstreamConnection:
             upstream_id: Unique identifier for this upstream
             config: Configuration for the upstream server
         """
-        self.upstream_id = upstream_id
+        # Interned: copied into every ToolMetadata.upstream_id and used as a grouping key
+        self.upstream_id = sys.intern(upstream_id)
         self.config = config
         self.tools: list[ToolMetadata] = []
         self._session: Optional[ClientSession] = None
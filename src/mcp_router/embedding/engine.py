@@ -5,7 +5,7 @@ This module provides the EmbeddingEngine class that loads and manages the
 all-MiniLM-L6-v2 model for generating 384-dimensional embeddings.
 """
 import asyncio
-from typing import Optional
+from typing import Optional, Sequence
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
@@ -118,7 +118,7 @@ class EmbeddingEngine:
         """Check if the model is loaded and ready."""
         return self._model is not None
     
-    async def generate_tool_embeddings(self, tools: list[ToolMetadata]) -> None:
+    async def generate_tool_embeddings(self, tools: Sequence[ToolMetadata]) -> None:
         """
         Generate embeddings for all tools and cache them in the tool objects.
         
@@ -126,7 +126,7 @@ class EmbeddingEngine:
         in batch for efficiency, and stores them in the tool's embedding field.
         
         Args:
-            tools: List of tool metadata objects to generate embeddings for
+            tools: Tool metadata objects to generate embeddings for (any sequence)
             
         Raises:
             RuntimeError: If model not initialized
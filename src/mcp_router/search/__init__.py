@@ -6,7 +6,14 @@ This module provides semantic search capabilities using embeddings and cosine si
 from mcp_router.search.engine import SemanticSearchEngine
 from mcp_router.search.similarity import cosine_similarity, compute_similarities
 from mcp_router.search.sanitize import sanitize_query, combine_query_and_context
-from mcp_router.search.default_subset import select_default_tool_subset
+from mcp_router.search.default_subset import (
+    UpstreamToolIndex,
+    build_upstream_indexes,
+    select_default_tool_subset,
+    select_from_indexes,
+    subset_distribution,
+    clear_subset_cache,
+)
 
 __all__ = [
     'SemanticSearchEngine',
@@ -14,5 +21,10 @@ __all__ = [
     'compute_similarities',
     'sanitize_query',
     'combine_query_and_context',
+    'UpstreamToolIndex',
+    'build_upstream_indexes',
     'select_default_tool_subset',
+    'select_from_indexes',
+    'subset_distribution',
+    'clear_subset_cache',
 ]
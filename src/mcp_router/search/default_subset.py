@@ -4,10 +4,47 @@ Default tool subset selection for tools/list.
 This module provides functions to select a diverse subset of tools
 for the standard tools/list response.
 """
-from mcp_router.core.models import ToolMetadata
+import functools
+import heapq
+import itertools
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from operator import attrgetter
 
+import numpy as np
 
-def select_default_tool_subset(tools: list[ToolMetadata], max_tools: int = 20) -> list[ToolMetadata]:
+# UpstreamToolIndex lives in core.models so that ToolDiscoveryManager can build
+# indexes without importing the search package; re-exported from here
+from mcp_router.core.models import ToolMetadata, UpstreamToolIndex
+
+
+_BY_UPSTREAM = attrgetter('upstream_id')
+_CATALOG_KEY = attrgetter('upstream_id', 'original_name')
+
+
+def build_upstream_indexes(tools: Iterable[ToolMetadata]) -> list[UpstreamToolIndex]:
+    """
+    Split a catalog into one UpstreamToolIndex per upstream.
+    
+    Sorts once by (upstream_id, original_name) and groups consecutive runs,
+    so no intermediate per-upstream lists are built.
+    
+    Args:
+        tools: Tools from any number of upstreams, in catalog order
+        
+    Returns:
+        Indexes ordered by upstream_id
+    """
+    return [
+        UpstreamToolIndex(upstream_id, tuple(group))
+        for upstream_id, group in itertools.groupby(sorted(tools, key=_CATALOG_KEY), key=_BY_UPSTREAM)
+    ]
+
+
+def select_default_tool_subset(
+    tools: Sequence[ToolMetadata],
+    max_tools: int = 20
+) -> list[ToolMetadata]:
     """
     Select a diverse subset of tools with coverage across upstreams.
     
@@ -21,7 +58,7 @@ def select_default_tool_subset(tools: list[ToolMetadata], max_tools: int = 20) -
     all upstream servers rather than being dominated by a single upstream.
     
     Args:
-        tools: All available tools
+        tools: All available tools (see select_from_indexes() for pre-sorted input)
         max_tools: Maximum number of tools to return (default: 20)
         
     Returns:
@@ -37,60 +74,126 @@ def select_default_tool_subset(tools: list[ToolMetadata], max_tools: int = 20) -
         >>> len(subset) == 2
         True
     """
-    if not tools:
+    if max_tools <= 0 or not tools:
         return []
     
-    # Group tools by upstream
-    tools_by_upstream: dict[str, list[ToolMetadata]] = {}
+    if len(tools) <= max_tools:
+        counts = subset_distribution(tools)
+        if max(counts.values()) <= max(1, max_tools // len(counts)):
+            # Every upstream fits in its proportional share, so the selection is the
+            # whole catalog grouped by upstream, alphabetically within each upstream
+            return sorted(tools, key=_CATALOG_KEY)
     
-    for tool in tools:
-        if tool.upstream_id not in tools_by_upstream:
-            tools_by_upstream[tool.upstream_id] = []
-        tools_by_upstream[tool.upstream_id].append(tool)
+    # The selection depends only on the (upstream, name) sequence, so cache the
+    # chosen positions and map them onto the caller's (possibly new) tool objects
+    keys = tuple(map(_CATALOG_KEY, tools))
+    return [tools[i] for i in _select_indices(keys, max_tools)]
+
+
+def select_from_indexes(
+    indexes: Iterable[UpstreamToolIndex],
+    max_tools: int = 20
+) -> list[ToolMetadata]:
+    """
+    Select the default subset from pre-sorted per-upstream indexes.
     
-    # Sort tools within each upstream alphabetically by original name
-    for upstream_id in tools_by_upstream:
-        tools_by_upstream[upstream_id].sort(key=lambda t: t.original_name)
+    Produces the same selection as select_default_tool_subset() for the same
+    tools, but only walks the first few tools of each upstream.
     
-    # Calculate how many tools to take from each upstream
-    num_upstreams = len(tools_by_upstream)
-    tools_per_upstream = max(1, max_tools // num_upstreams)
+    Args:
+        indexes: One index per upstream, in any order
+        max_tools: Maximum number of tools to return (default: 20)
+        
+    Returns:
+        List of up to max_tools tools, in selection order
+    """
+    if max_tools <= 0:
+        return []
+    
+    groups = [
+        index.tools_sorted
+        for index in sorted(indexes, key=_BY_UPSTREAM)
+        if index.tools_sorted
+    ]
+    if not groups:
+        return []
     
-    # Select tools proportionally from each upstream
-    default_tools: list[ToolMetadata] = []
-    upstream_ids = sorted(tools_by_upstream.keys())  # Sort for deterministic order
+    tools_per_upstream = max(1, max_tools // len(groups))
     
-    for upstream_id in upstream_ids:
-        upstream_tools = tools_by_upstream[upstream_id]
-        # Take up to tools_per_upstream from this upstream
-        selected = upstream_tools[:tools_per_upstream]
-        default_tools.extend(selected)
+    if sum(map(len, groups)) <= max_tools and max(map(len, groups)) <= tools_per_upstream:
+        # Everything fits and every upstream is within its proportional share
+        return list(itertools.chain.from_iterable(groups))
     
-    # If we haven't reached max_tools yet, add more tools round-robin
-    if len(default_tools) < max_tools:
-        # Track how many we've taken from each upstream
-        taken_counts = {uid: tools_per_upstream for uid in upstream_ids}
+    # Proportional share of each upstream, upstream by upstream
+    selected = list(itertools.chain.from_iterable(
+        itertools.islice(group, tools_per_upstream) for group in groups
+    ))
+    
+    # Fill the remaining slots round-robin across upstreams, one rank at a time:
+    # merging the per-upstream tails on (rank, upstream position) yields that order lazily
+    remaining = max_tools - len(selected)
+    if remaining > 0:
+        tails = [
+            zip(itertools.count(tools_per_upstream), itertools.repeat(position), group[tools_per_upstream:])
+            for position, group in enumerate(groups)
+        ]
+        selected.extend(tool for _, _, tool in itertools.islice(heapq.merge(*tails), remaining))
+    
+    return selected[:max_tools]
+
+
+def subset_distribution(subset: Iterable[ToolMetadata]) -> Counter[str]:
+    """
+    Count how many tools each upstream contributes to a subset.
+    
+    Args:
+        subset: Tools, e.g. the result of select_default_tool_subset()
+        
+    Returns:
+        Counter mapping upstream_id to number of tools (in first-seen order)
+    """
+    return Counter(map(_BY_UPSTREAM, subset))
+
+
+def clear_subset_cache() -> None:
+    """Drop all memoized default subset selections (e.g. after a catalog reload)."""
+    _select_indices.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _select_indices(keys: tuple[tuple[str, str], ...], max_tools: int) -> tuple[int, ...]:
+    """
+    Compute the positions of the default subset within a catalog.
+    
+    Args:
+        keys: (upstream_id, original_name) for each tool, in catalog order
+        max_tools: Maximum number of tools to select (must be positive)
         
-        # Round-robin through upstreams to fill remaining slots
-        while len(default_tools) < max_tools:
-            added_any = False
-            
-            for upstream_id in upstream_ids:
-                if len(default_tools) >= max_tools:
-                    break
-                
-                upstream_tools = tools_by_upstream[upstream_id]
-                taken = taken_counts[upstream_id]
-                
-                # If this upstream has more tools available
-                if taken < len(upstream_tools):
-                    default_tools.append(upstream_tools[taken])
-                    taken_counts[upstream_id] += 1
-                    added_any = True
-            
-            # If we couldn't add any more tools, we're done
-            if not added_any:
-                break
-    
-    # Return exactly max_tools (or fewer if not enough tools available)
-    return default_tools[:max_tools]
+    Returns:
+        Indices into the catalog, in selection order
+    """
+    upstream_ids = np.array([upstream_id for upstream_id, _ in keys])
+    names = np.array([name for _, name in keys])
+    
+    # Sort by (upstream_id, original_name); lexsort is stable so ties keep catalog order
+    order = np.lexsort((names, upstream_ids))
+    
+    # Group boundaries in the sorted array, each tool's group (upstreams in sorted
+    # order) and its alphabetical rank within that group
+    _, group_starts, group_of = np.unique(
+        upstream_ids[order], return_index=True, return_inverse=True
+    )
+    rank = np.arange(len(keys)) - group_starts[group_of]
+    
+    # Calculate how many tools to take from each upstream
+    num_upstreams = len(group_starts)
+    tools_per_upstream = max(1, max_tools // num_upstreams)
+    
+    # Selection order: first the proportional share of each upstream, upstream by
+    # upstream; then the remaining tools round-robin across upstreams, one rank at a time
+    round_robin = rank >= tools_per_upstream
+    primary = np.where(round_robin, rank, group_of)
+    secondary = np.where(round_robin, group_of, rank)
+    selected = np.lexsort((secondary, primary, round_robin))[:max_tools]
+    
+    return tuple(order[selected].tolist())
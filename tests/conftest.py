@@ -1,37 +1,52 @@
 """
 Pytest configuration and shared fixtures for MCP Semantic Router tests.
 """
+import copy
+import json
 import pytest
-import asyncio
-from typing import Generator
 
+try:
+    import uvloop
+except ImportError:  # optional dev dependency, not available on Windows
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+# The session-wide event loop is configured via asyncio_default_*_loop_scope in
+# pytest.ini (pytest-asyncio >= 1.0 no longer honours an event_loop fixture).
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop, which creates loops and schedules tasks faster."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+_SAMPLE_CONFIG: dict = {
+    "mcpServers": {
+        "playwright": {
+            "transport": "stdio",
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-playwright"],
+            "semantic_prefix": "browser",
+            "category_description": "Web browser automation and testing tools"
+        },
+        "atlassian": {
+            "transport": "stdio",
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-atlassian"],
+            "semantic_prefix": "jira",
+            "category_description": "Issue tracking and project management tools"
+        }
+    }
+}
 
 
 @pytest.fixture
 def sample_config_dict() -> dict:
     """Sample configuration dictionary for testing."""
-    return {
-        "mcpServers": {
-            "playwright": {
-                "transport": "stdio",
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-playwright"],
-                "semantic_prefix": "browser",
-                "category_description": "Web browser automation and testing tools"
-            },
-            "atlassian": {
-                "transport": "stdio",
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-atlassian"],
-                "semantic_prefix": "jira",
-                "category_description": "Issue tracking and project management tools"
-            }
-        }
-    }
+    return copy.deepcopy(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def sample_config_json_bytes() -> bytes:
+    """Sample configuration serialized to JSON once per session."""
+    return json.dumps(_SAMPLE_CONFIG).encode('utf-8')
@@ -97,7 +97,6 @@ def mock_upstream_connection():
     return mock_conn
 
 
-@pytest.mark.asyncio
 async def test_startup_sequence_success(
     mock_config_file: Path,
     mock_upstream_connection: AsyncMock
@@ -146,7 +145,6 @@ async def test_startup_sequence_success(
         mock_server_instance.run.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_startup_sequence_invalid_config(tmp_path: Path):
     """
     Test startup sequence with invalid configuration file.
@@ -163,7 +161,6 @@ async def test_startup_sequence_invalid_config(tmp_path: Path):
         await startup_sequence(str(invalid_config))
 
 
-@pytest.mark.asyncio
 async def test_startup_sequence_missing_config():
     """
     Test startup sequence with missing configuration file.
@@ -176,7 +173,6 @@ async def test_startup_sequence_missing_config():
         await startup_sequence("nonexistent_config.json")
 
 
-@pytest.mark.asyncio
 async def test_shutdown_sequence_success(mock_upstream_connection: AsyncMock):
     """
     Test graceful shutdown sequence.
@@ -196,7 +192,6 @@ async def test_shutdown_sequence_success(mock_upstream_connection: AsyncMock):
     mock_upstream_connection.disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_shutdown_sequence_with_error(mock_upstream_connection: AsyncMock):
     """
     Test shutdown sequence when upstream disconnect fails.
@@ -219,7 +214,6 @@ async def test_shutdown_sequence_with_error(mock_upstream_connection: AsyncMock)
     mock_upstream_connection.disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_tool_discovery_with_failed_upstream(
     mock_config_file: Path,
     mock_upstream_connection: AsyncMock
@@ -276,7 +270,6 @@ async def test_tool_discovery_with_failed_upstream(
         assert len(tools) > 0
 
 
-@pytest.mark.asyncio
 async def test_end_to_end_tool_search_and_call(
     mock_config_file: Path,
     mock_upstream_connection: AsyncMock
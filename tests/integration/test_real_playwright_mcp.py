@@ -37,7 +37,6 @@ def playwright_config_file(tmp_path: Path) -> Path:
     return config_path
 
 
-@pytest.mark.asyncio
 @pytest.mark.slow  # Mark as slow since it connects to real MCP server
 async def test_real_playwright_discovery(playwright_config_file: Path):
     """
@@ -85,7 +84,6 @@ async def test_real_playwright_discovery(playwright_config_file: Path):
         await discovery_manager.shutdown()
 
 
-@pytest.mark.asyncio
 @pytest.mark.slow
 async def test_real_playwright_semantic_search(playwright_config_file: Path):
     """
@@ -144,7 +142,6 @@ async def test_real_playwright_semantic_search(playwright_config_file: Path):
         await discovery_manager.shutdown()
 
 
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.skipif(
     True,  # Skip by default - requires browser installation
@@ -204,7 +201,6 @@ async def test_real_playwright_tool_call(playwright_config_file: Path):
         await discovery_manager.shutdown()
 
 
-@pytest.mark.asyncio
 @pytest.mark.slow
 async def test_real_playwright_end_to_end(playwright_config_file: Path):
     """
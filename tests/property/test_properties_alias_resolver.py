@@ -0,0 +1,67 @@
+"""
+Property-based tests for alias resolution.
+
+Tests the AliasResolver invariants over randomly generated configurations:
+upstream names resolve to themselves (case-sensitively, taking precedence over
+aliases) and aliases resolve case-insensitively to an upstream declaring them.
+"""
+
+import string
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from mcp_router.core.config import RouterConfig, UpstreamConfig
+from mcp_router.discovery.alias_resolver import AliasResolver
+
+# ASCII only: str.lower()/str.upper() do not round-trip for every Unicode letter
+name_strategy = st.text(alphabet=string.ascii_letters + string.digits, min_size=1, max_size=8)
+
+# Upstream name -> list of aliases
+upstreams_strategy = st.dictionaries(
+    name_strategy, st.lists(name_strategy, max_size=4), min_size=1, max_size=4
+)
+
+
+@pytest.mark.property
+@given(upstreams=upstreams_strategy)
+@settings(max_examples=50, deadline=None)
+def test_alias_resolution_invariants(upstreams: dict[str, list[str]]) -> None:
+    """
+    For any configuration:
+    - every upstream name resolves to itself, even if it is also another upstream's alias
+    - every alias resolves to the same upstream regardless of case, and that upstream
+      declares the alias (when several upstreams share an alias, one of them wins)
+    - an upstream name with different casing does not resolve unless it is an alias
+    """
+    config = RouterConfig(
+        mcp_servers={
+            name: UpstreamConfig(transport="stdio", command="test", args=[], aliases=aliases)
+            for name, aliases in upstreams.items()
+        }
+    )
+    resolver = AliasResolver(config)
+
+    owners: dict[str, set[str]] = {}
+    for name, aliases in upstreams.items():
+        for alias in aliases:
+            owners.setdefault(alias.lower(), set()).add(name)
+
+    for name in upstreams:
+        assert resolver.resolve(name) == name
+
+    for alias_lower, alias_owners in owners.items():
+        variants = [alias_lower, alias_lower.upper(), alias_lower.capitalize()]
+        # Exact upstream names take precedence over aliases, so skip those spellings
+        variants = [v for v in variants if v not in upstreams]
+        resolved = {resolver.resolve(v) for v in variants}
+        if resolved:
+            assert len(resolved) == 1
+            assert resolved <= alias_owners
+
+    for name in upstreams:
+        other_case = name.swapcase()
+        if other_case in upstreams or other_case.lower() in owners:
+            continue
+        with pytest.raises(ValueError):
+            resolver.resolve(other_case)
@@ -9,7 +9,7 @@ import pytest
 from hypothesis import given, strategies as st, settings
 
 from mcp_router.core.models import ToolMetadata, JSONSchema
-from mcp_router.search.default_subset import select_default_tool_subset
+from mcp_router.search.default_subset import select_default_tool_subset, subset_distribution
 
 
 # Strategy for generating tool names
@@ -46,7 +46,7 @@ def test_property_22_default_subset_provides_upstream_diversity(
                 name=f"{upstream_id}.tool{tool_idx}",
                 original_name=f"tool{tool_idx}",
                 description=f"Test tool {tool_idx}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id=upstream_id
             )
             tools.append(tool)
@@ -59,9 +59,7 @@ def test_property_22_default_subset_provides_upstream_diversity(
     assert len(subset) > 0
     
     # Count tools from each upstream in the subset
-    upstream_counts = {}
-    for tool in subset:
-        upstream_counts[tool.upstream_id] = upstream_counts.get(tool.upstream_id, 0) + 1
+    upstream_counts = subset_distribution(subset)
     
     # Property: Multiple upstreams should be represented
     # (unless there's only 1 upstream or very few tools)
@@ -98,7 +96,7 @@ def test_property_23_non_empty_catalog_produces_non_empty_list(
             name=f"upstream.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="upstream"
         )
         for i in range(num_tools)
@@ -158,7 +156,7 @@ def test_property_22_alphabetical_selection_within_upstream(
                 name=f"{upstream_id}.{tool_name}",
                 original_name=tool_name,
                 description=f"Test {tool_name}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id=upstream_id
             )
             tools.append(tool)
@@ -198,7 +196,7 @@ def test_property_22_respects_max_tools_limit(max_tools: int) -> None:
             name=f"upstream{i % 3}.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id=f"upstream{i % 3}"
         )
         for i in range(100)
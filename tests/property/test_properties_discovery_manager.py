@@ -14,7 +14,6 @@ from mcp_router.discovery.upstream import UpstreamConnection
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     num_upstreams=st.integers(min_value=2, max_value=5),
     num_failures=st.integers(min_value=1, max_value=4)
@@ -31,7 +31,6 @@ non_empty_text_strategy = st.text(min_size=1, max_size=500).filter(lambda x: x.s
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(text=non_empty_text_strategy)
 @settings(
     suppress_health_check=[HealthCheck.too_slow],
@@ -60,7 +59,6 @@ async def test_property_13_embedding_dimensions(text: str) -> None:
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     tool_name=tool_name_strategy,
     description=description_strategy,
@@ -89,7 +87,7 @@ async def test_property_11_all_tools_have_embeddings(
         name=f"{upstream_id}.{tool_name}",
         original_name=tool_name,
         description=description,
-        input_schema=JSONSchema(type='object'),
+        input_schema=JSONSchema.of_type('object'),
         upstream_id=upstream_id
     )
     
@@ -110,7 +108,6 @@ async def test_property_11_all_tools_have_embeddings(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     tool_name=tool_name_strategy,
     description=description_strategy,
@@ -140,7 +137,7 @@ async def test_property_12_tool_embeddings_are_cached(
         name=f"{upstream_id}.{tool_name}",
         original_name=tool_name,
         description=description,
-        input_schema=JSONSchema(type='object'),
+        input_schema=JSONSchema.of_type('object'),
         upstream_id=upstream_id
     )
     
@@ -163,7 +160,6 @@ async def test_property_12_tool_embeddings_are_cached(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     texts=st.lists(
         non_empty_text_strategy,
@@ -232,7 +228,7 @@ def test_property_17_category_description_in_embeddings(
         name=f"{upstream_id}.{tool_name}",
         original_name=tool_name,
         description=description,
-        input_schema=JSONSchema(type='object'),
+        input_schema=JSONSchema.of_type('object'),
         upstream_id=upstream_id,
         category_description=category_description
     )
@@ -56,7 +56,6 @@ arguments_strategy = st.dictionaries(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     tool_name=tool_name_strategy,
@@ -112,7 +111,6 @@ async def test_property_2_transparent_proxying(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     semantic_prefix=semantic_prefix_strategy,
@@ -167,7 +165,6 @@ async def test_property_18_namespace_parsing_identifies_upstream(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     invalid_name=st.one_of(
         # Names without dots
@@ -206,7 +203,6 @@ async def test_property_19_invalid_namespace_produces_error(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     tool_name=tool_name_strategy,
@@ -246,7 +242,6 @@ async def test_property_20_upstream_errors_forwarded(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     tool_name=tool_name_strategy
@@ -290,7 +285,6 @@ async def test_property_21_timeout_errors_reported(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     tool_names=st.lists(tool_name_strategy, min_size=2, max_size=5, unique=True)
@@ -336,7 +330,6 @@ async def test_property_27_connection_reuse(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     upstream_id=upstream_id_strategy,
     tool_name=tool_name_strategy,
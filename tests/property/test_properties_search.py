@@ -96,7 +96,6 @@ def test_property_7_cosine_similarity_properties(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     num_tools=st.integers(min_value=15, max_value=30),
     top_k=st.integers(min_value=5, max_value=15)
@@ -129,7 +128,7 @@ async def test_property_8_search_results_include_top_k_tools(
             name=f"upstream{i % 3}.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i} for testing",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id=f"upstream{i % 3}"
         )
         tools.append(tool)
@@ -159,7 +158,6 @@ async def test_property_8_search_results_include_top_k_tools(
 
 
 @pytest.mark.property
-@pytest.mark.asyncio
 @given(
     empty_query=st.one_of(
         st.just(""),
@@ -187,7 +185,7 @@ async def test_property_9_empty_query_produces_error(empty_query: str) -> None:
         name="test.tool",
         original_name="tool",
         description="Test",
-        input_schema=JSONSchema(type='object'),
+        input_schema=JSONSchema.of_type('object'),
         upstream_id="test"
     )
     await engine.generate_tool_embeddings([tool])
@@ -6,7 +6,6 @@ Tests universal correctness properties for the server's behavior.
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck
 
 from mcp_router.server.server import SemanticRouterServer
@@ -48,7 +47,6 @@ def tool_metadata_strategy():
     )
 
 
-@pytest.mark.asyncio
 @given(tools=st.lists(tool_metadata_strategy(), min_size=20, max_size=100))
 @settings(
     max_examples=10,
@@ -116,7 +114,6 @@ async def test_property_1_tools_list_returns_20_tools_plus_search_tools(tools):
     # because the MCP SDK doesn't expose handlers in a testable way for property tests
 
 
-@pytest.mark.asyncio
 @given(
     query=st.text(min_size=1, max_size=100),
     context=st.one_of(st.none(), st.lists(st.text(min_size=1, max_size=50), max_size=5))
@@ -144,7 +141,7 @@ async def test_property_3_search_tools_returns_valid_json_rpc(query, context):
         name="test.tool",
         original_name="tool",
         description="Test tool",
-        input_schema=JSONSchema(type="object"),
+        input_schema=JSONSchema.of_type("object"),
         upstream_id="test",
         embedding=None
     )
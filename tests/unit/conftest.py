@@ -0,0 +1,184 @@
+"""
+Shared fixtures for unit tests.
+
+Session-scoped objects are built once and shared; tests must not mutate them.
+The engine stubs are created per test.
+"""
+
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+import pytest
+
+from mcp_router.core.config import UpstreamConfig
+from mcp_router.core.models import JSONSchema, ToolMetadata
+
+
+@pytest.fixture(scope="session")
+def sample_tools() -> tuple[ToolMetadata, ...]:
+    """Two tools from two different upstreams."""
+    return (
+        ToolMetadata(
+            name="upstream1.tool1",
+            original_name="tool1",
+            description="Test tool 1",
+            input_schema=JSONSchema.of_type("object"),
+            upstream_id="upstream1",
+        ),
+        ToolMetadata(
+            name="upstream2.tool2",
+            original_name="tool2",
+            description="Test tool 2",
+            input_schema=JSONSchema.of_type("object"),
+            upstream_id="upstream2",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_tool_single() -> ToolMetadata:
+    """A single tool belonging to 'test-upstream'."""
+    return ToolMetadata(
+        name="test.tool",
+        original_name="tool",
+        description="Test",
+        input_schema=JSONSchema.of_type("object"),
+        upstream_id="test-upstream",
+    )
+
+
+@pytest.fixture(scope="session")
+def stdio_config() -> UpstreamConfig:
+    """Minimal stdio upstream configuration."""
+    return UpstreamConfig(transport="stdio", command="python")
+
+
+class _StubEmbeddingEngine:
+    """Minimal EmbeddingEngine stand-in that records the tool lists it embeds."""
+
+    def __init__(self) -> None:
+        self.embedded: List[Sequence[ToolMetadata]] = []
+        # Raised by generate_tool_embeddings when set
+        self.embed_exc: Optional[BaseException] = None
+
+    async def generate_tool_embeddings(self, tools: Sequence[ToolMetadata]) -> list:
+        if self.embed_exc is not None:
+            raise self.embed_exc
+        self.embedded.append(tools)
+        return []
+
+
+class _StubSearchEngine:
+    """Minimal SemanticSearchEngine stand-in that records added and removed tools."""
+
+    def __init__(self) -> None:
+        self.added: List[list] = []
+        self.removed: List[str] = []
+        # Raised by add_tools / remove_tools when set
+        self.add_exc: Optional[BaseException] = None
+        self.remove_exc: Optional[BaseException] = None
+
+    def add_tools(self, tools: list) -> None:
+        if self.add_exc is not None:
+            raise self.add_exc
+        self.added.append(tools)
+
+    def remove_tools(self, upstream_id: str) -> None:
+        if self.remove_exc is not None:
+            raise self.remove_exc
+        self.removed.append(upstream_id)
+
+
+# Function-scoped: the stubs record calls and some tests set their *_exc
+# attributes to inject failures. Modules needing richer engine mocks override these fixtures.
+@pytest.fixture
+def mock_embedding_engine() -> _StubEmbeddingEngine:
+    """Create a stub EmbeddingEngine."""
+    return _StubEmbeddingEngine()
+
+
+@pytest.fixture
+def mock_search_engine() -> _StubSearchEngine:
+    """Create a stub SemanticSearchEngine."""
+    return _StubSearchEngine()
+
+
+class _FakeConnection:
+    """Minimal UpstreamConnection stand-in that counts calls and can inject failures."""
+
+    __slots__ = (
+        "tools",
+        "connect_exc",
+        "fetch_exc",
+        "disconnect_exc",
+        "connect_hook",
+        "created_for",
+        "connect_calls",
+        "fetch_calls",
+        "disconnect_calls",
+    )
+
+    def __init__(
+        self,
+        tools: Sequence[ToolMetadata] = (),
+        connect_exc: Optional[BaseException] = None,
+        fetch_exc: Optional[BaseException] = None,
+        disconnect_exc: Optional[BaseException] = None,
+        connect_hook: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        self.tools = tools
+        self.connect_exc = connect_exc
+        self.fetch_exc = fetch_exc
+        self.disconnect_exc = disconnect_exc
+        # Awaited at the start of every connect() (e.g. to simulate latency)
+        self.connect_hook = connect_hook
+        # Upstream ids the patched UpstreamConnection constructor was called with
+        self.created_for: List[str] = []
+        self.connect_calls = 0
+        self.fetch_calls = 0
+        self.disconnect_calls = 0
+
+    async def connect(self) -> None:
+        self.connect_calls += 1
+        if self.connect_hook is not None:
+            await self.connect_hook()
+        if self.connect_exc is not None:
+            raise self.connect_exc
+
+    async def fetch_tools(self) -> List[ToolMetadata]:
+        self.fetch_calls += 1
+        if self.fetch_exc is not None:
+            raise self.fetch_exc
+        return list(self.tools)
+
+    async def disconnect(self) -> None:
+        self.disconnect_calls += 1
+        if self.disconnect_exc is not None:
+            raise self.disconnect_exc
+
+
+@pytest.fixture(scope="session")
+def fake_connection() -> type[_FakeConnection]:
+    """Factory for stub UpstreamConnections (cheaper than AsyncMock)."""
+    return _FakeConnection
+
+
+@pytest.fixture
+def patched_connection(monkeypatch) -> Callable[..., _FakeConnection]:
+    """
+    Factory that patches the manager's UpstreamConnection to hand out one stub.
+
+    Accepts the _FakeConnection arguments and returns the stub; calling it again
+    replaces the patch. The patch is undone when the test finishes.
+    """
+
+    def _patch(**kwargs: Any) -> _FakeConnection:
+        connection = _FakeConnection(**kwargs)
+
+        def _construct(upstream_id: str, config: UpstreamConfig) -> _FakeConnection:
+            connection.created_for.append(upstream_id)
+            return connection
+
+        monkeypatch.setattr("mcp_router.discovery.manager.UpstreamConnection", _construct)
+        return connection
+
+    return _patch
@@ -3,7 +3,9 @@ Unit tests for configuration management.
 
 Tests specific examples and edge cases for configuration parsing.
 """
+import dataclasses
 import json
+import re
 import pytest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -12,6 +14,12 @@ from mcp_router.core.config import UpstreamConfig, RouterConfig
 from mcp_router.core.config_parser import load_config, parse_config, ConfigurationError
 
 
+# Patterns shared by several pytest.raises(match=...) checks below
+_RE_CMD_REQUIRED = re.compile("command is required")
+_RE_URL_REQUIRED = re.compile("url is required")
+_RE_BAD_ALIAS = re.compile("Invalid alias.*alphanumeric")
+
+
 class TestUpstreamConfig:
     """Tests for UpstreamConfig dataclass."""
     
@@ -28,7 +36,7 @@ class TestUpstreamConfig:
     
     def test_stdio_config_missing_command(self) -> None:
         """Test stdio configuration without command raises error."""
-        with pytest.raises(ValueError, match="command is required"):
+        with pytest.raises(ValueError, match=_RE_CMD_REQUIRED):
             UpstreamConfig(transport='stdio')
     
     def test_stdio_config_empty_args(self) -> None:
@@ -47,7 +55,7 @@ class TestUpstreamConfig:
     
     def test_sse_config_missing_url(self) -> None:
         """Test SSE configuration without URL raises error."""
-        with pytest.raises(ValueError, match="url is required"):
+        with pytest.raises(ValueError, match=_RE_URL_REQUIRED):
             UpstreamConfig(transport='sse')
     
     def test_http_config_valid(self) -> None:
@@ -131,7 +139,7 @@ class TestUpstreamConfig:
     
     def test_aliases_special_characters_raises_error(self) -> None:
         """Test that aliases with special characters raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid alias.*alphanumeric"):
+        with pytest.raises(ValueError, match=_RE_BAD_ALIAS):
             UpstreamConfig(
                 transport='stdio',
                 command='test',
@@ -140,7 +148,7 @@ class TestUpstreamConfig:
     
     def test_aliases_with_dots_raises_error(self) -> None:
         """Test that aliases with dots raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid alias.*alphanumeric"):
+        with pytest.raises(ValueError, match=_RE_BAD_ALIAS):
             UpstreamConfig(
                 transport='stdio',
                 command='test',
@@ -149,7 +157,7 @@ class TestUpstreamConfig:
     
     def test_aliases_with_slashes_raises_error(self) -> None:
         """Test that aliases with slashes raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid alias.*alphanumeric"):
+        with pytest.raises(ValueError, match=_RE_BAD_ALIAS):
             UpstreamConfig(
                 transport='stdio',
                 command='test',
@@ -167,6 +175,16 @@ class TestRouterConfig:
         assert len(config.mcp_servers) == 1
         assert 'test' in config.mcp_servers
     
+    def test_config_is_immutable(self) -> None:
+        """Test that parsed configuration objects cannot be reassigned."""
+        upstream = UpstreamConfig(transport='stdio', command='test')
+        config = RouterConfig(mcp_servers={'test': upstream})
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            upstream.command = 'other'
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.loading.rate_limit = 1
+    
     def test_empty_servers_raises_error(self) -> None:
         """Test router configuration with no servers raises error."""
         with pytest.raises(ValueError, match="At least one upstream"):
@@ -239,7 +257,7 @@ class TestParseConfig:
                 }
             }
         }
-        with pytest.raises(ValueError, match="command is required"):
+        with pytest.raises(ValueError, match=_RE_CMD_REQUIRED):
             parse_config(config_dict)
     
     def test_parse_sse_missing_url(self) -> None:
@@ -251,7 +269,7 @@ class TestParseConfig:
                 }
             }
         }
-        with pytest.raises(ValueError, match="url is required"):
+        with pytest.raises(ValueError, match=_RE_URL_REQUIRED):
             parse_config(config_dict)
     
     def test_parse_upstream_config_not_dict(self) -> None:
@@ -268,18 +286,17 @@ class TestParseConfig:
 class TestLoadConfig:
     """Tests for load_config function."""
     
-    def test_load_valid_config_file(self, sample_config_dict: dict) -> None:
-        """Test loading valid configuration from file."""
-        with NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(sample_config_dict, f)
-            temp_path = f.name
+    @pytest.mark.parametrize("wrap", [str, Path], ids=["str", "path"])
+    def test_load_valid_config_file(
+        self, wrap: type, sample_config_json_bytes: bytes, tmp_path: Path
+    ) -> None:
+        """Test loading valid configuration from a str or Path file location."""
+        config_path = tmp_path / 'config.json'
+        config_path.write_bytes(sample_config_json_bytes)
         
-        try:
-            config = load_config(temp_path)
-            assert len(config.mcp_servers) == 2
-            assert 'playwright' in config.mcp_servers
-        finally:
-            Path(temp_path).unlink()
+        config = load_config(wrap(config_path))
+        assert len(config.mcp_servers) == 2
+        assert 'playwright' in config.mcp_servers
     
     def test_load_missing_file(self) -> None:
         """Test loading non-existent file raises error."""
@@ -309,15 +326,3 @@ class TestLoadConfig:
                 load_config(temp_path)
         finally:
             Path(temp_path).unlink()
-    
-    def test_load_config_with_path_object(self, sample_config_dict: dict) -> None:
-        """Test loading configuration using Path object."""
-        with NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(sample_config_dict, f)
-            temp_path = Path(f.name)
-        
-        try:
-            config = load_config(temp_path)
-            assert len(config.mcp_servers) == 2
-        finally:
-            temp_path.unlink()
@@ -1,27 +1,35 @@
 """
 Unit tests for configuration parser with loading section and aliases support.
 """
+import re
+import sys
+
 import pytest
 
 from mcp_router.core.config import LoadingConfig, RouterConfig
-from mcp_router.core.config_parser import parse_config
+from mcp_router.core.config_parser import parse_config, parse_config_fast
+
+
+# Patterns for the pytest.raises(match=...) checks below
+_RE_LOADING_NOT_DICT = re.compile("'loading' must be a dictionary")
+_RE_TIMEOUT_NOT_POSITIVE = re.compile("connection_timeout must be positive")
+_RE_ALIASES_NOT_LIST = re.compile("'aliases'.*must be a list")
+_RE_BAD_ALIAS = re.compile("Invalid alias.*alphanumeric")
+_RE_EMPTY_ALIAS = re.compile("Alias cannot be empty")
+
+
+@pytest.fixture(scope="module")
+def base_config() -> dict:
+    """Minimal valid config skeleton; spread it and add sections per test, never mutate."""
+    return {'mcpServers': {'test': {'transport': 'stdio', 'command': 'test'}}}
 
 
 class TestParseLoadingSection:
     """Tests for parsing the loading section of configuration."""
     
-    def test_parse_config_without_loading_section(self) -> None:
+    def test_parse_config_without_loading_section(self, base_config: dict) -> None:
         """Test parsing config without loading section uses defaults."""
-        config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            }
-        }
-        
-        config = parse_config(config_dict)
+        config = parse_config(base_config)
         
         # Should use default LoadingConfig values
         assert config.loading.auto_load == ["all"]
@@ -31,15 +39,10 @@ class TestParseLoadingSection:
         assert config.loading.max_concurrent_upstreams == 10
         assert config.loading.rate_limit == 5
     
-    def test_parse_config_with_empty_loading_section(self) -> None:
+    def test_parse_config_with_empty_loading_section(self, base_config: dict) -> None:
         """Test parsing config with empty loading section uses defaults."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {}
         }
         
@@ -53,15 +56,10 @@ class TestParseLoadingSection:
         assert config.loading.max_concurrent_upstreams == 10
         assert config.loading.rate_limit == 5
     
-    def test_parse_config_with_partial_loading_section(self) -> None:
+    def test_parse_config_with_partial_loading_section(self, base_config: dict) -> None:
         """Test parsing config with partial loading section uses defaults for missing fields."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {
                 'auto_load': ['upstream1'],
                 'connection_timeout': 60
@@ -80,22 +78,32 @@ class TestParseLoadingSection:
         assert config.loading.max_concurrent_upstreams == 10
         assert config.loading.rate_limit == 5
     
-    def test_parse_config_with_complete_loading_section(self) -> None:
+    def test_parse_config_loading_ignores_unknown_keys(self, base_config: dict) -> None:
+        """Test that unrecognized keys in the loading section are ignored."""
+        config_dict = {
+            **base_config,
+            'loading': {
+                'rate_limit': 7,
+                'unknown_option': True
+            }
+        }
+        
+        config = parse_config(config_dict)
+        assert config.loading.rate_limit == 7
+        assert not hasattr(config.loading, 'unknown_option')
+    
+    def test_parse_config_with_complete_loading_section(self, base_config: dict) -> None:
         """Test parsing config with complete loading section."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {
                 'auto_load': ['upstream1', 'upstream2'],
                 'lazy_load': False,
                 'cache_embeddings': False,
                 'connection_timeout': 60,
                 'max_concurrent_upstreams': 5,
-                'rate_limit': 10
+                'rate_limit': 10,
+                'tool_cache_path': 'cache/tools.json'
             }
         }
         
@@ -107,16 +115,12 @@ class TestParseLoadingSection:
         assert config.loading.connection_timeout == 60
         assert config.loading.max_concurrent_upstreams == 5
         assert config.loading.rate_limit == 10
+        assert config.loading.tool_cache_path == 'cache/tools.json'
     
-    def test_parse_config_with_auto_load_all(self) -> None:
+    def test_parse_config_with_auto_load_all(self, base_config: dict) -> None:
         """Test parsing config with auto_load set to ['all']."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {
                 'auto_load': ['all']
             }
@@ -125,15 +129,10 @@ class TestParseLoadingSection:
         config = parse_config(config_dict)
         assert config.loading.auto_load == ['all']
     
-    def test_parse_config_with_auto_load_empty(self) -> None:
+    def test_parse_config_with_auto_load_empty(self, base_config: dict) -> None:
         """Test parsing config with auto_load set to empty list."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {
                 'auto_load': []
             }
@@ -142,54 +141,35 @@ class TestParseLoadingSection:
         config = parse_config(config_dict)
         assert config.loading.auto_load == []
     
-    def test_parse_config_loading_not_dict_raises_error(self) -> None:
+    def test_parse_config_loading_not_dict_raises_error(self, base_config: dict) -> None:
         """Test that loading section that is not a dict raises TypeError."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': 'not a dict'
         }
         
-        with pytest.raises(TypeError, match="'loading' must be a dictionary"):
+        with pytest.raises(TypeError, match=_RE_LOADING_NOT_DICT):
             parse_config(config_dict)
     
-    def test_parse_config_loading_invalid_values_raises_error(self) -> None:
+    def test_parse_config_loading_invalid_values_raises_error(self, base_config: dict) -> None:
         """Test that invalid loading values raise ValueError."""
         config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            },
+            **base_config,
             'loading': {
                 'connection_timeout': -1
             }
         }
         
-        with pytest.raises(ValueError, match="connection_timeout must be positive"):
+        with pytest.raises(ValueError, match=_RE_TIMEOUT_NOT_POSITIVE):
             parse_config(config_dict)
 
 
 class TestParseAliases:
     """Tests for parsing aliases in upstream configurations."""
     
-    def test_parse_config_without_aliases(self) -> None:
+    def test_parse_config_without_aliases(self, base_config: dict) -> None:
         """Test parsing upstream config without aliases field."""
-        config_dict = {
-            'mcpServers': {
-                'test': {
-                    'transport': 'stdio',
-                    'command': 'test'
-                }
-            }
-        }
-        
-        config = parse_config(config_dict)
+        config = parse_config(base_config)
         assert config.mcp_servers['test'].aliases == []
     
     def test_parse_config_with_empty_aliases(self) -> None:
@@ -294,7 +274,7 @@ class TestParseAliases:
             }
         }
         
-        with pytest.raises(TypeError, match="'aliases'.*must be a list"):
+        with pytest.raises(TypeError, match=_RE_ALIASES_NOT_LIST):
             parse_config(config_dict)
     
     def test_parse_config_with_invalid_alias_raises_error(self) -> None:
@@ -309,7 +289,7 @@ class TestParseAliases:
             }
         }
         
-        with pytest.raises(ValueError, match="Invalid alias.*alphanumeric"):
+        with pytest.raises(ValueError, match=_RE_BAD_ALIAS):
             parse_config(config_dict)
     
     def test_parse_config_with_empty_alias_raises_error(self) -> None:
@@ -324,7 +304,7 @@ class TestParseAliases:
             }
         }
         
-        with pytest.raises(ValueError, match="Alias cannot be empty"):
+        with pytest.raises(ValueError, match=_RE_EMPTY_ALIAS):
             parse_config(config_dict)
 
 
@@ -438,3 +418,100 @@ class TestCompleteConfiguration:
         assert config.loading.connection_timeout == 45
         assert config.loading.max_concurrent_upstreams == 8
         assert config.loading.rate_limit == 3
+
+
+class TestParseConfigCaching:
+    """Tests for memoization of parse_config results."""
+    
+    def test_repeated_parse_returns_independent_copies(self) -> None:
+        """Test that mutating a parsed config does not affect later parses of the same dict."""
+        config_dict = {
+            'mcpServers': {
+                'test': {
+                    'transport': 'stdio',
+                    'command': 'test',
+                    'args': ['--flag'],
+                    'aliases': ['browser']
+                }
+            }
+        }
+        
+        first = parse_config(config_dict)
+        first.mcp_servers['test'].aliases.append('mutated')
+        first.mcp_servers['test'].args.append('mutated')
+        first.loading.auto_load.append('mutated')
+        first.mcp_servers['other'] = first.mcp_servers['test']
+        second = parse_config(config_dict)
+        
+        assert second is not first
+        assert list(second.mcp_servers) == ['test']
+        assert second.mcp_servers['test'].aliases == ['browser']
+        assert second.mcp_servers['test'].args == ['--flag']
+        assert second.loading.auto_load == ['all']
+    
+    def test_cache_distinguishes_bool_from_int(self, base_config: dict) -> None:
+        """Test that values that compare equal but differ in type are not conflated."""
+        as_bool = parse_config({**base_config, 'loading': {'lazy_load': True}})
+        as_int = parse_config({**base_config, 'loading': {'lazy_load': 1}})
+        
+        assert as_bool.loading.lazy_load is True
+        assert as_int.loading.lazy_load == 1
+        assert as_int.loading.lazy_load is not True
+    
+    def test_cache_preserves_upstream_order(self) -> None:
+        """Test that configs differing only in upstream order parse to their own order."""
+        a = {'transport': 'stdio', 'command': 'a'}
+        b = {'transport': 'stdio', 'command': 'b'}
+        
+        assert list(parse_config({'mcpServers': {'a': a, 'b': b}}).mcp_servers) == ['a', 'b']
+        assert list(parse_config({'mcpServers': {'b': b, 'a': a}}).mcp_servers) == ['b', 'a']
+
+
+class TestParseConfigInterning:
+    """Tests for string interning of parsed identifiers."""
+    
+    def test_parsed_identifiers_are_interned(self) -> None:
+        """Test that upstream IDs, transports and aliases are interned strings."""
+        name = ''.join(['play', 'wright'])  # built at runtime, so not a literal constant
+        config = parse_config({
+            'mcpServers': {name: {'transport': 'stdio', 'command': 'x', 'aliases': ['web']}}
+        })
+        
+        upstream_id = next(iter(config.mcp_servers))
+        assert upstream_id is sys.intern('playwright')
+        assert config.mcp_servers[upstream_id].transport is sys.intern('stdio')
+        assert config.mcp_servers[upstream_id].aliases[0] is sys.intern('web')
+
+
+class TestParseConfigFast:
+    """Tests for parsing without validation."""
+    
+    def test_fast_parse_matches_validated_parse(self) -> None:
+        """Test that a valid config parses to the same result with and without validation."""
+        config_dict = {
+            'mcpServers': {
+                'playwright': {'transport': 'stdio', 'command': 'npx', 'aliases': ['browser']},
+                'remote': {'transport': 'sse', 'url': 'http://localhost:8080'}
+            },
+            'loading': {'auto_load': ['playwright'], 'connection_timeout': 10, 'unknown': 1}
+        }
+        
+        fast = parse_config_fast(config_dict)
+        
+        assert fast == parse_config(config_dict)
+        assert fast.mcp_servers['playwright'].args == []
+        assert fast.loading.rate_limit == 5
+    
+    def test_fast_parse_skips_validation(self) -> None:
+        """Test that values rejected by validation are accepted as-is."""
+        config_dict = {
+            'mcpServers': {'test': {'transport': 'stdio', 'command': 'x', 'aliases': ['a@b']}},
+            'loading': {'connection_timeout': 0}
+        }
+        
+        with pytest.raises(ValueError):
+            parse_config(config_dict)
+        
+        config = parse_config(config_dict, validate=False)
+        assert config.mcp_servers['test'].aliases == ['a@b']
+        assert config.loading.connection_timeout == 0
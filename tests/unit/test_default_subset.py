@@ -5,8 +5,15 @@ Tests specific scenarios and edge cases for the default subset algorithm.
 """
 import pytest
 
-from mcp_router.core.models import ToolMetadata, JSONSchema
-from mcp_router.search.default_subset import select_default_tool_subset
+from mcp_router.core.models import EMPTY_OBJECT_SCHEMA, ToolMetadata
+from mcp_router.search.default_subset import (
+    UpstreamToolIndex,
+    build_upstream_indexes,
+    clear_subset_cache,
+    select_default_tool_subset,
+    select_from_indexes,
+    subset_distribution,
+)
 
 
 def test_select_default_subset_with_multiple_upstreams():
@@ -20,7 +27,7 @@ def test_select_default_subset_with_multiple_upstreams():
                 name=f"{upstream_id}.tool{tool_idx}",
                 original_name=f"tool{tool_idx}",
                 description=f"Test tool {tool_idx}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=EMPTY_OBJECT_SCHEMA,
                 upstream_id=upstream_id
             )
             tools.append(tool)
@@ -32,13 +39,12 @@ def test_select_default_subset_with_multiple_upstreams():
     assert len(subset) == 20
     
     # Should have tools from all 3 upstreams
-    upstream_ids = {tool.upstream_id for tool in subset}
-    assert len(upstream_ids) == 3
+    counts = subset_distribution(subset)
+    assert len(counts) == 3
     
     # Each upstream should have approximately equal representation
     # With 20 tools and 3 upstreams, expect 6-7 tools per upstream
-    for upstream_id in upstream_ids:
-        count = sum(1 for tool in subset if tool.upstream_id == upstream_id)
+    for count in counts.values():
         assert 6 <= count <= 7
 
 
@@ -50,7 +56,7 @@ def test_select_default_subset_with_single_upstream():
             name=f"upstream.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         )
         for i in range(30)
@@ -80,7 +86,7 @@ def test_select_default_subset_with_fewer_than_20_tools():
             name=f"upstream.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         )
         for i in range(10)
@@ -113,21 +119,21 @@ def test_select_default_subset_alphabetical_order():
             name="upstream.zebra",
             original_name="zebra",
             description="Z tool",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         ),
         ToolMetadata(
             name="upstream.apple",
             original_name="apple",
             description="A tool",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         ),
         ToolMetadata(
             name="upstream.banana",
             original_name="banana",
             description="B tool",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         ),
     ]
@@ -153,7 +159,7 @@ def test_select_default_subset_proportional_distribution():
             name=f"upstream1.tool{i}",
             original_name=f"tool{i}",
             description=f"Tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream1"
         ))
     
@@ -163,7 +169,7 @@ def test_select_default_subset_proportional_distribution():
             name=f"upstream2.tool{i}",
             original_name=f"tool{i}",
             description=f"Tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream2"
         ))
     
@@ -174,11 +180,9 @@ def test_select_default_subset_proportional_distribution():
     assert len(subset) == 20
     
     # Should have 10 from each upstream (equal distribution)
-    upstream1_count = sum(1 for tool in subset if tool.upstream_id == "upstream1")
-    upstream2_count = sum(1 for tool in subset if tool.upstream_id == "upstream2")
-    
-    assert upstream1_count == 10
-    assert upstream2_count == 10
+    counts = subset_distribution(subset)
+    assert counts["upstream1"] == 10
+    assert counts["upstream2"] == 10
 
 
 def test_select_default_subset_custom_max_tools():
@@ -189,7 +193,7 @@ def test_select_default_subset_custom_max_tools():
             name=f"upstream.tool{i}",
             original_name=f"tool{i}",
             description=f"Test tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream"
         )
         for i in range(30)
@@ -218,7 +222,7 @@ def test_select_default_subset_uneven_upstream_sizes():
             name=f"upstream1.tool{i}",
             original_name=f"tool{i}",
             description=f"Tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream1"
         ))
     
@@ -228,7 +232,7 @@ def test_select_default_subset_uneven_upstream_sizes():
             name=f"upstream2.tool{i}",
             original_name=f"tool{i}",
             description=f"Tool {i}",
-            input_schema=JSONSchema(type='object'),
+            input_schema=EMPTY_OBJECT_SCHEMA,
             upstream_id="upstream2"
         ))
     
@@ -239,16 +243,57 @@ def test_select_default_subset_uneven_upstream_sizes():
     assert len(subset) == 20
     
     # Both upstreams should be represented
-    upstream_ids = {tool.upstream_id for tool in subset}
-    assert len(upstream_ids) == 2
+    counts = subset_distribution(subset)
+    assert len(counts) == 2
     
     # Upstream 1 should have at most 2 tools (all it has)
-    upstream1_count = sum(1 for tool in subset if tool.upstream_id == "upstream1")
-    assert upstream1_count == 2
+    assert counts["upstream1"] == 2
     
     # Upstream 2 should have the rest
-    upstream2_count = sum(1 for tool in subset if tool.upstream_id == "upstream2")
-    assert upstream2_count == 18
+    assert counts["upstream2"] == 18
+
+
+def test_select_default_subset_order_when_catalog_fits():
+    """Test that a catalog that fits is returned in selection order, not catalog order."""
+    def make_tool(upstream_id, original_name):
+        return ToolMetadata(
+            name=f"{upstream_id}.{original_name}",
+            original_name=original_name,
+            description="Test tool",
+            input_schema=EMPTY_OBJECT_SCHEMA,
+            upstream_id=upstream_id
+        )
+    
+    # Every upstream within its share: grouped by upstream, alphabetical within each
+    tools = [make_tool("b", "x"), make_tool("a", "z"), make_tool("a", "y")]
+    subset = select_default_tool_subset(tools, max_tools=20)
+    assert [t.name for t in subset] == ["a.y", "a.z", "b.x"]
+    
+    # Upstream "a" exceeds its share of 10: its extra tools follow the other upstreams
+    tools = [make_tool("b", "x")] + [make_tool("a", f"t{i:02d}") for i in range(15)]
+    subset = select_default_tool_subset(tools, max_tools=20)
+    assert [t.name for t in subset] == (
+        [f"a.t{i:02d}" for i in range(10)] + ["b.x"] + [f"a.t{i:02d}" for i in range(10, 15)]
+    )
+    assert select_from_indexes(build_upstream_indexes(tools), max_tools=20) == subset
+
+
+def test_select_default_subset_more_upstreams_than_max_tools():
+    """Test that max_tools is respected when there are more upstreams than slots."""
+    tools = [
+        ToolMetadata(
+            name=f"upstream{u:02d}.tool",
+            original_name="tool",
+            description="Test tool",
+            input_schema=EMPTY_OBJECT_SCHEMA,
+            upstream_id=f"upstream{u:02d}"
+        )
+        for u in range(30)
+    ]
+    
+    subset = select_default_tool_subset(tools, max_tools=20)
+    assert len(subset) == 20
+    assert select_from_indexes(build_upstream_indexes(tools), max_tools=20) == subset
 
 
 def test_select_default_subset_deterministic():
@@ -262,7 +307,7 @@ def test_select_default_subset_deterministic():
                 name=f"{upstream_id}.tool{tool_idx}",
                 original_name=f"tool{tool_idx}",
                 description=f"Test tool {tool_idx}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=EMPTY_OBJECT_SCHEMA,
                 upstream_id=upstream_id
             )
             tools.append(tool)
@@ -274,3 +319,57 @@ def test_select_default_subset_deterministic():
     # Should be identical
     assert len(subset1) == len(subset2)
     assert [t.name for t in subset1] == [t.name for t in subset2]
+
+
+def test_select_default_subset_cache_returns_current_tool_objects():
+    """Test that a cached selection is mapped onto the tools passed in, not stale ones."""
+    def make_tools(description):
+        return [
+            ToolMetadata(
+                name=f"upstream{u}.tool{t}",
+                original_name=f"tool{t}",
+                description=description,
+                input_schema=EMPTY_OBJECT_SCHEMA,
+                upstream_id=f"upstream{u}"
+            )
+            for u in range(2)
+            for t in range(15)
+        ]
+    
+    clear_subset_cache()
+    old_tools = make_tools("old")
+    new_tools = make_tools("new")
+    
+    old_subset = select_default_tool_subset(old_tools, max_tools=20)
+    new_subset = select_default_tool_subset(new_tools, max_tools=20)
+    
+    assert [t.name for t in new_subset] == [t.name for t in old_subset]
+    assert all(t.description == "new" for t in new_subset)
+    assert all(any(t is n for n in new_tools) for t in new_subset)
+
+
+def test_select_default_subset_from_upstream_indexes():
+    """Test that pre-sorted per-upstream indexes select the same subset as the flat list."""
+    tools = [
+        ToolMetadata(
+            name=f"upstream{u}.tool{t}",
+            original_name=f"tool{t}",
+            description=f"Tool {t}",
+            input_schema=EMPTY_OBJECT_SCHEMA,
+            upstream_id=f"upstream{u}"
+        )
+        for u in range(3)
+        for t in range(4 + 5 * u)
+    ]
+    indexes = [
+        UpstreamToolIndex.from_tools(f"upstream{u}", [t for t in tools if t.upstream_id == f"upstream{u}"])
+        for u in reversed(range(3))
+    ]
+    
+    grouped = build_upstream_indexes(tools)
+    assert grouped == sorted(indexes, key=lambda index: index.upstream_id)
+    
+    for max_tools in (1, 5, 20, 100):
+        expected = select_default_tool_subset(tools, max_tools=max_tools)
+        assert select_from_indexes(indexes, max_tools=max_tools) == expected
+        assert select_from_indexes(grouped, max_tools=max_tools) == expected
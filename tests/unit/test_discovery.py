@@ -2,18 +2,33 @@
 Unit tests for tool discovery manager and upstream connections.
 
 Tests tool discovery, upstream connection management, and error handling.
+The module is hermetic (no files, sockets or shared state), so it is safe to
+run under pytest-xdist alongside any other module.
 """
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-import tempfile
-import json
+from unittest.mock import MagicMock
 
 from mcp_router.core.config import UpstreamConfig, RouterConfig
-from mcp_router.core.models import ToolMetadata, JSONSchema
 from mcp_router.discovery.manager import ToolDiscoveryManager
 from mcp_router.discovery.upstream import UpstreamConnection
 
 
+# Upstream configs shared by parametrized tests, validated once at import
+_CFGS = {
+    'stdio': UpstreamConfig(transport='stdio', command='python'),
+    'sse': UpstreamConfig(transport='sse', url='http://example.com'),
+}
+
+
+@pytest.fixture
+def manager(stdio_config):
+    """Create a ToolDiscoveryManager with mocked embedding and search engines."""
+    config = RouterConfig(mcp_servers={'test-upstream': stdio_config})
+    return ToolDiscoveryManager(config, MagicMock(), MagicMock())
+
+
 class TestUpstreamConnection:
     """Tests for UpstreamConnection class"""
     
@@ -32,128 +47,69 @@ class TestUpstreamConnection:
         assert upstream.tools == []
         assert not upstream.is_connected
     
-    @pytest.mark.asyncio
-    async def test_connect_unsupported_transport(self):
-        """Test that unsupported transport raises error"""
-        config = UpstreamConfig(
-            transport='sse',
-            url='http://example.com'
-        )
-        
-        upstream = UpstreamConnection('test-upstream', config)
-        
-        with pytest.raises(ValueError, match="Unsupported transport"):
-            await upstream.connect()
+    @pytest.mark.parametrize(
+        "transport,method,args,exc,match",
+        [
+            ("sse", "connect", (), ValueError, "Unsupported transport"),
+            ("stdio", "fetch_tools", (), RuntimeError, "Not connected"),
+            ("stdio", "call_tool", ("test_tool", {}), RuntimeError, "Not connected"),
+        ],
+        ids=["unsupported", "fetch-unconnected", "call-unconnected"],
+    )
+    async def test_error_paths(self, transport, method, args, exc, match):
+        """Test that unsupported transports and calls before connecting raise errors"""
+        upstream = UpstreamConnection('test-upstream', _CFGS[transport])
+        
+        with pytest.raises(exc, match=match):
+            await getattr(upstream, method)(*args)
     
-    @pytest.mark.asyncio
-    async def test_connect_missing_command(self):
+    def test_connect_missing_command(self):
         """Test that missing command for stdio raises error"""
         # The validation happens in UpstreamConfig.__post_init__
         # so we can't even create the config without a command
         # This test verifies the config validation works
         with pytest.raises(ValueError, match="command is required"):
-            config = UpstreamConfig(transport='stdio')
-    
-    @pytest.mark.asyncio
-    async def test_fetch_tools_not_connected(self):
-        """Test that fetching tools before connection raises error"""
-        config = UpstreamConfig(
-            transport='stdio',
-            command='python'
-        )
-        
-        upstream = UpstreamConnection('test-upstream', config)
-        
-        with pytest.raises(RuntimeError, match="Not connected"):
-            await upstream.fetch_tools()
-    
-    @pytest.mark.asyncio
-    async def test_call_tool_not_connected(self):
-        """Test that calling tool before connection raises error"""
-        config = UpstreamConfig(
-            transport='stdio',
-            command='python'
-        )
-        
-        upstream = UpstreamConnection('test-upstream', config)
-        
-        with pytest.raises(RuntimeError, match="Not connected"):
-            await upstream.call_tool('test_tool', {})
+            UpstreamConfig(transport='stdio')
 
 
 class TestToolDiscoveryManager:
     """Tests for ToolDiscoveryManager class"""
     
-    def test_initialization(self):
+    def test_initialization(self, manager):
         """Test manager initialization"""
-        manager = ToolDiscoveryManager()
-        
         assert manager.upstreams == {}
         assert manager.all_tools == []
     
-    @pytest.mark.asyncio
-    async def test_initialize_missing_config(self):
-        """Test initialization with missing config file"""
-        manager = ToolDiscoveryManager()
-        
-        with pytest.raises(RuntimeError, match="Configuration loading failed"):
-            await manager.initialize('/nonexistent/config.json')
-    
-    @pytest.mark.asyncio
-    async def test_initialize_invalid_config(self):
-        """Test initialization with invalid config"""
-        # Create temporary invalid config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": "config"}')
-            config_path = f.name
-        
-        manager = ToolDiscoveryManager()
-        
-        try:
-            with pytest.raises(RuntimeError):
-                await manager.initialize(config_path)
-        finally:
-            import os
-            os.unlink(config_path)
-    
-    def test_get_all_tools(self):
+    def test_get_all_tools(self, manager, sample_tools):
         """Test getting all tools"""
-        manager = ToolDiscoveryManager()
-        
-        # Add some tools
-        tool1 = ToolMetadata(
-            name='upstream1.tool1',
-            original_name='tool1',
-            description='Test tool 1',
-            input_schema=JSONSchema(type='object'),
-            upstream_id='upstream1'
-        )
-        tool2 = ToolMetadata(
-            name='upstream2.tool2',
-            original_name='tool2',
-            description='Test tool 2',
-            input_schema=JSONSchema(type='object'),
-            upstream_id='upstream2'
-        )
-        
-        manager.all_tools = [tool1, tool2]
+        tool1, tool2 = sample_tools
+        manager.all_tools = list(sample_tools)
         
         # Get all tools
         tools = manager.get_all_tools()
         
-        assert len(tools) == 2
-        assert tools[0] == tool1
-        assert tools[1] == tool2
+        assert tools == (tool1, tool2)
+        assert isinstance(tools, tuple)
         
-        # Verify it's a copy
-        assert tools is not manager.all_tools
+        # The snapshot is reused until the catalog changes
+        assert manager.get_all_tools() is tools
+        manager.all_tools = [tool2]
+        assert manager.get_all_tools() == (tool2,)
     
-    def test_get_upstream(self):
-        """Test getting upstream by ID"""
-        manager = ToolDiscoveryManager()
+    def test_get_default_tool_subset_follows_catalog(self, manager, sample_tools):
+        """Test that the per-upstream indexes are rebuilt when the catalog is replaced"""
+        tool1, tool2 = sample_tools
+        manager.all_tools = [tool2, tool1]
         
-        config = UpstreamConfig(transport='stdio', command='python')
-        upstream = UpstreamConnection('test-upstream', config)
+        assert manager.get_default_tool_subset() == [tool1, tool2]
+        assert manager.get_default_tool_subset(max_tools=1) == [tool1]
+        
+        manager.all_tools = [tool2]
+        assert manager.get_default_tool_subset() == [tool2]
+    
+    def test_get_upstream(self, manager, stdio_config):
+        """Test getting upstream by ID"""
+        upstream = UpstreamConnection('test-upstream', stdio_config)
         
         manager.upstreams['test-upstream'] = upstream
         
@@ -165,26 +121,10 @@ class TestToolDiscoveryManager:
         result = manager.get_upstream('nonexistent')
         assert result is None
     
-    def test_get_tool_by_name(self):
+    def test_get_tool_by_name(self, manager, sample_tools):
         """Test finding tool by namespaced name"""
-        manager = ToolDiscoveryManager()
-        
-        tool1 = ToolMetadata(
-            name='upstream1.tool1',
-            original_name='tool1',
-            description='Test tool 1',
-            input_schema=JSONSchema(type='object'),
-            upstream_id='upstream1'
-        )
-        tool2 = ToolMetadata(
-            name='upstream2.tool2',
-            original_name='tool2',
-            description='Test tool 2',
-            input_schema=JSONSchema(type='object'),
-            upstream_id='upstream2'
-        )
-        
-        manager.all_tools = [tool1, tool2]
+        tool1 = sample_tools[0]
+        manager.all_tools = list(sample_tools)
         
         # Find existing tool
         result = manager.get_tool_by_name('upstream1.tool1')
@@ -194,68 +134,79 @@ class TestToolDiscoveryManager:
         result = manager.get_tool_by_name('nonexistent.tool')
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_shutdown(self):
-        """Test graceful shutdown"""
-        manager = ToolDiscoveryManager()
-        
-        # Create mock upstream
-        config = UpstreamConfig(transport='stdio', command='python')
-        upstream = UpstreamConnection('test-upstream', config)
-        upstream.disconnect = AsyncMock()
-        
-        manager.upstreams['test-upstream'] = upstream
-        manager.all_tools = [
-            ToolMetadata(
-                name='test.tool',
-                original_name='tool',
-                description='Test',
-                input_schema=JSONSchema(type='object'),
-                upstream_id='test-upstream'
-            )
-        ]
-        
-        # Shutdown
+    def test_get_tool_by_name_is_indexed(self, manager, sample_tools):
+        """Test that lookups use the name index instead of scanning all_tools"""
+        class CountingList(list):
+            iterations = 0
+            
+            def __iter__(self):
+                CountingList.iterations += 1
+                return super().__iter__()
+        
+        manager.all_tools = CountingList(sample_tools)
+        CountingList.iterations = 0
+        
+        assert manager.get_tool_by_name('upstream2.tool2') is sample_tools[1]
+        assert manager.get_tool_by_name('nonexistent.tool') is None
+        assert CountingList.iterations == 0
+    
+    async def test_shutdown_mixed(self, manager, stdio_config, sample_tool_single):
+        """Test shutdown disconnects all upstreams concurrently and suppresses errors"""
+        events = []
+        
+        def make_disconnect(upstream_id, fail):
+            async def fake_disconnect():
+                events.append(('start', upstream_id))
+                await asyncio.sleep(0)
+                events.append(('end', upstream_id))
+                if fail:
+                    raise Exception("Disconnect failed")
+            return fake_disconnect
+        
+        for i in range(5):
+            upstream = UpstreamConnection(f'u{i}', stdio_config)
+            upstream.disconnect = make_disconnect(upstream.upstream_id, fail=bool(i % 2))
+            manager.upstreams[upstream.upstream_id] = upstream
+        manager.all_tools = [sample_tool_single]
+        
+        # Shutdown should not raise even though some disconnects fail
         await manager.shutdown()
         
         # Verify cleanup
         assert manager.upstreams == {}
         assert manager.all_tools == []
-        upstream.disconnect.assert_called_once()
+        assert manager.get_tool_by_name('test.tool') is None
+        
+        # Every upstream was disconnected once, and all disconnects were in flight together
+        assert sorted(events) == sorted([(kind, f'u{i}') for kind in ('start', 'end') for i in range(5)])
+        assert [kind for kind, _ in events] == ['start'] * 5 + ['end'] * 5
     
-    @pytest.mark.asyncio
-    async def test_shutdown_with_error(self):
-        """Test shutdown handles disconnect errors gracefully"""
-        manager = ToolDiscoveryManager()
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    async def test_shutdown_n_upstreams(self, manager, stdio_config, n):
+        """Test shutdown disconnects every upstream exactly once"""
+        calls = {'n': 0}
         
-        # Create mock upstream that raises error on disconnect
-        config = UpstreamConfig(transport='stdio', command='python')
-        upstream = UpstreamConnection('test-upstream', config)
-        upstream.disconnect = AsyncMock(side_effect=Exception("Disconnect failed"))
+        async def fake_disconnect():
+            calls['n'] += 1
         
-        manager.upstreams['test-upstream'] = upstream
+        for i in range(n):
+            upstream = UpstreamConnection(f'upstream{i}', stdio_config)
+            upstream.disconnect = fake_disconnect
+            manager.upstreams[upstream.upstream_id] = upstream
         
-        # Shutdown should not raise error
         await manager.shutdown()
         
-        # Verify cleanup still happened
         assert manager.upstreams == {}
+        assert calls['n'] == n
 
 
 class TestToolDiscoveryIntegration:
     """Integration tests for tool discovery with mocked MCP connections"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="pending MCP client mocks")
     async def test_successful_discovery(self):
         """Test successful tool discovery from multiple upstreams"""
-        # This would require mocking the MCP client, which is complex
-        # For now, we'll skip this and rely on manual testing
-        # TODO: Implement with proper MCP mocking
-        pass
     
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="pending MCP client mocks")
     async def test_partial_failure(self):
         """Test that discovery continues when some upstreams fail"""
-        # This would require mocking the MCP client
-        # TODO: Implement with proper MCP mocking
-        pass
@@ -4,32 +4,167 @@ Unit tests for ToolDiscoveryManager dynamic loading functionality.
 Tests the refactored initialization pattern with auto_load configuration.
 """
 import asyncio
+import dataclasses
+import functools
+import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from typing import Dict, List
+from unittest.mock import AsyncMock
+from typing import Dict, List, Optional, Tuple, Union
 
-from mcp_router.core.config import RouterConfig, UpstreamConfig, LoadingConfig
+from mcp_router.core.config import RouterConfig, UpstreamConfig, LoadingConfig, construct_unvalidated
 from mcp_router.core.models import ToolMetadata, JSONSchema
 from mcp_router.discovery.manager import ToolDiscoveryManager
 from mcp_router.discovery.upstream import UpstreamConnection
 
 
-# Shared fixtures for all tests
+@functools.lru_cache(maxsize=None)
+def _npx_upstream(name: str, aliases: Tuple[str, ...] = ()) -> UpstreamConfig:
+    """Build (once) the stdio config for the '@{name}/mcp-server' npx package."""
+    return construct_unvalidated(
+        UpstreamConfig,
+        transport="stdio", command="npx", args=["-y", f"@{name}/mcp-server"], aliases=list(aliases)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_config(
+    upstream_names: Tuple[str, ...],
+    auto_load: Optional[Tuple[str, ...]] = None,
+    aliases: Tuple[Tuple[str, Tuple[str, ...]], ...] = (),
+    connection_timeout: int = 30
+) -> RouterConfig:
+    """
+    Build (once) a RouterConfig with an npx stdio upstream per name.
+    
+    Configs are frozen and never mutated by the tests, so each distinct config is
+    built once and shared. The test data is known to be valid, so validation is
+    skipped (config validation has its own tests). auto_load=None keeps the
+    LoadingConfig defaults; aliases holds (upstream name, aliases) pairs.
+    """
+    upstream_aliases = dict(aliases)
+    mcp_servers = {
+        name: _npx_upstream(name, upstream_aliases.get(name, ())) for name in upstream_names
+    }
+    if auto_load is None:
+        return construct_unvalidated(RouterConfig, mcp_servers=mcp_servers)
+    loading = construct_unvalidated(
+        LoadingConfig, auto_load=list(auto_load), connection_timeout=connection_timeout
+    )
+    return construct_unvalidated(RouterConfig, mcp_servers=mcp_servers, loading=loading)
+
+
+_PLAYWRIGHT = _npx_upstream("playwright")
+
+
+# Shared tool metadata, built once; the tests never mutate it
+_EMPTY_SCHEMA = JSONSchema(type="object", properties={})
+_NAVIGATE_TOOL = ToolMetadata(
+    name="playwright.navigate",
+    original_name="navigate",
+    description="Navigate to URL",
+    input_schema=_EMPTY_SCHEMA,
+    upstream_id="playwright"
+)
+_CLICK_TOOL = ToolMetadata(
+    name="playwright.click",
+    original_name="click",
+    description="Click element",
+    input_schema=_EMPTY_SCHEMA,
+    upstream_id="playwright"
+)
+_MOCK_TOOLS = (_NAVIGATE_TOOL, _CLICK_TOOL)
+_READ_FILE_TOOL = ToolMetadata(
+    name="filesystem.read_file",
+    original_name="read_file",
+    description="Read file",
+    input_schema=_EMPTY_SCHEMA,
+    upstream_id="filesystem"
+)
+_TEST_TOOL = ToolMetadata(
+    name="test.tool",
+    original_name="tool",
+    description="Test tool",
+    input_schema=_EMPTY_SCHEMA,
+    upstream_id="test"
+)
+
+
+class _RecordingLoader:
+    """
+    Stand-in for ToolDiscoveryManager.load_upstream (see load_upstream_fn).
+    
+    Records every requested name. Names listed in failures either raise the
+    given exception or report the given error string; all others succeed.
+    """
+    
+    def __init__(self, failures: Optional[Dict[str, Union[str, Exception]]] = None) -> None:
+        self.calls: List[str] = []
+        self.failures = failures or {}
+    
+    async def __call__(self, name: str) -> dict:
+        self.calls.append(name)
+        failure = self.failures.get(name)
+        if isinstance(failure, Exception):
+            raise failure
+        if failure is not None:
+            return {"success": False, "error": failure}
+        return {"success": True, "upstream": name, "tool_count": 5}
+
+
+class _ConnectBarrier:
+    """
+    connect_hook that blocks every connect() until `parties` of them are in flight.
+    
+    Checks concurrency without wall-clock timing: sequential connects never reach
+    the barrier and fail fast with asyncio.TimeoutError instead.
+    """
+    
+    def __init__(self, parties: int) -> None:
+        self.parties = parties
+        self.in_flight = 0
+        self.peak = 0
+        self._all_started = asyncio.Event()
+    
+    async def wait(self) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        if self.in_flight == self.parties:
+            self._all_started.set()
+        try:
+            await asyncio.wait_for(self._all_started.wait(), timeout=1)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(scope="module")
+def config_basic() -> RouterConfig:
+    """Default config with one upstream; classes needing another shape override it."""
+    return _make_config(("playwright",), ())
+
+
 @pytest.fixture
-def mock_embedding_engine():
-    """Create a mock EmbeddingEngine."""
-    engine = MagicMock()
-    engine.generate_tool_embeddings = AsyncMock(return_value=[])
-    return engine
+def make_manager(request, mock_embedding_engine, mock_search_engine):
+    """
+    Factory for managers over the per-test engine stubs.
+    
+    The config defaults to the class's config_basic fixture; keyword arguments
+    are passed on to ToolDiscoveryManager.
+    """
+    def _make(config: Optional[RouterConfig] = None, **kwargs) -> ToolDiscoveryManager:
+        if config is None:
+            config = request.getfixturevalue("config_basic")
+        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine, **kwargs)
+    return _make
 
 
 @pytest.fixture
-def mock_search_engine():
-    """Create a mock SemanticSearchEngine."""
-    engine = MagicMock()
-    engine.add_tools = MagicMock()
-    engine.remove_tools = MagicMock()
-    return engine
+async def loaded_manager(make_manager, patched_connection):
+    """(manager, connection) with 'playwright' already loaded through a stub connection."""
+    manager = make_manager()
+    connection = patched_connection(tools=[_NAVIGATE_TOOL])
+    result = await manager.load_upstream("playwright")
+    assert result["success"] is True
+    return manager, connection
 
 
 class TestInitializeAutoLoadAll:
@@ -38,73 +173,19 @@ class TestInitializeAutoLoadAll:
     @pytest.fixture
     def config_with_all(self) -> RouterConfig:
         """Create config with auto_load=['all'] and 3 upstreams."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                ),
-                "github": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@github/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=["all"],
-                lazy_load=True,
-                cache_embeddings=True,
-                connection_timeout=30,
-                max_concurrent_upstreams=10,
-                rate_limit=5
-            )
-        )
+        return _make_config(("playwright", "jira", "github"), ("all",))
     
-    @pytest.mark.asyncio
-    async def test_initialize_loads_all_upstreams(self, config_with_all, mock_embedding_engine, mock_search_engine):
+    async def test_initialize_loads_all_upstreams(self, make_manager, config_with_all):
         """Test that initialize() loads all upstreams when auto_load=['all']."""
-        manager = ToolDiscoveryManager(config_with_all, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream to track calls
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            return {"success": True, "upstream": name, "tool_count": 5}
-        
-        manager.load_upstream = mock_load_upstream
+        loader = _RecordingLoader()
+        manager = make_manager(config_with_all, load_upstream_fn=loader)
         
         # Initialize
         await manager.initialize()
         
         # Verify all upstreams were loaded
-        assert len(load_calls) == 3
-        assert "playwright" in load_calls
-        assert "jira" in load_calls
-        assert "github" in load_calls
-    
-    @pytest.mark.asyncio
-    async def test_initialize_handles_partial_failures(self, config_with_all, mock_embedding_engine, mock_search_engine):
-        """Test that initialize() continues loading even if some upstreams fail."""
-        manager = ToolDiscoveryManager(config_with_all, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream to fail for jira
-        async def mock_load_upstream(name: str) -> dict:
-            if name == "jira":
-                return {"success": False, "error": "Connection failed"}
-            return {"success": True, "upstream": name, "tool_count": 5}
-        
-        manager.load_upstream = mock_load_upstream
-        
-        # Initialize should not raise exception
-        await manager.initialize()
-        
-        # No assertion needed - test passes if no exception raised
+        assert len(loader.calls) == 3
+        assert sorted(loader.calls) == ["github", "jira", "playwright"]
 
 
 class TestInitializeAutoLoadSpecific:
@@ -113,96 +194,46 @@ class TestInitializeAutoLoadSpecific:
     @pytest.fixture
     def config_with_specific(self) -> RouterConfig:
         """Create config with auto_load=['playwright', 'jira']."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                ),
-                "github": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@github/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=["playwright", "jira"],
-                lazy_load=True,
-                cache_embeddings=True,
-                connection_timeout=30,
-                max_concurrent_upstreams=10,
-                rate_limit=5
-            )
-        )
+        return _make_config(("playwright", "jira", "github"), ("playwright", "jira"))
     
-    @pytest.mark.asyncio
-    async def test_initialize_loads_only_specified_upstreams(self, config_with_specific, mock_embedding_engine, mock_search_engine):
+    async def test_initialize_loads_only_specified_upstreams(self, make_manager, config_with_specific):
         """Test that initialize() loads only specified upstreams."""
-        manager = ToolDiscoveryManager(config_with_specific, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream to track calls
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            return {"success": True, "upstream": name, "tool_count": 5}
-        
-        manager.load_upstream = mock_load_upstream
+        loader = _RecordingLoader()
+        manager = make_manager(config_with_specific, load_upstream_fn=loader)
         
         # Initialize
         await manager.initialize()
         
         # Verify only specified upstreams were loaded
-        assert len(load_calls) == 2
-        assert "playwright" in load_calls
-        assert "jira" in load_calls
-        assert "github" not in load_calls
+        assert len(loader.calls) == 2
+        assert sorted(loader.calls) == ["jira", "playwright"]
     
-    @pytest.mark.asyncio
-    async def test_initialize_with_single_upstream(self):
+    async def test_initialize_with_single_upstream(self, make_manager):
         """Test initialize() with auto_load containing single upstream."""
-        config = RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=["playwright"])
-        )
+        config = _make_config(("playwright", "jira"), ("playwright",))
         
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
+        loader = _RecordingLoader()
+        manager = make_manager(config, load_upstream_fn=loader)
         
-        manager = ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
+        # Initialize
+        await manager.initialize()
         
-        # Mock load_upstream
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            return {"success": True, "upstream": name, "tool_count": 5}
+        # Verify only playwright was loaded
+        assert loader.calls == ["playwright"]
+    
+    async def test_initialize_loads_upstream_listed_by_name_and_alias_once(self, make_manager):
+        """Test that an upstream listed by name and by alias is loaded only once."""
+        config = _make_config(
+            ("playwright", "jira"), ("playwright", "browser", "jira"),
+            aliases=(("playwright", ("browser",)),)
+        )
         
-        manager.load_upstream = mock_load_upstream
+        loader = _RecordingLoader()
+        manager = make_manager(config, load_upstream_fn=loader)
         
-        # Initialize
         await manager.initialize()
         
-        # Verify only playwright was loaded
-        assert load_calls == ["playwright"]
+        assert loader.calls == ["playwright", "jira"]
 
 
 class TestInitializeAutoLoadEmpty:
@@ -211,73 +242,19 @@ class TestInitializeAutoLoadEmpty:
     @pytest.fixture
     def config_with_empty(self) -> RouterConfig:
         """Create config with auto_load=[]."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                lazy_load=True,
-                cache_embeddings=True,
-                connection_timeout=30,
-                max_concurrent_upstreams=10,
-                rate_limit=5
-            )
-        )
+        return _make_config(("playwright", "jira"), ())
     
-    @pytest.mark.asyncio
-    async def test_initialize_loads_no_upstreams(self, config_with_empty):
-        """Test that initialize() loads no upstreams when auto_load=[]."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_with_empty, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream to track calls
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            return {"success": True, "upstream": name, "tool_count": 5}
-        
-        manager.load_upstream = mock_load_upstream
+    async def test_initialize_loads_no_upstreams(self, make_manager, config_with_empty):
+        """Test that initialize() returns without calling load_upstream when auto_load=[]."""
+        loader = _RecordingLoader()
+        manager = make_manager(config_with_empty, load_upstream_fn=loader)
         
         # Initialize
         await manager.initialize()
         
-        # Verify no upstreams were loaded
-        assert len(load_calls) == 0
-    
-    @pytest.mark.asyncio
-    async def test_initialize_returns_immediately_with_empty_auto_load(self, config_with_empty):
-        """Test that initialize() returns immediately when auto_load=[]."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_with_empty, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream - should not be called
-        manager.load_upstream = AsyncMock()
-        
-        # Initialize
-        await manager.initialize()
-        
-        # Verify load_upstream was never called
-        manager.load_upstream.assert_not_called()
+        # Verify load_upstream was never called and nothing was loaded
+        assert loader.calls == []
+        assert manager.get_loaded_upstreams() == []
 
 
 class TestInitializeNoLoadingConfig:
@@ -286,51 +263,21 @@ class TestInitializeNoLoadingConfig:
     @pytest.fixture
     def config_without_loading(self) -> RouterConfig:
         """Create config without loading section (uses defaults)."""
-        config = RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                )
-            }
-        )
-        # Simulate missing loading config by setting to None
-        # (In practice, RouterConfig always has LoadingConfig with defaults,
-        # but we test the defensive code in initialize())
-        return config
+        # In practice RouterConfig always has a LoadingConfig with defaults, so
+        # this exercises the default auto_load=["all"] path of initialize()
+        return _make_config(("playwright", "jira"))
     
-    @pytest.mark.asyncio
-    async def test_initialize_defaults_to_all_when_no_loading_config(self, config_without_loading):
+    async def test_initialize_defaults_to_all_when_no_loading_config(self, make_manager, config_without_loading):
         """Test that initialize() defaults to loading all upstreams when loading config is None."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_without_loading, mock_embedding_engine, mock_search_engine)
-        
-        # Mock load_upstream to track calls
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            return {"success": True, "upstream": name, "tool_count": 5}
-        
-        manager.load_upstream = mock_load_upstream
+        loader = _RecordingLoader()
+        manager = make_manager(config_without_loading, load_upstream_fn=loader)
         
         # Initialize
         await manager.initialize()
         
         # Verify all upstreams were loaded (default behavior)
-        assert len(load_calls) == 2
-        assert "playwright" in load_calls
-        assert "jira" in load_calls
+        assert len(loader.calls) == 2
+        assert sorted(loader.calls) == ["jira", "playwright"]
 
 
 class TestInitializeExceptionHandling:
@@ -339,74 +286,193 @@ class TestInitializeExceptionHandling:
     @pytest.fixture
     def config_basic(self) -> RouterConfig:
         """Create basic config with 2 upstreams."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "jira": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@jira/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=["all"])
+        return _make_config(("playwright", "jira"), ("all",))
+    
+    @pytest.mark.parametrize("failure_mode", ["return_false", "raise"])
+    async def test_initialize_survives_loader_problems(
+        self, make_manager, failure_mode
+    ):
+        """Test that initialize() neither raises nor stops when the first upstream fails."""
+        failure = "Connection failed" if failure_mode == "return_false" else RuntimeError("Unexpected error")
+        loader = _RecordingLoader(failures={"playwright": failure})
+        manager = make_manager(load_upstream_fn=loader)
+        
+        # Initialize should not raise exception
+        await manager.initialize()
+        
+        # Verify both upstreams were attempted
+        assert len(loader.calls) == 2
+        assert sorted(loader.calls) == ["jira", "playwright"]
+
+
+class TestInitializeConcurrency:
+    """Test that initialize() loads upstreams concurrently within max_concurrent_upstreams."""
+    
+    @staticmethod
+    def _config(max_concurrent: int, auto_load: List[str]) -> RouterConfig:
+        """Create config with 5 upstreams and the given concurrency limit."""
+        return construct_unvalidated(
+            RouterConfig,
+            mcp_servers={f"upstream{i}": _PLAYWRIGHT for i in range(5)},
+            loading=construct_unvalidated(
+                LoadingConfig, auto_load=auto_load, max_concurrent_upstreams=max_concurrent
+            )
         )
     
-    @pytest.mark.asyncio
-    async def test_initialize_handles_load_upstream_exception(self, config_basic):
-        """Test that initialize() handles exceptions from load_upstream gracefully."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
+    @pytest.mark.parametrize("max_concurrent", [1, 2, 10])
+    async def test_initialize_bounds_concurrent_loads(
+        self, make_manager, max_concurrent
+    ):
+        """Test that at most max_concurrent_upstreams loads are in flight at once."""
+        in_flight = 0
+        peak = 0
+        loader = _RecordingLoader()
         
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        async def tracking_loader(name: str) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await loader(name)
         
-        # Mock load_upstream to raise exception for jira
-        async def mock_load_upstream(name: str) -> dict:
-            if name == "jira":
-                raise ConnectionError("Failed to connect to jira")
-            return {"success": True, "upstream": name, "tool_count": 5}
+        manager = make_manager(self._config(max_concurrent, ["all"]), load_upstream_fn=tracking_loader)
         
-        manager.load_upstream = mock_load_upstream
+        await manager.initialize()
+        
+        assert sorted(loader.calls) == [f"upstream{i}" for i in range(5)]
+        assert peak == min(max_concurrent, 5)
+    
+    async def test_initialize_loads_repeated_upstream_once(self, make_manager):
+        """Test that an upstream listed twice in auto_load is only loaded once."""
+        loader = _RecordingLoader()
+        manager = make_manager(
+            self._config(10, ["upstream0", "upstream1", "upstream0"]), load_upstream_fn=loader
+        )
         
-        # Initialize should not raise exception
         await manager.initialize()
         
-        # No assertion needed - test passes if no exception raised
+        assert sorted(loader.calls) == ["upstream0", "upstream1"]
+
+
+class _RefreshAbort(BaseException):
+    """Escapes load_one()'s error handling and so ends the background refresh."""
+
+
+class TestInitializeStaleWhileRevalidate:
+    """Test that initialize() serves a cached catalog while upstreams load in the background."""
+    
+    @staticmethod
+    def _config(cache_path, cache_embeddings: bool = True) -> RouterConfig:
+        """Create config with one auto-loaded upstream and the given tool cache."""
+        return construct_unvalidated(
+            RouterConfig,
+            mcp_servers={"playwright": _PLAYWRIGHT},
+            loading=construct_unvalidated(
+                LoadingConfig,
+                auto_load=["all"],
+                cache_embeddings=cache_embeddings,
+                tool_cache_path=str(cache_path)
+            )
+        )
     
-    @pytest.mark.asyncio
-    async def test_initialize_continues_after_exception(self, config_basic):
-        """Test that initialize() continues loading other upstreams after exception."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        """Tool cache pre-populated with _NAVIGATE_TOOL."""
+        path = tmp_path / "tools.json"
+        path.write_text(json.dumps({"tools": [{
+            "name": _NAVIGATE_TOOL.name,
+            "original_name": _NAVIGATE_TOOL.original_name,
+            "description": _NAVIGATE_TOOL.description,
+            "input_schema": _NAVIGATE_TOOL.input_schema.to_dict(),
+            "upstream_id": _NAVIGATE_TOOL.upstream_id
+        }]}))
+        return path
+    
+    async def test_cached_tools_served_when_loads_fail(self, make_manager, cache_path):
+        """Test that cached tools are available and kept when the refresh fails."""
+        loader = _RecordingLoader(failures={"playwright": "Connection failed"})
+        manager = make_manager(self._config(cache_path), load_upstream_fn=loader)
+        
+        await manager.initialize()
+        assert manager.get_tool_by_name("playwright.navigate") == _NAVIGATE_TOOL
         
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        await manager.wait_for_refresh()
+        assert loader.calls == ["playwright"]
+        assert [tool.name for tool in manager.get_all_tools()] == ["playwright.navigate"]
+    
+    async def test_initialize_returns_before_refresh(self, make_manager, cache_path):
+        """Test that initialize() does not wait for upstream loads when the cache is warm."""
+        release = asyncio.Event()
         
-        # Mock load_upstream to raise exception for first upstream
-        load_calls = []
-        async def mock_load_upstream(name: str) -> dict:
-            load_calls.append(name)
-            if name == "playwright":
-                raise RuntimeError("Unexpected error")
-            return {"success": True, "upstream": name, "tool_count": 5}
+        async def blocked_loader(name: str) -> dict:
+            await release.wait()
+            return {"success": True, "upstream": name, "tool_count": 0}
         
-        manager.load_upstream = mock_load_upstream
+        manager = make_manager(self._config(cache_path), load_upstream_fn=blocked_loader)
         
-        # Initialize
         await manager.initialize()
+        assert len(manager.get_all_tools()) == 1
         
-        # Verify both upstreams were attempted
-        assert len(load_calls) == 2
-        assert "playwright" in load_calls
-        assert "jira" in load_calls
+        release.set()
+        await manager.wait_for_refresh()
+    
+    async def test_live_load_replaces_cached_tools_and_rewrites_cache(
+        self, make_manager, cache_path, patched_connection, mock_search_engine
+    ):
+        """Test that a live load replaces the cached tools everywhere and rewrites the cache."""
+        manager = make_manager(self._config(cache_path))
+        
+        patched_connection(tools=[_CLICK_TOOL])
+        await manager.initialize()
+        await manager.wait_for_refresh()
+        
+        assert manager.get_all_tools() == (_CLICK_TOOL,)
+        assert manager.get_tool_by_name("playwright.navigate") is None
+        # The cached tools leave the search engine before the live ones are added
+        assert mock_search_engine.removed == ["playwright"]
+        assert mock_search_engine.added == [[_CLICK_TOOL]]
+        
+        cached = json.loads(cache_path.read_text())["tools"]
+        assert [entry["name"] for entry in cached] == ["playwright.click"]
+    
+    async def test_refresh_failure_is_logged(self, make_manager, cache_path, caplog):
+        """Test that an error ending the background refresh is logged, not lost."""
+        async def aborting_loader(name: str) -> dict:
+            raise _RefreshAbort()
+        
+        manager = make_manager(self._config(cache_path), load_upstream_fn=aborting_loader)
+        
+        await manager.initialize()
+        with pytest.raises(_RefreshAbort):
+            await manager.wait_for_refresh()
+        
+        assert "Background upstream refresh failed" in caplog.text
+    
+    async def test_shutdown_cancels_refresh(self, make_manager, cache_path):
+        """Test that shutdown() stops a refresh still in progress."""
+        async def hanging_loader(name: str) -> dict:
+            await asyncio.Event().wait()
+            return {"success": True, "upstream": name, "tool_count": 0}
+        
+        manager = make_manager(self._config(cache_path), load_upstream_fn=hanging_loader)
+        
+        await manager.initialize()
+        await manager.shutdown()
+        
+        assert manager.get_all_tools() == ()
+    
+    async def test_cache_ignored_when_disabled(self, make_manager, cache_path):
+        """Test that initialize() ignores the cache without cache_embeddings."""
+        loader = _RecordingLoader(failures={"playwright": "Connection failed"})
+        manager = make_manager(
+            self._config(cache_path, cache_embeddings=False), load_upstream_fn=loader
+        )
+        
+        await manager.initialize()
+        
+        assert loader.calls == ["playwright"]
+        assert manager.get_all_tools() == ()
 
 
 class TestInitializeLoadUpstreamStub:
@@ -415,99 +481,38 @@ class TestInitializeLoadUpstreamStub:
     @pytest.fixture
     def config_basic(self) -> RouterConfig:
         """Create basic config."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=["playwright"])
-        )
+        return _make_config(("playwright",), ("playwright",))
+    
+    @pytest.fixture(autouse=True)
+    def mock_upstream_connection(self, patched_connection):
+        """Patch UpstreamConnection to avoid real connections."""
+        return patched_connection(tools=[_NAVIGATE_TOOL])
     
-    @pytest.mark.asyncio
-    async def test_load_upstream_stub_returns_success(self, config_basic):
+    async def test_load_upstream_stub_returns_success(self, make_manager):
         """Test that load_upstream stub returns success dict."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection to avoid real connection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Call load_upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify returns expected format
-            assert result["success"] is True
-            assert result["upstream"] == "playwright"
-            assert result["tool_count"] == 1
-    
-    @pytest.mark.asyncio
-    async def test_initialize_uses_load_upstream_stub(self, config_basic):
+        manager = make_manager()
+        
+        # Call load_upstream
+        result = await manager.load_upstream("playwright")
+        
+        # Verify returns expected format
+        assert result["success"] is True
+        assert result["upstream"] == "playwright"
+        assert result["tool_count"] == 1
+    
+    async def test_initialize_uses_load_upstream_stub(self, make_manager):
         """Test that initialize() calls load_upstream stub."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection to avoid real connection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Spy on load_upstream method
-            original_load_upstream = manager.load_upstream
-            call_count = 0
-            
-            async def spy_load_upstream(name: str) -> dict:
-                nonlocal call_count
-                call_count += 1
-                return await original_load_upstream(name)
-            
-            manager.load_upstream = spy_load_upstream
-            
-            # Initialize
-            await manager.initialize()
-            
-            # Verify load_upstream was called once
-            assert call_count == 1
+        manager = make_manager()
+        
+        # Spy on load_upstream method
+        spy = AsyncMock(wraps=manager.load_upstream)
+        manager.load_upstream = spy
+        
+        # Initialize
+        await manager.initialize()
+        
+        # Verify load_upstream was called once
+        spy.assert_awaited_once_with("playwright")
 
 
 class TestInitializeAliasResolver:
@@ -516,28 +521,11 @@ class TestInitializeAliasResolver:
     @pytest.fixture
     def config_with_aliases(self) -> RouterConfig:
         """Create config with upstream aliases."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"],
-                    aliases=["browser", "web automation"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
+        return _make_config(("playwright",), (), aliases=(("playwright", ("browser", "web automation")),))
     
-    @pytest.mark.asyncio
-    async def test_alias_resolver_initialized_in_constructor(self, config_with_aliases):
+    def test_alias_resolver_initialized_in_constructor(self, make_manager, config_with_aliases):
         """Test that AliasResolver is initialized in __init__."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_with_aliases, mock_embedding_engine, mock_search_engine)
+        manager = make_manager(config_with_aliases)
         
         # Verify alias resolver exists
         assert manager._alias_resolver is not None
@@ -546,16 +534,9 @@ class TestInitializeAliasResolver:
         resolved = manager._alias_resolver.resolve("browser")
         assert resolved == "playwright"
     
-    @pytest.mark.asyncio
-    async def test_alias_resolver_available_during_initialize(self, config_with_aliases):
+    async def test_alias_resolver_available_during_initialize(self, make_manager, config_with_aliases):
         """Test that alias resolver is available during initialize()."""
-        # Create mock engines
-        mock_embedding_engine = MagicMock()
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(return_value=[])
-        mock_search_engine = MagicMock()
-        mock_search_engine.add_tools = MagicMock()
-        
-        manager = ToolDiscoveryManager(config_with_aliases, mock_embedding_engine, mock_search_engine)
+        manager = make_manager(config_with_aliases)
         
         # Initialize (should not raise exception)
         await manager.initialize()
@@ -573,200 +554,83 @@ class TestInitializeAliasResolver:
 class TestLoadUpstreamSuccess:
     """Test successful load_upstream() scenarios."""
     
-    @pytest.fixture
-    def config_basic(self) -> RouterConfig:
-        """Create basic config with one upstream."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                connection_timeout=30
-            )
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def mock_tools(self):
-        """Create mock tool list."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        return [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema=JSONSchema(type="object", properties={}),
-                upstream_id="playwright"
-            ),
-            ToolMetadata(
-                name="playwright.click",
-                original_name="click",
-                description="Click element",
-                input_schema=JSONSchema(type="object", properties={}),
-                upstream_id="playwright"
-            )
-        ]
-    
-    @pytest.mark.asyncio
     async def test_load_upstream_successful(
-        self, config_basic, mock_embedding_engine, mock_search_engine, mock_tools
+        self, make_manager, mock_embedding_engine, mock_search_engine, patched_connection
     ):
         """Test successful upstream loading."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=mock_tools)
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify success
-            assert result["success"] is True
-            assert result["upstream"] == "playwright"
-            assert result["tool_count"] == 2
-            
-            # Verify connection was created and connected
-            MockConnection.assert_called_once()
-            mock_connection.connect.assert_called_once()
-            
-            # Verify tools were fetched
-            mock_connection.fetch_tools.assert_called_once()
-            
-            # Verify embeddings were generated
-            mock_embedding_engine.generate_tool_embeddings.assert_called_once_with(mock_tools)
-            
-            # Verify tools were added to search engine
-            mock_search_engine.add_tools.assert_called_once_with(mock_tools)
-            
-            # Verify connection was stored
-            assert "playwright" in manager._loaded_upstreams
-            assert manager._loaded_upstreams["playwright"] == mock_connection
-            
-            # Verify tools were added to all_tools
-            assert len(manager.all_tools) == 2
-    
-    @pytest.mark.asyncio
+        manager = make_manager()
+        
+        # Patch UpstreamConnection
+        connection = patched_connection(tools=list(_MOCK_TOOLS))
+        
+        # Load upstream
+        result = await manager.load_upstream("playwright")
+        
+        # Verify success
+        assert result["success"] is True
+        assert result["upstream"] == "playwright"
+        assert result["tool_count"] == 2
+        
+        # Verify connection was created and connected
+        assert connection.created_for == ["playwright"]
+        assert connection.connect_calls == 1
+        
+        # Verify tools were fetched
+        assert connection.fetch_calls == 1
+        
+        # Verify embeddings were generated
+        assert mock_embedding_engine.embedded == [list(_MOCK_TOOLS)]
+        
+        # Verify tools were added to search engine
+        assert mock_search_engine.added == [list(_MOCK_TOOLS)]
+        
+        # Verify connection was stored
+        assert "playwright" in manager._loaded_upstreams
+        assert manager._loaded_upstreams["playwright"] is connection
+        
+        # Verify tools were added to all_tools
+        assert len(manager.all_tools) == 2
+        
+        # Verify the default subset is served from the upstream's sorted index
+        assert manager.get_default_tool_subset() == [_CLICK_TOOL, _NAVIGATE_TOOL]
+    
     async def test_load_upstream_with_alias(
-        self, mock_embedding_engine, mock_search_engine, mock_tools
+        self, make_manager, patched_connection
     ):
         """Test loading upstream using alias."""
-        config = RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"],
-                    aliases=["browser"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
+        config = _make_config(("playwright",), (), aliases=(("playwright", ("browser",)),))
+        
+        manager = make_manager(config)
         
-        manager = ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=mock_tools)
-            MockConnection.return_value = mock_connection
-            
-            # Load using alias
-            result = await manager.load_upstream("browser")
-            
-            # Verify success with canonical name
-            assert result["success"] is True
-            assert result["upstream"] == "playwright"
-            assert result["tool_count"] == 2
-            
-            # Verify stored under canonical name
-            assert "playwright" in manager._loaded_upstreams
+        # Patch UpstreamConnection
+        patched_connection(tools=list(_MOCK_TOOLS))
+        
+        # Load using alias
+        result = await manager.load_upstream("browser")
+        
+        # Verify success with canonical name
+        assert result["success"] is True
+        assert result["upstream"] == "playwright"
+        assert result["tool_count"] == 2
+        
+        # Verify stored under canonical name
+        assert "playwright" in manager._loaded_upstreams
 
 
 class TestLoadUpstreamIdempotent:
     """Test idempotent behavior of load_upstream()."""
     
-    @pytest.fixture
-    def config_basic(self) -> RouterConfig:
-        """Create basic config."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock()
-        return engine
-    
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock()
-        return engine
-    
-    @pytest.mark.asyncio
     async def test_load_already_loaded_upstream(
-        self, config_basic, mock_embedding_engine, mock_search_engine
+        self, make_manager, mock_embedding_engine, mock_search_engine, fake_connection
     ):
         """Test loading an already-loaded upstream returns immediately."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        manager = make_manager()
         
         # Pre-populate loaded upstreams
-        mock_connection = AsyncMock()
-        manager._loaded_upstreams["playwright"] = mock_connection
+        manager._loaded_upstreams["playwright"] = fake_connection()
         
         # Add some tools to all_tools
-        manager.all_tools = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate",
-                input_schema=JSONSchema(type="object", properties={}),
-                upstream_id="playwright"
-            ),
-            ToolMetadata(
-                name="playwright.click",
-                original_name="click",
-                description="Click",
-                input_schema=JSONSchema(type="object", properties={}),
-                upstream_id="playwright"
-            )
-        ]
+        manager.all_tools = list(_MOCK_TOOLS)
         
         # Load again
         result = await manager.load_upstream("playwright")
@@ -777,8 +641,8 @@ class TestLoadUpstreamIdempotent:
         assert result["tool_count"] == 2
         
         # Verify no new connection was created (embedding engine not called)
-        mock_embedding_engine.generate_tool_embeddings.assert_not_called()
-        mock_search_engine.add_tools.assert_not_called()
+        assert mock_embedding_engine.embedded == []
+        assert mock_search_engine.added == []
 
 
 class TestLoadUpstreamErrors:
@@ -787,207 +651,54 @@ class TestLoadUpstreamErrors:
     @pytest.fixture
     def config_basic(self) -> RouterConfig:
         """Create basic config."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                connection_timeout=5
-            )
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock()
-        return engine
+        return _make_config(("playwright",), (), connection_timeout=5)
     
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock()
-        return engine
-    
-    @pytest.mark.asyncio
-    async def test_load_invalid_upstream_name(
-        self, config_basic, mock_embedding_engine, mock_search_engine
+    @pytest.mark.parametrize("name", ["nonexistent", "invalid_alias"])
+    async def test_load_unknown_upstream_or_alias(
+        self, make_manager, name
     ):
-        """Test loading non-existent upstream."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        """Test loading a name that is neither an upstream nor an alias."""
+        manager = make_manager()
         
-        # Load invalid upstream
-        result = await manager.load_upstream("nonexistent")
+        result = await manager.load_upstream(name)
         
-        # Verify failure
+        # Verify failure (alias resolver raises ValueError)
         assert result["success"] is False
         assert "Unknown upstream or alias" in result["error"]
     
-    @pytest.mark.asyncio
-    async def test_load_connection_timeout(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
-        """Test connection timeout handling."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection with timeout
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock(side_effect=asyncio.TimeoutError())
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "timeout" in result["error"].lower()
-    
-    @pytest.mark.asyncio
-    async def test_load_connection_failure(
-        self, config_basic, mock_embedding_engine, mock_search_engine
+    @pytest.mark.parametrize("failure_point,exc,error_sub,disconnects", [
+        ("connect", asyncio.TimeoutError(), "Connection timeout", 0),
+        ("connect", ConnectionError("Connection refused"), "Connection failed", 0),
+        ("fetch", RuntimeError("Fetch failed"), "Failed to fetch tools", 1),
+        ("embed", RuntimeError("Embedding failed"), "Failed to generate embeddings", 1),
+        ("search", ValueError("Duplicate tool"), "Failed to add tools to search engine", 1),
+    ])
+    async def test_load_error_paths(
+        self, make_manager, mock_embedding_engine, mock_search_engine, patched_connection,
+        failure_point, exc, error_sub, disconnects
     ):
-        """Test connection failure handling."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection with connection error
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock(side_effect=ConnectionError("Connection refused"))
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "Connection failed" in result["error"]
-    
-    @pytest.mark.asyncio
-    async def test_load_fetch_tools_failure(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
-        """Test tool fetch failure handling."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection with fetch_tools error
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(side_effect=RuntimeError("Fetch failed"))
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "Failed to fetch tools" in result["error"]
-            
-            # Verify connection was disconnected
-            mock_connection.disconnect.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_load_embedding_generation_failure(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
-        """Test embedding generation failure handling."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock embedding engine to fail
-        mock_embedding_engine.generate_tool_embeddings = AsyncMock(
-            side_effect=RuntimeError("Embedding failed")
+        """Test that a failure at each load step is reported and cleans up the connection."""
+        manager = make_manager()
+        
+        # Inject the failure at the requested step
+        connection = patched_connection(
+            tools=[_NAVIGATE_TOOL],
+            connect_exc=exc if failure_point == "connect" else None,
+            fetch_exc=exc if failure_point == "fetch" else None,
         )
+        if failure_point == "embed":
+            mock_embedding_engine.embed_exc = exc
+        elif failure_point == "search":
+            mock_search_engine.add_exc = exc
         
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "Failed to generate embeddings" in result["error"]
-            
-            # Verify connection was disconnected
-            mock_connection.disconnect.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_load_search_engine_failure(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
-        """Test search engine add_tools failure handling."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock search engine to fail
-        mock_search_engine.add_tools = MagicMock(side_effect=ValueError("Duplicate tool"))
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            result = await manager.load_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "Failed to add tools to search engine" in result["error"]
-            
-            # Verify connection was disconnected
-            mock_connection.disconnect.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_load_alias_resolution_error(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
-        """Test alias resolution error handling."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Try to load with invalid alias
-        result = await manager.load_upstream("invalid_alias")
+        result = await manager.load_upstream("playwright")
         
-        # Verify failure (alias resolver will raise ValueError)
+        # Verify failure, cleanup, and that nothing was registered
         assert result["success"] is False
-        # Error message should contain info about invalid alias
-        assert "error" in result
+        assert error_sub in result["error"]
+        assert connection.disconnect_calls == disconnects
+        assert not manager.is_loaded("playwright")
+        assert manager.all_tools == []
 
 
 
@@ -997,136 +708,56 @@ class TestUnloadUpstreamSuccess:
     @pytest.fixture
     def config_basic(self) -> RouterConfig:
         """Create basic config with one upstream and aliases."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"],
-                    aliases=["browser"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                connection_timeout=30
-            )
-        )
+        return _make_config(("playwright",), (), aliases=(("playwright", ("browser",)),))
     
-    @pytest.mark.asyncio
-    async def test_unload_upstream_successful(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
+    async def test_unload_upstream_successful(self, loaded_manager, mock_search_engine):
         """Test successful unload of a loaded upstream."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream first
-            load_result = await manager.load_upstream("playwright")
-            assert load_result["success"] is True
-            
-            # Verify upstream is loaded
-            assert "playwright" in manager._loaded_upstreams
-            assert "playwright" in manager.upstreams
-            
-            # Unload upstream
-            unload_result = await manager.unload_upstream("playwright")
-            
-            # Verify success
-            assert unload_result["success"] is True
-            assert unload_result["upstream"] == "playwright"
-            
-            # Verify upstream is unloaded
-            assert "playwright" not in manager._loaded_upstreams
-            assert "playwright" not in manager.upstreams
-            
-            # Verify connection was disconnected
-            mock_connection.disconnect.assert_called()
-            
-            # Verify tools were removed from search engine
-            mock_search_engine.remove_tools.assert_called_once_with("playwright")
-    
-    @pytest.mark.asyncio
-    async def test_unload_upstream_with_alias(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
+        manager, connection = loaded_manager
+        
+        # Verify upstream is loaded
+        assert "playwright" in manager._loaded_upstreams
+        assert "playwright" in manager.upstreams
+        
+        # Unload upstream
+        unload_result = await manager.unload_upstream("playwright")
+        
+        # Verify success
+        assert unload_result["success"] is True
+        assert unload_result["upstream"] == "playwright"
+        
+        # Verify upstream is unloaded
+        assert "playwright" not in manager._loaded_upstreams
+        assert "playwright" not in manager.upstreams
+        
+        # Verify connection was disconnected
+        assert connection.disconnect_calls == 1
+        
+        # Verify tools were removed from search engine
+        assert mock_search_engine.removed == ["playwright"]
+    
+    async def test_unload_upstream_with_alias(self, loaded_manager):
         """Test unload using an alias."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            await manager.load_upstream("playwright")
-            
-            # Unload using alias
-            result = await manager.unload_upstream("browser")
-            
-            # Verify success
-            assert result["success"] is True
-            assert result["upstream"] == "playwright"
-            
-            # Verify upstream is unloaded
-            assert "playwright" not in manager._loaded_upstreams
+        manager, _ = loaded_manager
+        
+        # Unload using alias
+        result = await manager.unload_upstream("browser")
+        
+        # Verify success
+        assert result["success"] is True
+        assert result["upstream"] == "playwright"
+        
+        # Verify upstream is unloaded
+        assert "playwright" not in manager._loaded_upstreams
 
 
 class TestUnloadUpstreamIdempotent:
     """Test idempotent behavior of unload_upstream()."""
     
-    @pytest.fixture
-    def config_basic(self) -> RouterConfig:
-        """Create basic config with one upstream."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                connection_timeout=30
-            )
-        )
-    
-    @pytest.mark.asyncio
     async def test_unload_not_loaded_upstream(
-        self, config_basic, mock_embedding_engine, mock_search_engine
+        self, make_manager, mock_search_engine
     ):
         """Test unloading an upstream that is not loaded."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        manager = make_manager()
         
         # Unload upstream that was never loaded
         result = await manager.unload_upstream("playwright")
@@ -1136,74 +767,32 @@ class TestUnloadUpstreamIdempotent:
         assert result["upstream"] == "playwright"
         
         # Verify search engine remove_tools was not called
-        mock_search_engine.remove_tools.assert_not_called()
+        assert mock_search_engine.removed == []
     
-    @pytest.mark.asyncio
-    async def test_unload_twice(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
+    async def test_unload_twice(self, loaded_manager, mock_search_engine):
         """Test unloading the same upstream twice."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            await manager.load_upstream("playwright")
-            
-            # Unload first time
-            result1 = await manager.unload_upstream("playwright")
-            assert result1["success"] is True
-            
-            # Unload second time
-            result2 = await manager.unload_upstream("playwright")
-            assert result2["success"] is True
-            
-            # Verify search engine remove_tools was called only once
-            assert mock_search_engine.remove_tools.call_count == 1
+        manager, _ = loaded_manager
+        
+        # Unload first time
+        result1 = await manager.unload_upstream("playwright")
+        assert result1["success"] is True
+        
+        # Unload second time
+        result2 = await manager.unload_upstream("playwright")
+        assert result2["success"] is True
+        
+        # Verify search engine remove_tools was called only once
+        assert len(mock_search_engine.removed) == 1
 
 
 class TestUnloadUpstreamErrors:
     """Test error handling in unload_upstream()."""
     
-    @pytest.fixture
-    def config_basic(self) -> RouterConfig:
-        """Create basic config with one upstream."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(
-                auto_load=[],
-                connection_timeout=30
-            )
-        )
-    
-    @pytest.mark.asyncio
     async def test_unload_invalid_upstream_name(
-        self, config_basic, mock_embedding_engine, mock_search_engine
+        self, make_manager
     ):
         """Test unloading with invalid upstream name."""
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
+        manager = make_manager()
         
         # Unload invalid upstream
         result = await manager.unload_upstream("nonexistent")
@@ -1212,84 +801,37 @@ class TestUnloadUpstreamErrors:
         assert result["success"] is False
         assert "Unknown upstream or alias" in result["error"]
     
-    @pytest.mark.asyncio
-    async def test_unload_search_engine_failure(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
+    async def test_unload_search_engine_failure(self, loaded_manager, mock_search_engine):
         """Test handling of search engine remove_tools failure."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            await manager.load_upstream("playwright")
-            
-            # Mock search engine to fail on remove_tools
-            mock_search_engine.remove_tools = MagicMock(side_effect=RuntimeError("Remove failed"))
-            
-            # Unload upstream
-            result = await manager.unload_upstream("playwright")
-            
-            # Verify failure
-            assert result["success"] is False
-            assert "Failed to remove tools from search engine" in result["error"]
-            
-            # Verify upstream is still in loaded set (rollback)
-            assert "playwright" in manager._loaded_upstreams
-    
-    @pytest.mark.asyncio
-    async def test_unload_disconnect_failure_continues(
-        self, config_basic, mock_embedding_engine, mock_search_engine
-    ):
+        manager, _ = loaded_manager
+        
+        # Mock search engine to fail on remove_tools
+        mock_search_engine.remove_exc = RuntimeError("Remove failed")
+        
+        # Unload upstream
+        result = await manager.unload_upstream("playwright")
+        
+        # Verify failure
+        assert result["success"] is False
+        assert "Failed to remove tools from search engine" in result["error"]
+        
+        # Verify upstream is still in loaded set (rollback)
+        assert "playwright" in manager._loaded_upstreams
+    
+    async def test_unload_disconnect_failure_continues(self, loaded_manager):
         """Test that disconnect failure doesn't prevent unload."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        manager = ToolDiscoveryManager(config_basic, mock_embedding_engine, mock_search_engine)
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="playwright.navigate",
-                    original_name="navigate",
-                    description="Navigate to URL",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="playwright"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock(side_effect=RuntimeError("Disconnect failed"))
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream
-            await manager.load_upstream("playwright")
-            
-            # Unload upstream (disconnect will fail but should continue)
-            result = await manager.unload_upstream("playwright")
-            
-            # Verify success (disconnect failure is logged but doesn't fail unload)
-            assert result["success"] is True
-            assert result["upstream"] == "playwright"
-            
-            # Verify upstream is unloaded despite disconnect failure
-            assert "playwright" not in manager._loaded_upstreams
+        manager, connection = loaded_manager
+        connection.disconnect_exc = RuntimeError("Disconnect failed")
+        
+        # Unload upstream (disconnect will fail but should continue)
+        result = await manager.unload_upstream("playwright")
+        
+        # Verify success (disconnect failure is logged but doesn't fail unload)
+        assert result["success"] is True
+        assert result["upstream"] == "playwright"
+        
+        # Verify upstream is unloaded despite disconnect failure
+        assert "playwright" not in manager._loaded_upstreams
 
 
 
@@ -1303,210 +845,85 @@ class TestStatusMethods:
     @pytest.fixture
     def config(self) -> RouterConfig:
         """Create config with 3 upstreams and aliases."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"],
-                    aliases=["browser"]
-                ),
-                "filesystem": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@filesystem/mcp-server"]
-                ),
-                "github": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@github/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
+        return _make_config(("playwright", "filesystem", "github"), (), aliases=(("playwright", ("browser",)),))
     
     @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        engine.remove_tools = MagicMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def manager(self, config, mock_embedding_engine, mock_search_engine):
+    def manager(self, make_manager, config):
         """Create ToolDiscoveryManager instance."""
-        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
+        return make_manager(config)
     
-    @pytest.fixture
-    def mock_upstream_connection(self):
-        """Create mock UpstreamConnection that can be configured per test."""
-        mock_connection = AsyncMock()
-        mock_connection.connect = AsyncMock()
-        mock_connection.fetch_tools = AsyncMock(return_value=[])
-        mock_connection.disconnect = AsyncMock()
-        return mock_connection
-    
-    @pytest.mark.asyncio
-    async def test_get_loaded_upstreams_empty(self, manager):
+    def test_get_loaded_upstreams_empty(self, manager):
         """Test get_loaded_upstreams() returns empty list when no upstreams loaded"""
         loaded = manager.get_loaded_upstreams()
         assert loaded == []
     
-    @pytest.mark.asyncio
-    async def test_get_loaded_upstreams_single(self, manager, mock_upstream_connection):
+    async def test_get_loaded_upstreams_single(self, manager, patched_connection):
         """Test get_loaded_upstreams() returns single upstream"""
-        # Configure mock connection
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema={"type": "object"},
-                upstream_id="playwright"
-            )
-        ]
-        
-        # Patch UpstreamConnection and load upstream
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("playwright")
+        patched_connection(tools=[_NAVIGATE_TOOL])
+        await manager.load_upstream("playwright")
         
         # Verify loaded upstreams
         loaded = manager.get_loaded_upstreams()
         assert loaded == ["playwright"]
     
-    @pytest.mark.asyncio
-    async def test_get_loaded_upstreams_multiple(self, manager, mock_upstream_connection):
+    async def test_get_loaded_upstreams_multiple(self, manager, patched_connection):
         """Test get_loaded_upstreams() returns multiple upstreams"""
-        # Configure mock connection for playwright
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema={"type": "object"},
-                upstream_id="playwright"
-            )
-        ]
-        
-        # Patch and load playwright
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("playwright")
-        
-        # Configure mock connection for filesystem
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="filesystem.read_file",
-                original_name="read_file",
-                description="Read file",
-                input_schema={"type": "object"},
-                upstream_id="filesystem"
-            )
-        ]
+        patched_connection(tools=[_NAVIGATE_TOOL])
+        await manager.load_upstream("playwright")
         
-        # Patch and load filesystem
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("filesystem")
+        patched_connection(tools=[_READ_FILE_TOOL])
+        await manager.load_upstream("filesystem")
         
         # Verify loaded upstreams
         loaded = manager.get_loaded_upstreams()
-        assert set(loaded) == {"playwright", "filesystem"}
+        assert sorted(loaded) == ["filesystem", "playwright"]
         assert len(loaded) == 2
     
-    @pytest.mark.asyncio
-    async def test_is_loaded_true(self, manager, mock_upstream_connection):
+    async def test_is_loaded_true(self, manager, patched_connection):
         """Test is_loaded() returns True for loaded upstream"""
-        # Configure mock connection
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema={"type": "object"},
-                upstream_id="playwright"
-            )
-        ]
-        
-        # Patch and load upstream
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("playwright")
+        patched_connection(tools=[_NAVIGATE_TOOL])
+        await manager.load_upstream("playwright")
         
         # Verify is_loaded returns True
         assert manager.is_loaded("playwright") is True
     
-    @pytest.mark.asyncio
-    async def test_is_loaded_false(self, manager):
+    def test_is_loaded_false(self, manager):
         """Test is_loaded() returns False for not loaded upstream"""
         # Verify is_loaded returns False
         assert manager.is_loaded("playwright") is False
     
-    @pytest.mark.asyncio
-    async def test_is_loaded_with_alias(self, manager, mock_upstream_connection):
+    async def test_is_loaded_with_alias(self, manager, patched_connection):
         """Test is_loaded() works with aliases"""
-        # Configure mock connection
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema={"type": "object"},
-                upstream_id="playwright"
-            )
-        ]
-        
-        # Patch and load upstream
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("playwright")
+        patched_connection(tools=[_NAVIGATE_TOOL])
+        await manager.load_upstream("playwright")
         
         # Verify is_loaded works with alias
         assert manager.is_loaded("browser") is True  # "browser" is alias for "playwright"
     
-    @pytest.mark.asyncio
-    async def test_is_loaded_invalid_name(self, manager):
+    def test_is_loaded_invalid_name(self, manager):
         """Test is_loaded() returns False for invalid upstream name"""
         # Verify is_loaded returns False for invalid name
         assert manager.is_loaded("nonexistent") is False
     
-    @pytest.mark.asyncio
-    async def test_get_available_upstreams(self, manager):
+    def test_get_available_upstreams(self, manager):
         """Test get_available_upstreams() returns all upstreams from config"""
         # Get available upstreams
         available = manager.get_available_upstreams()
         
         # Verify all upstreams from config are returned
-        assert set(available) == {"playwright", "filesystem", "github"}
+        assert sorted(available) == ["filesystem", "github", "playwright"]
         assert len(available) == 3
     
-    @pytest.mark.asyncio
-    async def test_get_available_upstreams_independent_of_loaded(self, manager, mock_upstream_connection):
+    async def test_get_available_upstreams_independent_of_loaded(self, manager, patched_connection):
         """Test get_available_upstreams() returns all upstreams regardless of loaded state"""
-        # Configure mock connection
-        mock_upstream_connection.fetch_tools.return_value = [
-            ToolMetadata(
-                name="playwright.navigate",
-                original_name="navigate",
-                description="Navigate to URL",
-                input_schema={"type": "object"},
-                upstream_id="playwright"
-            )
-        ]
-        
-        # Patch and load one upstream
-        with patch('mcp_router.discovery.manager.UpstreamConnection', return_value=mock_upstream_connection):
-            await manager.load_upstream("playwright")
+        patched_connection(tools=[_NAVIGATE_TOOL])
+        await manager.load_upstream("playwright")
         
         # Get available upstreams
         available = manager.get_available_upstreams()
         
         # Verify all upstreams are still returned (not just loaded ones)
-        assert set(available) == {"playwright", "filesystem", "github"}
+        assert sorted(available) == ["filesystem", "github", "playwright"]
         assert len(available) == 3
 
 
@@ -1514,118 +931,50 @@ class TestStatusMethods:
 # Task 9: load_multiple_upstreams() Tests
 # ============================================================================
 
-class TestLoadMultipleUpstreamsSuccess:
-    """Test successful load_multiple_upstreams() operations."""
+class TestLoadMultipleUpstreams:
+    """Test load_multiple_upstreams(): success, partial and total failure, concurrency."""
     
     @pytest.fixture
     def config(self) -> RouterConfig:
-        """Create config with multiple upstreams and aliases."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"],
-                    aliases=["browser"]
-                ),
-                "filesystem": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@filesystem/mcp-server"],
-                    aliases=["fs"]
-                ),
-                "github": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@github/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
+        """Create config with multiple upstreams, some with aliases."""
+        return _make_config(
+            ("playwright", "filesystem", "github", "upstream1", "upstream2", "upstream3"), (),
+            aliases=(("playwright", ("browser",)), ("filesystem", ("fs",)))
         )
     
     @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        engine.remove_tools = MagicMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def manager(self, config, mock_embedding_engine, mock_search_engine):
+    def manager(self, make_manager, config):
         """Create ToolDiscoveryManager instance."""
-        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
+        return make_manager(config)
     
-    @pytest.mark.asyncio
-    async def test_load_multiple_upstreams_all_succeed(self, manager):
+    async def test_load_multiple_upstreams_all_succeed(self, manager, patched_connection):
         """Test loading multiple upstreams successfully."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load multiple upstreams
-            result = await manager.load_multiple_upstreams(["playwright", "filesystem"])
-            
-            # Verify all succeeded
-            assert len(result["loaded"]) == 2
-            assert set(result["loaded"]) == {"playwright", "filesystem"}
-            assert len(result["failed"]) == 0
-            
-            # Verify both are loaded
-            assert manager.is_loaded("playwright")
-            assert manager.is_loaded("filesystem")
-    
-    @pytest.mark.asyncio
-    async def test_load_multiple_upstreams_with_aliases(self, manager):
+        patched_connection(tools=[_TEST_TOOL])
+        
+        # Load multiple upstreams
+        result = await manager.load_multiple_upstreams(["playwright", "filesystem"])
+        
+        # Verify all succeeded
+        assert len(result["loaded"]) == 2
+        assert sorted(result["loaded"]) == ["filesystem", "playwright"]
+        assert len(result["failed"]) == 0
+        
+        # Verify both are loaded
+        assert manager.is_loaded("playwright")
+        assert manager.is_loaded("filesystem")
+    
+    async def test_load_multiple_upstreams_with_aliases(self, manager, patched_connection):
         """Test loading multiple upstreams using aliases."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load using aliases
-            result = await manager.load_multiple_upstreams(["browser", "fs"])
-            
-            # Verify all succeeded (canonical names returned)
-            assert len(result["loaded"]) == 2
-            assert set(result["loaded"]) == {"playwright", "filesystem"}
-            assert len(result["failed"]) == 0
-    
-    @pytest.mark.asyncio
+        patched_connection(tools=[_TEST_TOOL])
+        
+        # Load using aliases
+        result = await manager.load_multiple_upstreams(["browser", "fs"])
+        
+        # Verify all succeeded (canonical names returned)
+        assert len(result["loaded"]) == 2
+        assert sorted(result["loaded"]) == ["filesystem", "playwright"]
+        assert len(result["failed"]) == 0
+    
     async def test_load_multiple_upstreams_empty_list(self, manager):
         """Test loading empty list of upstreams."""
         # Load empty list
@@ -1635,225 +984,80 @@ class TestLoadMultipleUpstreamsSuccess:
         assert result["loaded"] == []
         assert result["failed"] == []
     
-    @pytest.mark.asyncio
-    async def test_load_multiple_upstreams_single(self, manager):
+    async def test_load_multiple_upstreams_single(self, manager, patched_connection):
         """Test loading single upstream via load_multiple_upstreams."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load single upstream
-            result = await manager.load_multiple_upstreams(["playwright"])
-            
-            # Verify success
-            assert result["loaded"] == ["playwright"]
-            assert result["failed"] == []
-
-
-class TestLoadMultipleUpstreamsPartialFailure:
-    """Test load_multiple_upstreams() with partial failures."""
-    
-    @pytest.fixture
-    def config(self) -> RouterConfig:
-        """Create config with multiple upstreams."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "filesystem": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@filesystem/mcp-server"]
-                ),
-                "github": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@github/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def manager(self, config, mock_embedding_engine, mock_search_engine):
-        """Create ToolDiscoveryManager instance."""
-        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
+        patched_connection(tools=[_TEST_TOOL])
+        
+        # Load single upstream
+        result = await manager.load_multiple_upstreams(["playwright"])
+        
+        # Verify success
+        assert result["loaded"] == ["playwright"]
+        assert result["failed"] == []
     
-    @pytest.mark.asyncio
-    async def test_load_multiple_some_succeed_some_fail(self, manager):
+    async def test_load_multiple_some_succeed_some_fail(self, manager, monkeypatch, fake_connection):
         """Test loading multiple upstreams where some succeed and some fail."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection with different behaviors
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            # Track which upstream_id is being created
-            def create_connection(upstream_id, config):
-                """Create mock connection - note: first arg is upstream_id, second is config."""
-                mock_connection = AsyncMock()
-                
-                if upstream_id == "filesystem":
-                    # Fail connection for filesystem
-                    mock_connection.connect = AsyncMock(side_effect=ConnectionError("Connection refused"))
-                else:
-                    # Succeed for others
-                    mock_connection.connect = AsyncMock()
-                    mock_connection.fetch_tools = AsyncMock(return_value=[
-                        ToolMetadata(
-                            name=f"{upstream_id}.tool",
-                            original_name="tool",
-                            description="Test tool",
-                            input_schema=JSONSchema(type="object", properties={}),
-                            upstream_id=upstream_id
-                        )
-                    ])
-                mock_connection.disconnect = AsyncMock()
-                return mock_connection
-            
-            MockConnection.side_effect = create_connection
-            
-            # Load multiple upstreams
-            result = await manager.load_multiple_upstreams(["playwright", "filesystem", "github"])
-            
-            # Verify partial success
-            assert len(result["loaded"]) == 2
-            assert set(result["loaded"]) == {"playwright", "github"}
-            
-            # Verify partial failure
-            assert len(result["failed"]) == 1
-            assert result["failed"][0]["name"] == "filesystem"
-            assert "Connection failed" in result["failed"][0]["error"] or "Connection refused" in result["failed"][0]["error"]
-    
-    @pytest.mark.asyncio
-    async def test_load_multiple_with_invalid_alias(self, manager):
-        """Test loading multiple upstreams with invalid alias."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
+        def create_connection(upstream_id, config):
+            """Fail the connection for filesystem, succeed for the others."""
+            if upstream_id == "filesystem":
+                return fake_connection(connect_exc=ConnectionError("Connection refused"))
+            return fake_connection(tools=[
+                dataclasses.replace(_TEST_TOOL, name=f"{upstream_id}.tool", upstream_id=upstream_id)
             ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load with one valid and one invalid name
-            result = await manager.load_multiple_upstreams(["playwright", "invalid_name"])
-            
-            # Verify partial success
-            assert len(result["loaded"]) == 1
-            assert result["loaded"] == ["playwright"]
-            
-            # Verify partial failure (alias resolution failed)
-            assert len(result["failed"]) == 1
-            assert result["failed"][0]["name"] == "invalid_name"
-            assert "Unknown upstream or alias" in result["failed"][0]["error"]
-
-
-class TestLoadMultipleUpstreamsAllFail:
-    """Test load_multiple_upstreams() where all loads fail."""
-    
-    @pytest.fixture
-    def config(self) -> RouterConfig:
-        """Create config with multiple upstreams."""
-        return RouterConfig(
-            mcp_servers={
-                "playwright": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@playwright/mcp-server"]
-                ),
-                "filesystem": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@filesystem/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        return engine
+        
+        monkeypatch.setattr('mcp_router.discovery.manager.UpstreamConnection', create_connection)
+        
+        # Load multiple upstreams
+        result = await manager.load_multiple_upstreams(["playwright", "filesystem", "github"])
+        
+        # Verify partial success
+        assert len(result["loaded"]) == 2
+        assert sorted(result["loaded"]) == ["github", "playwright"]
+        
+        # Verify partial failure
+        assert len(result["failed"]) == 1
+        assert result["failed"][0]["name"] == "filesystem"
+        assert "Connection failed" in result["failed"][0]["error"] or "Connection refused" in result["failed"][0]["error"]
     
-    @pytest.fixture
-    def manager(self, config, mock_embedding_engine, mock_search_engine):
-        """Create ToolDiscoveryManager instance."""
-        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
+    async def test_load_multiple_with_invalid_alias(self, manager, patched_connection):
+        """Test loading multiple upstreams with invalid alias."""
+        patched_connection(tools=[_TEST_TOOL])
+        
+        # Load with one valid and one invalid name
+        result = await manager.load_multiple_upstreams(["playwright", "invalid_name"])
+        
+        # Verify partial success
+        assert len(result["loaded"]) == 1
+        assert result["loaded"] == ["playwright"]
+        
+        # Verify partial failure (alias resolution failed)
+        assert len(result["failed"]) == 1
+        assert result["failed"][0]["name"] == "invalid_name"
+        assert "Unknown upstream or alias" in result["failed"][0]["error"]
     
-    @pytest.mark.asyncio
-    async def test_load_multiple_all_fail_connection(self, manager):
+    async def test_load_multiple_all_fail_connection(self, manager, patched_connection):
         """Test loading multiple upstreams where all fail to connect."""
-        # Mock UpstreamConnection to always fail
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock(side_effect=ConnectionError("Connection refused"))
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load multiple upstreams
-            result = await manager.load_multiple_upstreams(["playwright", "filesystem"])
-            
-            # Verify all failed
-            assert len(result["loaded"]) == 0
-            assert len(result["failed"]) == 2
-            
-            # Verify error messages
-            failed_names = {f["name"] for f in result["failed"]}
-            assert failed_names == {"playwright", "filesystem"}
-            
-            for failure in result["failed"]:
-                assert "Connection failed" in failure["error"]
-    
-    @pytest.mark.asyncio
+        # The failing connects must also run concurrently
+        connect_barrier = _ConnectBarrier(2)
+        patched_connection(
+            connect_exc=ConnectionError("Connection refused"), connect_hook=connect_barrier.wait
+        )
+        
+        # Load multiple upstreams
+        result = await manager.load_multiple_upstreams(["playwright", "filesystem"])
+        
+        # Verify all failed
+        assert len(result["loaded"]) == 0
+        assert len(result["failed"]) == 2
+        
+        # Verify error messages
+        failed_names = sorted(f["name"] for f in result["failed"])
+        assert failed_names == ["filesystem", "playwright"]
+        
+        for failure in result["failed"]:
+            assert "Connection failed" in failure["error"]
+        assert connect_barrier.peak == 2
+    
     async def test_load_multiple_all_invalid_aliases(self, manager):
         """Test loading multiple upstreams with all invalid aliases."""
         # Load with all invalid names
@@ -1864,143 +1068,53 @@ class TestLoadMultipleUpstreamsAllFail:
         assert len(result["failed"]) == 3
         
         # Verify error messages
-        failed_names = {f["name"] for f in result["failed"]}
-        assert failed_names == {"invalid1", "invalid2", "invalid3"}
+        failed_names = sorted(f["name"] for f in result["failed"])
+        assert failed_names == ["invalid1", "invalid2", "invalid3"]
         
         for failure in result["failed"]:
             assert "Unknown upstream or alias" in failure["error"]
-
-
-class TestLoadMultipleUpstreamsConcurrency:
-    """Test concurrent loading behavior of load_multiple_upstreams()."""
-    
-    @pytest.fixture
-    def config(self) -> RouterConfig:
-        """Create config with multiple upstreams."""
-        return RouterConfig(
-            mcp_servers={
-                "upstream1": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@upstream1/mcp-server"]
-                ),
-                "upstream2": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@upstream2/mcp-server"]
-                ),
-                "upstream3": UpstreamConfig(
-                    transport="stdio",
-                    command="npx",
-                    args=["-y", "@upstream3/mcp-server"]
-                )
-            },
-            loading=LoadingConfig(auto_load=[])
-        )
-    
-    @pytest.fixture
-    def mock_embedding_engine(self):
-        """Create mock embedding engine."""
-        engine = MagicMock()
-        engine.generate_tool_embeddings = AsyncMock(return_value=None)
-        return engine
     
-    @pytest.fixture
-    def mock_search_engine(self):
-        """Create mock search engine."""
-        engine = MagicMock()
-        engine.add_tools = MagicMock(return_value=None)
-        return engine
-    
-    @pytest.fixture
-    def manager(self, config, mock_embedding_engine, mock_search_engine):
-        """Create ToolDiscoveryManager instance."""
-        return ToolDiscoveryManager(config, mock_embedding_engine, mock_search_engine)
-    
-    @pytest.mark.asyncio
-    async def test_load_multiple_concurrent_execution(self, manager):
+    async def test_load_multiple_concurrent_execution(self, manager, patched_connection):
         """Test that upstreams are loaded concurrently (not sequentially)."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        import time
-        
-        # Track connection times
-        connection_times = []
-        
-        # Mock UpstreamConnection with delays
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            async def delayed_connect():
-                """Simulate connection delay."""
-                connection_times.append(time.time())
-                await asyncio.sleep(0.1)  # 100ms delay
-            
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock(side_effect=delayed_connect)
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load 3 upstreams
-            start_time = time.time()
-            result = await manager.load_multiple_upstreams(["upstream1", "upstream2", "upstream3"])
-            end_time = time.time()
-            
-            # Verify all succeeded
-            assert len(result["loaded"]) == 3
-            
-            # Verify concurrent execution (should take ~100ms, not ~300ms)
-            # Allow some overhead, but should be much less than sequential
-            elapsed = end_time - start_time
-            assert elapsed < 0.25  # Should be ~0.1s, not ~0.3s
-            
-            # Verify connections started close together (concurrent)
-            if len(connection_times) >= 2:
-                time_diff = connection_times[-1] - connection_times[0]
-                assert time_diff < 0.05  # All should start within 50ms
-    
-    @pytest.mark.asyncio
-    async def test_load_multiple_idempotent_with_already_loaded(self, manager):
+        connect_barrier = _ConnectBarrier(3)
+        patched_connection(tools=[_TEST_TOOL], connect_hook=connect_barrier.wait)
+        
+        # Load 3 upstreams; each connect() only returns once all three have started
+        result = await manager.load_multiple_upstreams(["upstream1", "upstream2", "upstream3"])
+        
+        # Verify all succeeded
+        assert len(result["loaded"]) == 3
+        assert connect_barrier.peak == 3
+    
+    async def test_load_multiple_idempotent_with_already_loaded(self, manager, patched_connection):
         """Test loading multiple upstreams where some are already loaded."""
-        from mcp_router.core.models import ToolMetadata, JSONSchema
-        
-        # Mock UpstreamConnection
-        with patch('mcp_router.discovery.manager.UpstreamConnection') as MockConnection:
-            mock_connection = AsyncMock()
-            mock_connection.connect = AsyncMock()
-            mock_connection.fetch_tools = AsyncMock(return_value=[
-                ToolMetadata(
-                    name="test.tool",
-                    original_name="tool",
-                    description="Test tool",
-                    input_schema=JSONSchema(type="object", properties={}),
-                    upstream_id="test"
-                )
-            ])
-            mock_connection.disconnect = AsyncMock()
-            MockConnection.return_value = mock_connection
-            
-            # Load upstream1 first
-            await manager.load_upstream("upstream1")
-            
-            # Reset mock call counts
-            mock_connection.connect.reset_mock()
-            mock_connection.fetch_tools.reset_mock()
-            
-            # Load multiple including already-loaded upstream1
-            result = await manager.load_multiple_upstreams(["upstream1", "upstream2", "upstream3"])
-            
-            # Verify all succeeded (idempotent for upstream1)
-            assert len(result["loaded"]) == 3
-            assert set(result["loaded"]) == {"upstream1", "upstream2", "upstream3"}
-            assert len(result["failed"]) == 0
-            
-            # Verify upstream1 was not reconnected (idempotent)
-            # Only 2 new connections should be made (upstream2, upstream3)
-            assert mock_connection.connect.call_count == 2
+        connection = patched_connection(tools=[_TEST_TOOL])
+        
+        # Load upstream1 first
+        await manager.load_upstream("upstream1")
+        assert connection.connect_calls == 1
+        
+        # Load multiple including already-loaded upstream1
+        result = await manager.load_multiple_upstreams(["upstream1", "upstream2", "upstream3"])
+        
+        # Verify all succeeded (idempotent for upstream1)
+        assert len(result["loaded"]) == 3
+        assert sorted(result["loaded"]) == ["upstream1", "upstream2", "upstream3"]
+        assert len(result["failed"]) == 0
+        
+        # Verify upstream1 was not reconnected (idempotent)
+        # Only 2 new connections should be made (upstream2, upstream3)
+        assert connection.created_for == ["upstream1", "upstream2", "upstream3"]
+        assert connection.connect_calls == 3
+    
+    async def test_load_multiple_deduplicates_requests(self, manager, patched_connection):
+        """Test that an upstream requested more than once is only loaded once."""
+        connection = patched_connection(tools=[_TEST_TOOL])
+        
+        result = await manager.load_multiple_upstreams(["upstream1", "upstream2", "upstream1"])
+        
+        # Requested order is kept and upstream1 is connected only once
+        assert result["loaded"] == ["upstream1", "upstream2"]
+        assert result["failed"] == []
+        assert connection.created_for == ["upstream1", "upstream2"]
+        assert len(manager.all_tools) == 2
@@ -14,7 +14,6 @@ from mcp_router.embedding.utils import generate_tool_embedding_text
 class TestEmbeddingEngine:
     """Tests for EmbeddingEngine class"""
     
-    @pytest.mark.asyncio
     async def test_initialization(self):
         """Test that engine initializes successfully"""
         engine = EmbeddingEngine()
@@ -23,7 +22,6 @@ class TestEmbeddingEngine:
         await engine.initialize()
         assert engine.is_initialized
     
-    @pytest.mark.asyncio
     async def test_generate_embedding_success(self):
         """Test successful embedding generation"""
         engine = EmbeddingEngine()
@@ -35,7 +33,6 @@ class TestEmbeddingEngine:
         assert isinstance(embedding, np.ndarray)
         assert embedding.shape == (384,)
     
-    @pytest.mark.asyncio
     async def test_generate_embedding_not_initialized(self):
         """Test that generating embedding before initialization raises error"""
         engine = EmbeddingEngine()
@@ -43,7 +40,6 @@ class TestEmbeddingEngine:
         with pytest.raises(RuntimeError, match="not initialized"):
             engine.generate_embedding("test")
     
-    @pytest.mark.asyncio
     async def test_generate_embedding_empty_text(self):
         """Test that empty text raises ValueError"""
         engine = EmbeddingEngine()
@@ -55,7 +51,6 @@ class TestEmbeddingEngine:
         with pytest.raises(ValueError, match="empty text"):
             engine.generate_embedding("   ")
     
-    @pytest.mark.asyncio
     async def test_generate_embeddings_batch(self):
         """Test batch embedding generation"""
         engine = EmbeddingEngine()
@@ -74,7 +69,6 @@ class TestEmbeddingEngine:
             assert isinstance(embedding, np.ndarray)
             assert embedding.shape == (384,)
     
-    @pytest.mark.asyncio
     async def test_generate_embeddings_batch_empty_list(self):
         """Test batch generation with empty list"""
         engine = EmbeddingEngine()
@@ -83,7 +77,6 @@ class TestEmbeddingEngine:
         embeddings = engine.generate_embeddings_batch([])
         assert embeddings == []
     
-    @pytest.mark.asyncio
     async def test_generate_embeddings_batch_with_empty_text(self):
         """Test batch generation with empty text raises error"""
         engine = EmbeddingEngine()
@@ -94,7 +87,6 @@ class TestEmbeddingEngine:
         with pytest.raises(ValueError, match="empty text"):
             engine.generate_embeddings_batch(texts)
     
-    @pytest.mark.asyncio
     async def test_generate_tool_embeddings(self):
         """Test generating embeddings for tools"""
         engine = EmbeddingEngine()
@@ -112,7 +104,7 @@ class TestEmbeddingEngine:
                 name="browser.click",
                 original_name="click",
                 description="Click on an element",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="playwright"
             )
         ]
@@ -130,7 +122,6 @@ class TestEmbeddingEngine:
             assert isinstance(tool.embedding, np.ndarray)
             assert tool.embedding.shape == (384,)
     
-    @pytest.mark.asyncio
     async def test_generate_tool_embeddings_empty_list(self):
         """Test generating embeddings for empty tool list"""
         engine = EmbeddingEngine()
@@ -139,7 +130,6 @@ class TestEmbeddingEngine:
         # Should not raise error
         await engine.generate_tool_embeddings([])
     
-    @pytest.mark.asyncio
     async def test_embeddings_are_deterministic(self):
         """Test that same text produces same embedding"""
         engine = EmbeddingEngine()
@@ -162,7 +152,7 @@ class TestGenerateToolEmbeddingText:
             name="browser.navigate",
             original_name="navigate",
             description="Navigate to a URL",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="playwright"
         )
         
@@ -197,7 +187,7 @@ class TestGenerateToolEmbeddingText:
             name="browser.navigate",
             original_name="navigate",
             description="Navigate to a URL",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="playwright",
             category_description="Web browser automation tools"
         )
@@ -236,7 +226,7 @@ class TestGenerateToolEmbeddingText:
             name="browser.refresh",
             original_name="refresh",
             description="Refresh the page",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="playwright"
         )
         
@@ -249,7 +239,7 @@ class TestGenerateToolEmbeddingText:
             name="browser.navigate",
             original_name="navigate",
             description="Navigate to a URL",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="playwright"
         )
         
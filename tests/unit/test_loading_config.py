@@ -19,6 +19,7 @@ class TestLoadingConfigDefaults:
         assert config.connection_timeout == 30
         assert config.max_concurrent_upstreams == 10
         assert config.rate_limit == 5
+        assert config.tool_cache_path is None
     
     def test_custom_values(self):
         """Test that LoadingConfig accepts custom values."""
@@ -77,6 +78,11 @@ class TestLoadingConfigValidation:
         with pytest.raises(ValueError, match="auto_load must be a list"):
             LoadingConfig(auto_load="all")  # type: ignore
     
+    def test_tool_cache_path_not_string(self):
+        """Test that a non-string tool_cache_path raises ValueError."""
+        with pytest.raises(ValueError, match="tool_cache_path must be a string"):
+            LoadingConfig(tool_cache_path=42)  # type: ignore
+    
     def test_empty_auto_load(self):
         """Test that empty auto_load list is valid."""
         config = LoadingConfig(auto_load=[])
@@ -1,10 +1,13 @@
 """
 Unit tests for tool metadata and schema models.
 """
+import dataclasses
+
 import pytest
 import numpy as np
 
 from mcp_router.core.models import (
+    EMPTY_OBJECT_SCHEMA,
     JSONSchema,
     ToolMetadata,
     ContentItem,
@@ -141,6 +144,30 @@ class TestJSONSchema:
         assert result['type'] == 'object'
         assert result['additionalProperties'] is False
         assert result['required'] == ['url']
+    
+    def test_empty_schema_from_dict_is_shared(self) -> None:
+        """Test that content-free object schemas reuse EMPTY_OBJECT_SCHEMA."""
+        assert JSONSchema.from_dict({}) is EMPTY_OBJECT_SCHEMA
+        assert JSONSchema.from_dict({'type': 'object'}) is EMPTY_OBJECT_SCHEMA
+        assert JSONSchema.from_dict({'type': 'object', 'properties': {}}) is not EMPTY_OBJECT_SCHEMA
+        assert EMPTY_OBJECT_SCHEMA.to_dict() == {'type': 'object'}
+    
+    def test_of_type_returns_shared_instance(self) -> None:
+        """Test that type-only schemas are shared per type."""
+        assert JSONSchema.of_type('object') is EMPTY_OBJECT_SCHEMA
+        assert JSONSchema.of_type('string') is JSONSchema.of_type('string')
+        assert JSONSchema.from_dict({'type': 'string'}) is JSONSchema.of_type('string')
+        assert JSONSchema.of_type('string').to_dict() == {'type': 'string'}
+    
+    def test_schema_is_immutable(self) -> None:
+        """Test that schemas cannot be modified, so sharing instances is safe."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            EMPTY_OBJECT_SCHEMA.type = 'string'
+    
+    def test_schema_has_slots(self) -> None:
+        """Test that schemas are slotted (no per-instance __dict__)."""
+        assert hasattr(JSONSchema, '__slots__')
+        assert not hasattr(JSONSchema(type='string'), '__dict__')
 
 
 class TestToolMetadata:
@@ -252,6 +279,23 @@ class TestToolMetadata:
         
         param_names = tool.get_parameter_names()
         assert param_names == []
+    
+    def test_tool_metadata_has_slots(self) -> None:
+        """Test that tool metadata is slotted (no per-instance __dict__)."""
+        tool = ToolMetadata(
+            name='browser.navigate',
+            original_name='navigate',
+            description='Navigate to a URL',
+            input_schema=EMPTY_OBJECT_SCHEMA,
+            upstream_id='playwright'
+        )
+        
+        assert hasattr(ToolMetadata, '__slots__')
+        assert not hasattr(tool, '__dict__')
+        
+        # Not frozen: the embedding engine assigns embeddings after discovery
+        tool.embedding = np.zeros(3, dtype=np.float32)
+        assert tool.embedding is not None
 
 
 class TestNamespaceGeneration:
@@ -29,7 +29,6 @@ class TestToolCallProxy:
         assert proxy.upstreams == {'test-upstream': upstream}
         assert proxy.upstream_configs == {'test-upstream': config}
     
-    @pytest.mark.asyncio
     async def test_successful_tool_call(self):
         """Test successful tool call forwarding"""
         # Create mock upstream
@@ -67,7 +66,6 @@ class TestToolCallProxy:
         assert result.content[0].text == 'Hello, world!'
         assert result.is_error is False
     
-    @pytest.mark.asyncio
     async def test_tool_call_with_semantic_prefix(self):
         """Test tool call with semantic prefix"""
         # Create config with semantic prefix
@@ -96,7 +94,6 @@ class TestToolCallProxy:
         upstream.call_tool.assert_called_once_with('navigate', {'url': 'https://example.com'})
         assert isinstance(result, ToolCallResult)
     
-    @pytest.mark.asyncio
     async def test_invalid_namespace_no_dot(self):
         """Test error handling for namespace without dot"""
         proxy = ToolCallProxy(upstreams={}, upstream_configs={})
@@ -104,7 +101,6 @@ class TestToolCallProxy:
         with pytest.raises(ValueError, match="Invalid tool namespace"):
             await proxy.call_tool('invalid_tool_name', {})
     
-    @pytest.mark.asyncio
     async def test_invalid_namespace_empty_prefix(self):
         """Test error handling for namespace with empty prefix"""
         proxy = ToolCallProxy(upstreams={}, upstream_configs={})
@@ -112,7 +108,6 @@ class TestToolCallProxy:
         with pytest.raises(ValueError, match="Invalid tool namespace"):
             await proxy.call_tool('.tool_name', {})
     
-    @pytest.mark.asyncio
     async def test_invalid_namespace_empty_tool_name(self):
         """Test error handling for namespace with empty tool name"""
         proxy = ToolCallProxy(upstreams={}, upstream_configs={})
@@ -120,7 +115,6 @@ class TestToolCallProxy:
         with pytest.raises(ValueError, match="Invalid tool namespace"):
             await proxy.call_tool('prefix.', {})
     
-    @pytest.mark.asyncio
     async def test_unknown_upstream_prefix(self):
         """Test error handling for unknown upstream prefix"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -134,7 +128,6 @@ class TestToolCallProxy:
         with pytest.raises(ValueError, match="No upstream found"):
             await proxy.call_tool('unknown.tool', {})
     
-    @pytest.mark.asyncio
     async def test_upstream_not_connected(self):
         """Test error handling when upstream is not connected"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -149,7 +142,6 @@ class TestToolCallProxy:
         with pytest.raises(RuntimeError, match="not connected"):
             await proxy.call_tool('test-upstream.tool', {})
     
-    @pytest.mark.asyncio
     async def test_upstream_missing_from_connections(self):
         """Test error handling when upstream is in config but not connected"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -163,7 +155,6 @@ class TestToolCallProxy:
         with pytest.raises(RuntimeError, match="not connected"):
             await proxy.call_tool('test-upstream.tool', {})
     
-    @pytest.mark.asyncio
     async def test_upstream_error_forwarding(self):
         """Test that upstream errors are forwarded to client"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -183,7 +174,6 @@ class TestToolCallProxy:
         with pytest.raises(RuntimeError, match="Upstream error"):
             await proxy.call_tool('test-upstream.failing_tool', {})
     
-    @pytest.mark.asyncio
     async def test_timeout_handling(self):
         """Test timeout handling for slow tool calls"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -206,7 +196,6 @@ class TestToolCallProxy:
         with pytest.raises(asyncio.TimeoutError, match="timed out"):
             await proxy.call_tool('test-upstream.slow_tool', {}, timeout=0.1)
     
-    @pytest.mark.asyncio
     async def test_connection_reuse(self):
         """Test that connections are reused for multiple calls"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -233,7 +222,6 @@ class TestToolCallProxy:
         # Verify the same upstream instance is still in proxy
         assert proxy.upstreams['test-upstream'] is upstream
     
-    @pytest.mark.asyncio
     async def test_multiple_content_items(self):
         """Test handling of multiple content items in response"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -267,7 +255,6 @@ class TestToolCallProxy:
         assert result.content[2].uri == 'file:///test.txt'
         assert result.content[2].mime_type == 'text/plain'
     
-    @pytest.mark.asyncio
     async def test_error_result_from_upstream(self):
         """Test handling of error results from upstream"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -292,7 +279,6 @@ class TestToolCallProxy:
         assert len(result.content) == 1
         assert result.content[0].text == 'Error: Invalid parameter'
     
-    @pytest.mark.asyncio
     async def test_empty_arguments(self):
         """Test tool call with empty arguments"""
         config = UpstreamConfig(transport='stdio', command='test')
@@ -314,7 +300,6 @@ class TestToolCallProxy:
         upstream.call_tool.assert_called_once_with('no_args_tool', {})
         assert isinstance(result, ToolCallResult)
     
-    @pytest.mark.asyncio
     async def test_complex_arguments(self):
         """Test tool call with complex nested arguments"""
         config = UpstreamConfig(transport='stdio', command='test')
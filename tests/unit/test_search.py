@@ -125,7 +125,6 @@ class TestCosineSimilarity:
 class TestSemanticSearchEngine:
     """Tests for SemanticSearchEngine class"""
     
-    @pytest.mark.asyncio
     async def test_initialization(self):
         """Test search engine initialization"""
         engine = EmbeddingEngine()
@@ -134,7 +133,6 @@ class TestSemanticSearchEngine:
         search_engine = SemanticSearchEngine(engine)
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_set_tools(self):
         """Test setting tools in search engine"""
         engine = EmbeddingEngine()
@@ -146,14 +144,14 @@ class TestSemanticSearchEngine:
                 name="test.tool1",
                 original_name="tool1",
                 description="Test tool 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             ),
             ToolMetadata(
                 name="test.tool2",
                 original_name="tool2",
                 description="Test tool 2",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -165,7 +163,6 @@ class TestSemanticSearchEngine:
         
         assert search_engine.get_tool_count() == 2
     
-    @pytest.mark.asyncio
     async def test_set_tools_without_embeddings_raises_error(self):
         """Test that setting tools without embeddings raises error"""
         engine = EmbeddingEngine()
@@ -176,7 +173,7 @@ class TestSemanticSearchEngine:
             name="test.tool",
             original_name="tool",
             description="Test",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -185,7 +182,6 @@ class TestSemanticSearchEngine:
         with pytest.raises(ValueError, match="missing embedding"):
             search_engine.set_tools([tool])
     
-    @pytest.mark.asyncio
     async def test_search_basic(self):
         """Test basic search functionality"""
         engine = EmbeddingEngine()
@@ -197,21 +193,21 @@ class TestSemanticSearchEngine:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate to a URL in the browser",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             ),
             ToolMetadata(
                 name="browser.click",
                 original_name="click",
                 description="Click on an element",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             ),
             ToolMetadata(
                 name="file.read",
                 original_name="read",
                 description="Read a file from disk",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -229,7 +225,6 @@ class TestSemanticSearchEngine:
         # First result should be navigate (most relevant)
         assert results[0].tool.name == "browser.navigate"
     
-    @pytest.mark.asyncio
     async def test_search_with_context(self):
         """Test search with context"""
         engine = EmbeddingEngine()
@@ -239,7 +234,7 @@ class TestSemanticSearchEngine:
             name="test.tool",
             original_name="tool",
             description="Test tool",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -257,7 +252,6 @@ class TestSemanticSearchEngine:
         assert len(results) == 1
         assert results[0].tool.name == "test.tool"
     
-    @pytest.mark.asyncio
     async def test_search_empty_query_raises_error(self):
         """Test that empty query raises error"""
         engine = EmbeddingEngine()
@@ -267,7 +261,7 @@ class TestSemanticSearchEngine:
             name="test.tool",
             original_name="tool",
             description="Test",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -279,7 +273,6 @@ class TestSemanticSearchEngine:
         with pytest.raises(ValueError, match="Query cannot be empty"):
             await search_engine.search_tools("")
     
-    @pytest.mark.asyncio
     async def test_search_without_tools_raises_error(self):
         """Test that searching without tools raises error"""
         engine = EmbeddingEngine()
@@ -290,7 +283,6 @@ class TestSemanticSearchEngine:
         with pytest.raises(RuntimeError, match="No tools loaded"):
             await search_engine.search_tools("test query")
     
-    @pytest.mark.asyncio
     async def test_search_top_k(self):
         """Test that search respects top_k parameter"""
         engine = EmbeddingEngine()
@@ -302,7 +294,7 @@ class TestSemanticSearchEngine:
                 name=f"test.tool{i}",
                 original_name=f"tool{i}",
                 description=f"Test tool {i}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
             for i in range(20)
@@ -318,7 +310,6 @@ class TestSemanticSearchEngine:
         
         assert len(results) == 5
     
-    @pytest.mark.asyncio
     async def test_search_results_sorted(self):
         """Test that search results are sorted by similarity"""
         engine = EmbeddingEngine()
@@ -329,7 +320,7 @@ class TestSemanticSearchEngine:
                 name=f"test.tool{i}",
                 original_name=f"tool{i}",
                 description=f"Test tool {i}",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
             for i in range(10)
@@ -350,7 +341,6 @@ class TestSemanticSearchEngine:
 class TestAddTools:
     """Tests for add_tools() method"""
     
-    @pytest.mark.asyncio
     async def test_add_tools_to_empty_catalog(self):
         """Test adding tools to empty catalog"""
         engine = EmbeddingEngine()
@@ -361,14 +351,14 @@ class TestAddTools:
                 name="test.tool1",
                 original_name="tool1",
                 description="Test tool 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             ),
             ToolMetadata(
                 name="test.tool2",
                 original_name="tool2",
                 description="Test tool 2",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -381,7 +371,6 @@ class TestAddTools:
         search_engine.add_tools(tools)
         assert search_engine.get_tool_count() == 2
     
-    @pytest.mark.asyncio
     async def test_add_tools_to_existing_catalog(self):
         """Test adding tools to existing catalog"""
         engine = EmbeddingEngine()
@@ -393,7 +382,7 @@ class TestAddTools:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate to URL",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             )
         ]
@@ -404,14 +393,14 @@ class TestAddTools:
                 name="file.read",
                 original_name="read",
                 description="Read file",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             ),
             ToolMetadata(
                 name="file.write",
                 original_name="write",
                 description="Write file",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -425,7 +414,6 @@ class TestAddTools:
         search_engine.add_tools(new_tools)
         assert search_engine.get_tool_count() == 3
     
-    @pytest.mark.asyncio
     async def test_add_tools_without_embeddings_raises_error(self):
         """Test that adding tools without embeddings raises error"""
         engine = EmbeddingEngine()
@@ -436,7 +424,7 @@ class TestAddTools:
             name="test.tool",
             original_name="tool",
             description="Test",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -445,7 +433,6 @@ class TestAddTools:
         with pytest.raises(ValueError, match="missing embedding"):
             search_engine.add_tools([tool])
     
-    @pytest.mark.asyncio
     async def test_add_tools_with_duplicate_name_raises_error(self):
         """Test that adding duplicate tool names raises error"""
         engine = EmbeddingEngine()
@@ -456,7 +443,7 @@ class TestAddTools:
             name="test.tool1",
             original_name="tool1",
             description="Test tool 1",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -465,7 +452,7 @@ class TestAddTools:
             name="test.tool1",
             original_name="tool1",
             description="Different description",
-            input_schema=JSONSchema(type='object'),
+            input_schema=JSONSchema.of_type('object'),
             upstream_id="test"
         )
         
@@ -477,7 +464,6 @@ class TestAddTools:
         with pytest.raises(ValueError, match="already exists"):
             search_engine.add_tools([duplicate_tool])
     
-    @pytest.mark.asyncio
     async def test_add_empty_list_does_nothing(self):
         """Test that adding empty list does nothing"""
         engine = EmbeddingEngine()
@@ -489,7 +475,6 @@ class TestAddTools:
         search_engine.add_tools([])
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_add_tools_preserves_search_functionality(self):
         """Test that added tools are searchable"""
         engine = EmbeddingEngine()
@@ -501,7 +486,7 @@ class TestAddTools:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate to a URL in the browser",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             )
         ]
@@ -512,7 +497,7 @@ class TestAddTools:
                 name="file.read",
                 original_name="read",
                 description="Read a file from disk",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -530,7 +515,6 @@ class TestAddTools:
         # File tool should be most relevant
         assert results[0].tool.name == "file.read"
     
-    @pytest.mark.asyncio
     async def test_add_tools_multiple_times(self):
         """Test adding tools in multiple batches"""
         engine = EmbeddingEngine()
@@ -541,7 +525,7 @@ class TestAddTools:
                 name="test.tool1",
                 original_name="tool1",
                 description="Test 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -551,7 +535,7 @@ class TestAddTools:
                 name="test.tool2",
                 original_name="tool2",
                 description="Test 2",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -561,7 +545,7 @@ class TestAddTools:
                 name="test.tool3",
                 original_name="tool3",
                 description="Test 3",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -583,7 +567,6 @@ class TestAddTools:
 class TestRemoveTools:
     """Tests for remove_tools() method"""
     
-    @pytest.mark.asyncio
     async def test_remove_tools_by_namespace(self):
         """Test removing tools by namespace"""
         engine = EmbeddingEngine()
@@ -594,21 +577,21 @@ class TestRemoveTools:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             ),
             ToolMetadata(
                 name="browser.click",
                 original_name="click",
                 description="Click",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             ),
             ToolMetadata(
                 name="file.read",
                 original_name="read",
                 description="Read",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -623,7 +606,6 @@ class TestRemoveTools:
         search_engine.remove_tools("browser")
         assert search_engine.get_tool_count() == 1
     
-    @pytest.mark.asyncio
     async def test_remove_tools_nonexistent_namespace(self):
         """Test removing tools with nonexistent namespace does nothing"""
         engine = EmbeddingEngine()
@@ -634,7 +616,7 @@ class TestRemoveTools:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             )
         ]
@@ -648,7 +630,6 @@ class TestRemoveTools:
         search_engine.remove_tools("nonexistent")
         assert search_engine.get_tool_count() == 1
     
-    @pytest.mark.asyncio
     async def test_remove_tools_empty_namespace_raises_error(self):
         """Test that empty namespace raises error"""
         engine = EmbeddingEngine()
@@ -659,7 +640,6 @@ class TestRemoveTools:
         with pytest.raises(ValueError, match="Namespace cannot be empty"):
             search_engine.remove_tools("")
     
-    @pytest.mark.asyncio
     async def test_remove_tools_from_empty_catalog(self):
         """Test removing tools from empty catalog does nothing"""
         engine = EmbeddingEngine()
@@ -671,7 +651,6 @@ class TestRemoveTools:
         search_engine.remove_tools("test")
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_remove_tools_preserves_other_namespaces(self):
         """Test that removing one namespace preserves others"""
         engine = EmbeddingEngine()
@@ -682,21 +661,21 @@ class TestRemoveTools:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate to URL",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             ),
             ToolMetadata(
                 name="file.read",
                 original_name="read",
                 description="Read file",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             ),
             ToolMetadata(
                 name="file.write",
                 original_name="write",
                 description="Write file",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -717,7 +696,6 @@ class TestRemoveTools:
         assert len(results) == 2
         assert all("file." in r.tool.name for r in results)
     
-    @pytest.mark.asyncio
     async def test_remove_all_tools(self):
         """Test removing all tools leaves empty catalog"""
         engine = EmbeddingEngine()
@@ -728,14 +706,14 @@ class TestRemoveTools:
                 name="test.tool1",
                 original_name="tool1",
                 description="Test 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             ),
             ToolMetadata(
                 name="test.tool2",
                 original_name="tool2",
                 description="Test 2",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -748,7 +726,6 @@ class TestRemoveTools:
         search_engine.remove_tools("test")
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_remove_tools_case_sensitive(self):
         """Test that namespace removal is case-sensitive"""
         engine = EmbeddingEngine()
@@ -759,7 +736,7 @@ class TestRemoveTools:
                 name="Browser.navigate",
                 original_name="navigate",
                 description="Navigate",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="Browser"
             )
         ]
@@ -781,7 +758,6 @@ class TestRemoveTools:
 class TestAddAndRemoveIntegration:
     """Integration tests for add_tools() and remove_tools() together"""
     
-    @pytest.mark.asyncio
     async def test_add_then_remove(self):
         """Test adding tools then removing them"""
         engine = EmbeddingEngine()
@@ -792,7 +768,7 @@ class TestAddAndRemoveIntegration:
                 name="test.tool1",
                 original_name="tool1",
                 description="Test 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -809,7 +785,6 @@ class TestAddAndRemoveIntegration:
         search_engine.remove_tools("test")
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_remove_then_add_same_namespace(self):
         """Test removing then re-adding tools with same namespace"""
         engine = EmbeddingEngine()
@@ -820,7 +795,7 @@ class TestAddAndRemoveIntegration:
                 name="test.tool1",
                 original_name="tool1",
                 description="Version 1",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -830,7 +805,7 @@ class TestAddAndRemoveIntegration:
                 name="test.tool2",
                 original_name="tool2",
                 description="Version 2",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="test"
             )
         ]
@@ -851,7 +826,6 @@ class TestAddAndRemoveIntegration:
         search_engine.add_tools(tools_v2)
         assert search_engine.get_tool_count() == 1
     
-    @pytest.mark.asyncio
     async def test_dynamic_catalog_management(self):
         """Test dynamic loading/unloading scenario"""
         engine = EmbeddingEngine()
@@ -863,7 +837,7 @@ class TestAddAndRemoveIntegration:
                 name="browser.navigate",
                 original_name="navigate",
                 description="Navigate",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="browser"
             )
         ]
@@ -873,7 +847,7 @@ class TestAddAndRemoveIntegration:
                 name="file.read",
                 original_name="read",
                 description="Read",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="file"
             )
         ]
@@ -883,7 +857,7 @@ class TestAddAndRemoveIntegration:
                 name="db.query",
                 original_name="query",
                 description="Query",
-                input_schema=JSONSchema(type='object'),
+                input_schema=JSONSchema.of_type('object'),
                 upstream_id="db"
             )
         ]
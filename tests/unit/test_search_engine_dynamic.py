@@ -233,7 +233,6 @@ class TestRemoveTools:
 class TestIntegrationScenarios:
     """Integration tests for add_tools and remove_tools."""
     
-    @pytest.mark.asyncio
     async def test_search_works_after_adding_tools(
         self,
         search_engine: SemanticSearchEngine
@@ -257,7 +256,6 @@ class TestIntegrationScenarios:
         assert len(results) > 0
         assert results[0].tool.name in ['playwright.navigate', 'jira.create_issue']
     
-    @pytest.mark.asyncio
     async def test_search_works_after_removing_tools(
         self,
         search_engine: SemanticSearchEngine
@@ -351,7 +349,6 @@ class TestIntegrationScenarios:
         search_engine.remove_tools('github')
         assert search_engine.get_tool_count() == 0
     
-    @pytest.mark.asyncio
     async def test_search_returns_only_loaded_tools(
         self,
         search_engine: SemanticSearchEngine
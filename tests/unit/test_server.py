@@ -147,7 +147,6 @@ class TestListTools:
 class TestCallTool:
     """Tests for call_tool handler logic - testing via _handle_search_tools and proxy."""
     
-    @pytest.mark.asyncio
     async def test_search_tools_routing_logic(self, server, mock_proxy):
         """Test that search_tools logic routes to _handle_search_tools."""
         # Mock _handle_search_tools
@@ -164,7 +163,6 @@ class TestCallTool:
             # Verify proxy was NOT called
             mock_proxy.call_tool.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_proxy_forwarding_logic(self, server, mock_proxy):
         """Test that non-search_tools calls would be forwarded to proxy."""
         # Mock proxy response
@@ -189,7 +187,6 @@ class TestCallTool:
         assert len(result.content) == 1
         assert result.content[0].text == "Proxy result"
     
-    @pytest.mark.asyncio
     async def test_proxy_error_handling_logic(self, server, mock_proxy):
         """Test that proxy errors are handled correctly."""
         # Mock proxy error response
@@ -213,7 +210,6 @@ class TestCallTool:
 class TestHandleSearchTools:
     """Tests for _handle_search_tools method."""
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_valid_query(self, server, mock_search_engine):
         """Test _handle_search_tools with valid query."""
         # Mock search results
@@ -259,7 +255,6 @@ class TestHandleSearchTools:
         assert "0.9500" in result[0].text
         assert "0.8500" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_query_and_context(self, server, mock_search_engine):
         """Test _handle_search_tools with query and context."""
         mock_search_engine.search_tools.return_value = []
@@ -277,35 +272,30 @@ class TestHandleSearchTools:
             top_k=10
         )
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_empty_query_raises_error(self, server):
         """Test that empty query raises ValidationError."""
         from mcp_router.core.errors import ValidationError
         with pytest.raises(ValidationError, match="Query cannot be empty or whitespace"):
             await server._handle_search_tools({"query": ""})
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_missing_query_raises_error(self, server):
         """Test that missing query raises ValidationError."""
         from mcp_router.core.errors import ValidationError
         with pytest.raises(ValidationError, match="Query parameter is required"):
             await server._handle_search_tools({})
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_whitespace_query_raises_error(self, server):
         """Test that whitespace-only query raises ValidationError."""
         from mcp_router.core.errors import ValidationError
         with pytest.raises(ValidationError, match="Query cannot be empty or whitespace"):
             await server._handle_search_tools({"query": "   "})
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_with_non_string_query_raises_error(self, server):
         """Test that non-string query raises ValidationError."""
         from mcp_router.core.errors import ValidationError
         with pytest.raises(ValidationError, match="Query must be a string"):
             await server._handle_search_tools({"query": 123})
     
-    @pytest.mark.asyncio
     async def test_handle_search_tools_formats_results_correctly(self, server, mock_search_engine):
         """Test that search results are formatted correctly."""
         mock_search_engine.search_tools.return_value = [
@@ -21,7 +21,6 @@ class TestLoadUpstreamHandler:
         server.proxy = MagicMock()
         return server
     
-    @pytest.mark.asyncio
     async def test_load_by_upstream_name_success(self, mock_server):
         """Test loading upstream by canonical name - success case."""
         # Setup
@@ -45,7 +44,6 @@ class TestLoadUpstreamHandler:
         assert "15 tools" in result[0].text
         mock_server.discovery_manager.load_upstream.assert_called_once_with("playwright")
     
-    @pytest.mark.asyncio
     async def test_load_by_alias_success(self, mock_server):
         """Test loading upstream by alias - success case."""
         # Setup
@@ -69,7 +67,6 @@ class TestLoadUpstreamHandler:
         assert "15 tools" in result[0].text
         mock_server.discovery_manager.load_upstream.assert_called_once_with("browser")
     
-    @pytest.mark.asyncio
     async def test_load_missing_arguments(self, mock_server):
         """Test loading with neither upstream nor alias provided."""
         # Execute & Verify
@@ -82,7 +79,6 @@ class TestLoadUpstreamHandler:
         
         assert "Either 'upstream' or 'alias' must be provided" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_load_invalid_upstream(self, mock_server):
         """Test loading with invalid upstream name."""
         # Setup
@@ -104,7 +100,6 @@ class TestLoadUpstreamHandler:
         assert "Failed to load upstream 'invalid'" in result[0].text
         assert "not found in configuration" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_load_connection_failure(self, mock_server):
         """Test loading with connection failure."""
         # Setup
@@ -126,7 +121,6 @@ class TestLoadUpstreamHandler:
         assert "Failed to load upstream 'playwright'" in result[0].text
         assert "Connection timeout" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_load_already_loaded(self, mock_server):
         """Test loading upstream that is already loaded (idempotent)."""
         # Setup
@@ -149,7 +143,6 @@ class TestLoadUpstreamHandler:
         assert isinstance(result[0], TextContent)
         assert "Successfully loaded upstream 'playwright'" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_load_exception_handling(self, mock_server):
         """Test exception handling in load_upstream."""
         # Setup
@@ -168,7 +161,6 @@ class TestLoadUpstreamHandler:
         assert "Failed to load upstream" in str(exc_info.value)
         assert "Unexpected error" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_load_prefers_alias_over_upstream(self, mock_server):
         """Test that alias is preferred when both upstream and alias are provided."""
         # Setup
@@ -192,7 +184,6 @@ class TestLoadUpstreamHandler:
 class TestLoadUpstreamIntegration:
     """Integration tests for load_upstream tool in server."""
     
-    @pytest.mark.asyncio
     async def test_load_upstream_tool_registered(self):
         """Test that load_upstream tool is registered in list_tools()."""
         # Setup
@@ -251,7 +242,6 @@ class TestLoadUpstreamIntegration:
             assert "alias" in load_upstream_tool.inputSchema["properties"]
             assert load_upstream_tool.inputSchema["required"] == []
     
-    @pytest.mark.asyncio
     async def test_load_upstream_tool_call_routing(self):
         """Test that load_upstream tool calls are routed correctly."""
         # Setup